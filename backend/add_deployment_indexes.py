@@ -0,0 +1,34 @@
+"""
+Migration script: Add lookup indexes for policies and policy_deployments.
+
+Creates:
+  - ix_policies_name              (policies.name)
+  - ix_deployment_policy_status   (policy_deployments.policy_id, status)
+  - ix_deployment_cluster_status  (policy_deployments.cluster_id, status)
+
+It is safe to re-run — existing indexes are skipped.
+"""
+
+import sys
+import os
+
+# Ensure the backend directory is on the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.db import engine
+from app.models import Policy, PolicyDeployment
+
+
+def migrate():
+    """Create the policy / deployment lookup indexes if they don't exist."""
+    indexes = list(Policy.__table__.indexes) + list(PolicyDeployment.__table__.indexes)
+    for index in sorted(indexes, key=lambda i: i.name):
+        if index.name in ("ix_policies_id", "ix_policy_deployments_id"):
+            continue
+        print(f"Creating index {index.name} (if not exists)…")
+        index.create(bind=engine, checkfirst=True)
+    print("Done — indexes are ready.")
+
+
+if __name__ == "__main__":
+    migrate()
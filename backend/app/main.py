@@ -16,6 +16,7 @@ import yaml
 from app.db import init_db, get_db
 from app.routers import clusters, policies, reports, auth, helm
 from app.services.auth import create_default_admin
+from app.services.validation_service import get_validation_service
 
 # Configure logging
 logging.basicConfig(
@@ -62,9 +63,29 @@ async def startup_event():
     db = SessionLocal()
     try:
         create_default_admin(db)
+        
+        # Compile the catalog's parameter schemas so the first validation
+        # of each policy does not pay for it
+        from app.models import Policy
+        try:
+            schemas = [
+                params for (params,) in db.query(Policy.parameters).filter(
+                    Policy.is_active == True, Policy.parameters.isnot(None)
+                )
+            ]
+            get_validation_service().warmup(schemas)
+        except Exception as e:
+            logger.warning(f"Failed to pre-compile parameter schemas: {e}")
     finally:
         db.close()
-    
+
+    # Generate the OpenAPI document (and every model's JSON schema) now;
+    # FastAPI caches it, so /docs and /openapi.json never pay for it
+    try:
+        app.openapi()
+    except Exception as e:
+        logger.warning(f"Failed to pre-build OpenAPI schema: {e}")
+
     logger.info(f"API v{API_VERSION} ready")
 
 
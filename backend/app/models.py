@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db import Base
@@ -67,7 +67,7 @@ class Policy(Base):
     __tablename__ = "policies"
     
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), nullable=False)
+    name = Column(String(255), nullable=False, index=True)
     title = Column(String(255), nullable=True)  # Display name for UI
     category = Column(String(100), nullable=True)  # e.g., "security", "best-practices"
     description = Column(Text, nullable=True)
@@ -85,6 +85,11 @@ class Policy(Base):
 class PolicyDeployment(Base):
     """Track policy deployments to clusters"""
     __tablename__ = "policy_deployments"
+    __table_args__ = (
+        # Hot lookups: active deployments per policy / per cluster
+        Index("ix_deployment_policy_status", "policy_id", "status"),
+        Index("ix_deployment_cluster_status", "cluster_id", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     cluster_id = Column(Integer, ForeignKey("clusters.id"), nullable=False)
@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import asyncio
+import functools
 import subprocess
 import yaml
 import re
@@ -50,14 +51,17 @@ from app.services.k8s_connector import (
     get_k8s_session,
     close_k8s_session,
     cleanup_expired_k8s_sessions,
-    list_active_k8s_sessions
+    list_active_k8s_sessions,
+    clear_token_api_clients,
+    k8s_executor,
 )
 from app.services.ssh_connector import (
     create_ssh_session,
     get_ssh_session,
     close_ssh_session,
     cleanup_expired_sessions,
-    list_active_sessions
+    list_active_sessions,
+    ssh_executor
 )
 from app.services.helm_utils import get_stable_kyverno_values
 
@@ -69,15 +73,18 @@ router = APIRouter(
 
 # Timeout for K8s API operations (seconds). Should be > k8s_connector read timeout (15s).
 _K8S_TIMEOUT = 20.0
+# Connecting makes two sequential reads (cluster info, then namespaces)
+_K8S_CONNECT_TIMEOUT = 35.0
 
 
 async def _run_k8s_in_thread(func, timeout: float = _K8S_TIMEOUT):
     """
-    Run a synchronous Kubernetes operation in a thread-pool worker so the
+    Run a synchronous Kubernetes operation on the shared K8s executor so the
     async event loop is never blocked.  Raises HTTP 504 on timeout.
     """
+    loop = asyncio.get_running_loop()
     try:
-        return await asyncio.wait_for(asyncio.to_thread(func), timeout=timeout)
+        return await asyncio.wait_for(loop.run_in_executor(k8s_executor, func), timeout=timeout)
     except asyncio.TimeoutError:
         raise HTTPException(
             status_code=504,
@@ -88,9 +95,40 @@ async def _run_k8s_in_thread(func, timeout: float = _K8S_TIMEOUT):
         )
 
 
+async def _run_ssh_in_thread(func, *args, **kwargs):
+    """
+    Run a blocking SSHConnector call on the SSH executor so a slow remote
+    command never stalls the event loop. Commands carry their own timeouts.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(ssh_executor, functools.partial(func, *args, **kwargs))
+
+
+async def _connect_and_describe(kubeconfig_content: str, context: Optional[str] = None):
+    """
+    Load a kubeconfig and return (cluster_info, namespaces), running the
+    blocking calls off the event loop.
+    
+    The cluster is described through a private connector, since concurrent
+    jobs can re-point the shared one at another cluster mid-call. The shared
+    connector is then pointed at this cluster, for /disconnect.
+    """
+    def _sync():
+        connector = K8sConnector()
+        connector.load_cluster_from_content(kubeconfig_content=kubeconfig_content, context=context)
+        described = connector.get_cluster_info(), connector.list_namespaces()
+        get_k8s_connector().load_cluster_from_content(
+            kubeconfig_content=kubeconfig_content, context=context
+        )
+        return described
+    
+    return await _run_k8s_in_thread(_sync, timeout=_K8S_CONNECT_TIMEOUT)
+
+
 # ============ Helper Functions ============
 
 from app.services.cluster_utils import resolve_cluster_kubeconfig as _resolve_cluster_kubeconfig
+from app.services.cluster_utils import invalidate_cluster_cache
 
 
 def is_internal_ip(url: str) -> bool:
@@ -201,8 +239,6 @@ async def connect_cluster(request: ClusterConnectRequest):
         token: ...
     ```
     """
-    connector = get_k8s_connector()
-    
     kubeconfig_to_use = request.kubeconfig_content
 
     # If skip_tls_verify is set, patch the kubeconfig to disable SSL verification
@@ -219,18 +255,12 @@ async def connect_cluster(request: ClusterConnectRequest):
             pass  # Fall through and let the normal validation catch it
 
     try:
-        # Load cluster configuration from content
-        connector.load_cluster_from_content(
-            kubeconfig_content=kubeconfig_to_use,
-            context=request.context
+        # Load the kubeconfig, then fetch cluster info and list namespaces
+        # to verify connectivity
+        cluster_info, namespaces = await _connect_and_describe(
+            kubeconfig_to_use, context=request.context
         )
         
-        # Get cluster info
-        cluster_info = connector.get_cluster_info()
-        
-        # List namespaces to verify connectivity
-        namespaces = connector.list_namespaces()
-        
         return ClusterConnectResponse(
             success=True,
             message=f"Successfully connected to cluster. Found {len(namespaces)} namespaces.",
@@ -238,6 +268,8 @@ async def connect_cluster(request: ClusterConnectRequest):
             namespaces=namespaces
         )
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -259,6 +291,7 @@ async def disconnect_cluster():
     Use session-specific disconnect endpoints instead.
     """
     connector = get_k8s_connector()
+    connector.invalidate_cache()
     connector.disconnect()
     return {
         "message": "Disconnected from cluster",
@@ -310,7 +343,7 @@ async def list_clusters(
     List all saved cluster configurations.
     """
     clusters = db.query(Cluster).offset(skip).limit(limit).all()
-    return clusters
+    return [ClusterResponse.from_orm_fast(c) for c in clusters]
 
 
 @router.get("/{cluster_id}/health")
@@ -340,7 +373,7 @@ async def check_cluster_health(cluster_id: int, db: Session = Depends(get_db)):
         session_id, k8s = create_k8s_session()
         try:
             k8s.load_cluster_from_content(kubeconfig_content=kubeconfig_content)
-            k8s.list_namespaces()
+            k8s.list_namespaces(use_cache=False)
         finally:
             close_k8s_session(session_id)
 
@@ -389,7 +422,7 @@ async def list_namespaces(cluster_id: int, db: Session = Depends(get_db)):
 
     try:
         namespaces = await _run_k8s_in_thread(_sync)
-        return NamespaceListResponse(namespaces=namespaces, count=len(namespaces))
+        return NamespaceListResponse.model_construct(namespaces=namespaces, count=len(namespaces))
     except HTTPException:
         raise
     except Exception as e:
@@ -774,6 +807,8 @@ async def update_cluster(
     
     db.commit()
     db.refresh(cluster)
+    clear_token_api_clients()
+    invalidate_cluster_cache(cluster_id)
     return cluster
 
 
@@ -798,6 +833,8 @@ async def delete_cluster(cluster_id: int, db: Session = Depends(get_db)):
     
     db.delete(cluster)
     db.commit()
+    clear_token_api_clients()
+    invalidate_cluster_cache(cluster_id)
     
     return {"message": f"Cluster '{cluster.name}' deleted"}
 
@@ -825,7 +862,8 @@ async def ssh_connect(request: SSHConnectRequest, db: Session = Depends(get_db))
     session_id, ssh = create_ssh_session()
     
     try:
-        ssh.connect(
+        await _run_ssh_in_thread(
+            ssh.connect,
             host=request.host,
             username=request.username,
             pem_key_content=request.pem_key_content,
@@ -901,7 +939,8 @@ async def ssh_execute_command(request: SSHCommandRequest):
         )
     
     try:
-        stdout, stderr, exit_code = ssh.execute_command(
+        stdout, stderr, exit_code = await _run_ssh_in_thread(
+            ssh.execute_command,
             command=request.command,
             timeout=request.timeout
         )
@@ -946,9 +985,9 @@ async def ssh_get_kubeconfig(request: SSHKubeconfigRequest):
     
     try:
         if request.portable:
-            kubeconfig_content = ssh.get_portable_kubeconfig(context=request.context)
+            kubeconfig_content = await _run_ssh_in_thread(ssh.get_portable_kubeconfig, context=request.context)
         else:
-            kubeconfig_content = ssh.get_kubeconfig_content(kubeconfig_path=request.kubeconfig_path)
+            kubeconfig_content = await _run_ssh_in_thread(ssh.get_kubeconfig_content, kubeconfig_path=request.kubeconfig_path)
         
         return SSHKubeconfigResponse(
             success=True,
@@ -985,7 +1024,7 @@ async def ssh_check_minikube(session_id: str):
         )
     
     try:
-        status = ssh.check_minikube_status()
+        status = await _run_ssh_in_thread(ssh.check_minikube_status)
         return MinikubeStatusResponse(**status)
         
     except Exception as e:
@@ -1021,7 +1060,8 @@ async def ssh_install_kyverno(
         )
     
     try:
-        stdout, stderr, exit_code = ssh.install_kyverno_remote(
+        stdout, stderr, exit_code = await _run_ssh_in_thread(
+            ssh.install_kyverno_remote,
             namespace=request.namespace,
             release_name=request.release_name,
             create_namespace=request.create_namespace,
@@ -1167,7 +1207,8 @@ async def get_kubernetes_api_info(session_id: str):
     
     try:
         # Get cluster info
-        stdout, stderr, exit_code = ssh.execute_command(
+        stdout, stderr, exit_code = await _run_ssh_in_thread(
+            ssh.execute_command,
             "kubectl cluster-info | grep 'Kubernetes control plane' | awk '{print $NF}'",
             timeout=10
         )
@@ -1280,7 +1321,7 @@ async def check_kubectl_connectivity(session_id: str):
     
     try:
         # Check kubectl version
-        stdout, stderr, exit_code = ssh.execute_command("kubectl version --client --short 2>/dev/null || kubectl version --client", timeout=10)
+        stdout, stderr, exit_code = await _run_ssh_in_thread(ssh.execute_command, "kubectl version --client --short 2>/dev/null || kubectl version --client", timeout=10)
         if exit_code != 0:
             return {
                 "success": False,
@@ -1292,7 +1333,7 @@ async def check_kubectl_connectivity(session_id: str):
         kubectl_version = stdout.strip()
         
         # Check cluster connectivity
-        stdout, stderr, exit_code = ssh.execute_command("kubectl cluster-info 2>&1", timeout=15)
+        stdout, stderr, exit_code = await _run_ssh_in_thread(ssh.execute_command, "kubectl cluster-info 2>&1", timeout=15)
         
         if exit_code != 0:
             # Try to diagnose the issue
@@ -1321,7 +1362,7 @@ async def check_kubectl_connectivity(session_id: str):
             }
         
         # Get current context
-        stdout_ctx, _, _ = ssh.execute_command("kubectl config current-context 2>&1", timeout=5)
+        stdout_ctx, _, _ = await _run_ssh_in_thread(ssh.execute_command, "kubectl config current-context 2>&1", timeout=5)
         current_context = stdout_ctx.strip()
         
         return {
@@ -1388,7 +1429,7 @@ async def setup_cluster_complete(
     
     try:
         # Step 0: Pre-check kubectl connectivity
-        stdout, stderr, exit_code = ssh.execute_command("kubectl cluster-info 2>&1", timeout=15)
+        stdout, stderr, exit_code = await _run_ssh_in_thread(ssh.execute_command, "kubectl cluster-info 2>&1", timeout=15)
         
         if exit_code != 0:
             error_output = (stderr + stdout).strip()
@@ -1411,7 +1452,8 @@ async def setup_cluster_complete(
                 )
         
         # Step 1: Create service account and get token on remote cluster
-        sa_info = ssh.create_service_account_with_token(
+        sa_info = await _run_ssh_in_thread(
+            ssh.create_service_account_with_token,
             name=request.service_account_name,
             namespace=request.namespace,
             role_type=request.role_type,
@@ -1504,7 +1546,8 @@ async def setup_cluster_complete(
         
         if request.install_kyverno:
             try:
-                stdout, stderr, exit_code = ssh.install_kyverno_remote(
+                stdout, stderr, exit_code = await _run_ssh_in_thread(
+                    ssh.install_kyverno_remote,
                     namespace=request.kyverno_namespace,
                     release_name="kyverno",
                     create_namespace=True,
@@ -1610,7 +1653,7 @@ async def list_service_accounts(
         ServiceAccountToken.is_active == True
     ).all()
     
-    return tokens
+    return [ServiceAccountResponse.from_orm_fast(t) for t in tokens]
 
 
 @router.post("/connect-with-token", response_model=ClusterConnectResponse)
@@ -1621,8 +1664,6 @@ async def connect_with_token(request: TokenConnectRequest):
     This is more secure than using full kubeconfig as the token
     can have limited RBAC permissions.
     """
-    connector = get_k8s_connector()
-    
     try:
         # Create temporary kubeconfig with token
         import tempfile
@@ -1657,16 +1698,8 @@ async def connect_with_token(request: TokenConnectRequest):
         
         kubeconfig_content = yaml.dump(kubeconfig)
         
-        # Connect using the token-based kubeconfig
-        connector.load_cluster_from_content(
-            kubeconfig_content=kubeconfig_content
-        )
-        
-        # Get cluster info
-        cluster_info = connector.get_cluster_info()
-        
-        # List namespaces to verify connectivity
-        namespaces = connector.list_namespaces()
+        # Connect using the token-based kubeconfig and verify connectivity
+        cluster_info, namespaces = await _connect_and_describe(kubeconfig_content)
         
         return ClusterConnectResponse(
             success=True,
@@ -1675,6 +1708,8 @@ async def connect_with_token(request: TokenConnectRequest):
             namespaces=namespaces
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1705,6 +1740,7 @@ async def delete_service_account_token(
     # Soft delete - mark as inactive
     sa_token.is_active = False
     db.commit()
+    clear_token_api_clients()
     
     # Add audit log
     audit = AuditLog(
@@ -1732,17 +1768,11 @@ async def connect_saved_cluster(cluster_id: int, db: Session = Depends(get_db)):
     if not cluster:
         raise HTTPException(status_code=404, detail="Cluster not found")
     
-    connector = get_k8s_connector()
-    
     try:
-        connector.load_cluster_from_content(
-            kubeconfig_content=cluster.kubeconfig_content,
-            context=cluster.context
+        cluster_info, namespaces = await _connect_and_describe(
+            cluster.kubeconfig_content, context=cluster.context
         )
         
-        cluster_info = connector.get_cluster_info()
-        namespaces = connector.list_namespaces()
-        
         # Add audit log
         audit = AuditLog(
             action="cluster_connect",
@@ -1812,8 +1842,6 @@ async def connect_with_saved_token(
     
     try:
         # Connect using the token
-        connector = get_k8s_connector()
-        
         import yaml
         cluster_config = {
             "server": cluster.server_url,
@@ -1847,10 +1875,7 @@ async def connect_with_saved_token(
         
         kubeconfig_content = yaml.dump(kubeconfig)
         
-        connector.load_cluster_from_content(kubeconfig_content=kubeconfig_content)
-        
-        cluster_info = connector.get_cluster_info()
-        namespaces = connector.list_namespaces()
+        cluster_info, namespaces = await _connect_and_describe(kubeconfig_content)
         
         # Add audit log
         audit = AuditLog(
@@ -1936,7 +1961,8 @@ async def create_service_account(
     
     try:
         # Create service account and get token
-        sa_info = ssh.create_service_account_with_token(
+        sa_info = await _run_ssh_in_thread(
+            ssh.create_service_account_with_token,
             name=request.name,
             namespace=request.namespace,
             role_type=request.role_type,
@@ -1979,6 +2005,7 @@ async def create_service_account(
         db.add(sa_token)
         db.commit()
         db.refresh(sa_token)
+        invalidate_cluster_cache(cluster_id)
         
         # Add audit log
         audit = AuditLog(
@@ -4,19 +4,29 @@ Policies Router
 API endpoints for managing Kyverno policies.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import and_
+from sqlalchemy.orm import Query, Session
+from typing import Any, Callable, List, Type
 from datetime import datetime
 import asyncio
+import functools
 import logging
 import yaml
 
-from app.db import get_db
-from app.models import Policy, PolicyDeployment, Cluster, AuditLog, ServiceAccountToken
-from app.services.auth import get_current_user
-from app.services.cluster_utils import resolve_cluster_kubeconfig
+from app.db import get_db, SessionLocal
+from app.models import Policy, PolicyDeployment, Cluster, AuditLog, ServiceAccountToken, User
+from app.services.auth import get_current_user, get_current_active_admin
+from app.services.cluster_utils import (
+    resolve_cluster_kubeconfig,
+    build_cluster_kubeconfig,
+    get_cached_cluster,
+    cached_cluster_json_response,
+    invalidate_cluster_responses,
+)
 from app.schemas import (
+    FastORMModel,
     PolicyCreate,
     PolicyUpdate,
     PolicyResponse,
@@ -36,7 +46,12 @@ from app.schemas import (
     PolicyTestResponse,
     PolicyTestRuleResult,
 )
-from app.services.k8s_connector import get_k8s_connector
+from app.services.k8s_connector import (
+    get_token_api_client,
+    K8sConnector,
+    YamlSafeLoader,
+    k8s_executor,
+)
 from app.services.template_engine import get_template_engine
 from app.services.validation_service import get_validation_service
 
@@ -48,20 +63,71 @@ router = APIRouter(
 logger = logging.getLogger(__name__)
 
 _K8S_TIMEOUT = 20.0
+# Policy reports are listed namespace by namespace
+_K8S_REPORTS_TIMEOUT = 60.0
+
+
+def _k8s_timeout_error(timeout: float) -> HTTPException:
+    return HTTPException(
+        status_code=504,
+        detail=(
+            f"Kubernetes cluster request timed out after {int(timeout)} seconds. "
+            "The cluster may be unreachable."
+        ),
+    )
 
 
 async def _run_k8s_in_thread(func, timeout: float = _K8S_TIMEOUT):
-    """Run a sync K8s call in a thread so the async event loop isn't blocked."""
+    """Run a sync K8s call on the shared K8s executor so the async event loop isn't blocked."""
+    loop = asyncio.get_running_loop()
     try:
-        return await asyncio.wait_for(asyncio.to_thread(func), timeout=timeout)
+        return await asyncio.wait_for(loop.run_in_executor(k8s_executor, func), timeout=timeout)
     except asyncio.TimeoutError:
-        raise HTTPException(
-            status_code=504,
-            detail=(
-                f"Kubernetes cluster request timed out after {int(timeout)} seconds. "
-                "The cluster may be unreachable."
-            ),
-        )
+        raise _k8s_timeout_error(timeout)
+
+
+async def _run_k8s_delete(func, on_late_result: Callable[[Any], None], timeout: float = _K8S_TIMEOUT):
+    """
+    Like _run_k8s_in_thread, for deletes the caller records as failed on timeout.
+    
+    The worker cannot be cancelled and may still finish the delete, so its
+    eventual result is passed to on_late_result to correct that record.
+    on_late_result does blocking DB work, so it runs on the default executor
+    rather than on the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(k8s_executor, func)
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+    except asyncio.TimeoutError:
+        def _done(f: asyncio.Future):
+            if not f.cancelled() and f.exception() is None:
+                loop.run_in_executor(None, on_late_result, f.result())
+        future.add_done_callback(_done)
+        raise _k8s_timeout_error(timeout)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def _trusted_list_response(query: Query, orm_class, model: Type[FastORMModel]) -> Response:
+    """
+    Serialize a query's rows as a JSON list of `model` without re-validation.
+    
+    Only the columns the schema exposes are selected, so no ORM objects are
+    hydrated. Rows come from our own database, so models are built with
+    from_orm_fast and dumped by pydantic's serializer directly rather than
+    being validated field-by-field again by response_model. Null fields are
+    left out of the payload.
+    """
+    columns = [getattr(orm_class, field) for field in model.model_fields]
+    items = [model.from_orm_fast(row) for row in query.with_entities(*columns)]
+    return Response(
+        content=_list_adapter(model).dump_json(items, exclude_none=True),
+        media_type="application/json"
+    )
 
 
 # ============ Policy CRUD ============
@@ -132,8 +198,7 @@ async def list_policies(
     if category:
         query = query.filter(Policy.category == category)
     
-    policies = query.offset(skip).limit(limit).all()
-    return policies
+    return _trusted_list_response(query.offset(skip).limit(limit), Policy, PolicyResponse)
 
 
 # ============ Audit Logs ============
@@ -179,8 +244,7 @@ async def get_audit_logs(
     # Order by most recent first
     query = query.order_by(AuditLog.created_at.desc())
 
-    logs = query.offset(skip).limit(limit).all()
-    return logs
+    return _trusted_list_response(query.offset(skip).limit(limit), AuditLog, AuditLogResponse)
 
 
 @router.get("/audit-logs/stats", response_model=AuditLogStatsResponse)
@@ -320,6 +384,16 @@ async def validate_policy_yaml(
     )
 
 
+@router.post("/validate/clear-cache")
+async def clear_validation_cache(current_admin: User = Depends(get_current_active_admin)):
+    """
+    Drop memoized validation results and compiled parameter schemas (admin only).
+    """
+    get_validation_service().clear_cache()
+    logger.info(f"Validation cache cleared by '{current_admin.username}'")
+    return {"success": True, "message": "Validation cache cleared"}
+
+
 @router.post("/test-resource", response_model=PolicyTestResponse)
 async def test_policy_against_resource(
     request: PolicyTestRequest,
@@ -382,10 +456,19 @@ async def deploy_policy(
     Deploy a policy template to a specific cluster.
     cluster_id must be provided in the request.
     """
-    # Get policy template
-    policy = db.query(Policy).filter(Policy.id == request.policy_id).first()
-    if not policy:
+    # Get policy template, target cluster and its active SA token in one query
+    row = db.query(Policy, Cluster, ServiceAccountToken).select_from(Policy).outerjoin(
+        Cluster, Cluster.id == request.cluster_id
+    ).outerjoin(
+        ServiceAccountToken,
+        and_(
+            ServiceAccountToken.cluster_id == Cluster.id,
+            ServiceAccountToken.is_active == True
+        )
+    ).filter(Policy.id == request.policy_id).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Policy not found")
+    policy, cluster, sa_token = row
     
     # cluster_id is now required in the request
     if not request.cluster_id:
@@ -394,7 +477,6 @@ async def deploy_policy(
             detail="cluster_id is required to deploy a policy template"
         )
     
-    cluster = db.query(Cluster).filter(Cluster.id == request.cluster_id).first()
     if not cluster:
         raise HTTPException(status_code=404, detail="Cluster not found")
     
@@ -414,7 +496,7 @@ async def deploy_policy(
     # Detect policy kind (ClusterPolicy vs Policy) from rendered YAML
     policy_kind = None
     try:
-        parsed = yaml.safe_load(yaml_content)
+        parsed = yaml.load(yaml_content, Loader=YamlSafeLoader)
         if parsed and isinstance(parsed, dict):
             policy_kind = parsed.get("kind")
     except yaml.YAMLError:
@@ -441,7 +523,7 @@ async def deploy_policy(
     
     # Resolve kubeconfig for cluster
     try:
-        kubeconfig_content_deploy = resolve_cluster_kubeconfig(cluster, db)
+        kubeconfig_content_deploy = build_cluster_kubeconfig(cluster, sa_token)
     except HTTPException:
         deployment.status = "failed"
         deployment.error_message = "Cluster missing credentials. Please run cluster setup first."
@@ -449,12 +531,25 @@ async def deploy_policy(
         raise
 
     def _sync_deploy():
-        connector = get_k8s_connector()
-        connector.load_cluster_from_content(kubeconfig_content=kubeconfig_content_deploy)
+        if sa_token and cluster.server_url:
+            # Reuse a cached token client (and its open connections)
+            connector = K8sConnector()
+            connector.use_api_client(get_token_api_client(
+                cluster.server_url,
+                sa_token.token,
+                cluster.ca_cert_data,
+                bool(cluster.verify_ssl),
+            ))
+        else:
+            # Private connector: the shared one may be re-pointed at another
+            # cluster by a concurrent job
+            connector = K8sConnector()
+            connector.load_cluster_from_content(kubeconfig_content=kubeconfig_content_deploy)
         return connector.apply_yaml(yaml_content, namespace=request.namespace)
 
     try:
         await _run_k8s_in_thread(_sync_deploy)
+        invalidate_cluster_responses(cluster.id)
 
         # Update deployment status
         deployment.status = "deployed"
@@ -587,8 +682,7 @@ async def list_deployments(
     if status:
         query = query.filter(PolicyDeployment.status == status)
     
-    deployments = query.all()
-    return deployments
+    return _trusted_list_response(query, PolicyDeployment, PolicyDeploymentResponse)
 
 
 @router.get("/deployments/cluster/{cluster_id}", response_model=List[PolicyDeploymentResponse])
@@ -607,9 +701,7 @@ async def list_cluster_deployments(
     - status: Optional status filter (pending, deployed, failed, removed)
     """
     # Verify cluster exists
-    cluster = db.query(Cluster).filter(Cluster.id == cluster_id).first()
-    if not cluster:
-        raise HTTPException(status_code=404, detail="Cluster not found")
+    get_cached_cluster(cluster_id, db)
     
     query = db.query(PolicyDeployment).filter(PolicyDeployment.cluster_id == cluster_id)
     
@@ -619,8 +711,83 @@ async def list_cluster_deployments(
     # Order by most recent first
     query = query.order_by(PolicyDeployment.created_at.desc())
     
-    deployments = query.all()
-    return deployments
+    return _trusted_list_response(query, PolicyDeployment, PolicyDeploymentResponse)
+
+
+def _deployment_scope(deployment: PolicyDeployment) -> str:
+    """Kyverno scope of a deployment (ClusterPolicies are recorded as "cluster-wide")"""
+    return "cluster" if deployment.namespace == "cluster-wide" else "namespaced"
+
+
+def _mark_removal_failed(deployment: PolicyDeployment, error: Exception, db: Session) -> dict:
+    """Record that a deployment's policy could not be deleted from its cluster"""
+    logger.warning(f"Failed to delete policy from cluster: {error}")
+    deployment.status = "removal_failed"
+    deployment.error_message = f"Failed to remove from cluster: {str(error)}"
+    deployment.updated_at = datetime.utcnow()
+    db.commit()
+    
+    return {
+        "success": False,
+        "message": f"Failed to remove policy from cluster: {str(error)}. "
+                   "The policy may still be active in the cluster."
+    }
+
+
+def _mark_removed(deployment: PolicyDeployment, policy, cluster, db: Session) -> dict:
+    """Mark a deployment removed and audit it"""
+    deployment.status = "removed"
+    deployment.updated_at = datetime.utcnow()
+    db.commit()
+    
+    # Add audit log
+    audit = AuditLog(
+        action="policy_undeploy",
+        resource_type="policy_deployment",
+        resource_id=deployment.id,
+        details={
+            "policy_name": policy.name if policy else None,
+            "cluster_id": cluster.id if cluster else None,
+            "namespace": deployment.namespace
+        },
+        status="success"
+    )
+    db.add(audit)
+    db.commit()
+    
+    return {"success": True, "message": "Policy undeployed successfully"}
+
+
+def _record_late_removals(cluster_id: int, deployment_ids: List[int], outcomes: List[Any]):
+    """
+    Mark deployments removed whose cluster delete finished only after the
+    request had timed out and recorded them as removal_failed.
+    """
+    db = SessionLocal()
+    try:
+        for deployment_id, outcome in zip(deployment_ids, outcomes):
+            if isinstance(outcome, Exception):
+                continue
+            deployment = db.query(PolicyDeployment).filter(
+                PolicyDeployment.id == deployment_id
+            ).first()
+            if deployment is None or deployment.status != "removal_failed":
+                continue
+            policy = db.query(Policy).filter(Policy.id == deployment.policy_id).first()
+            cluster = db.query(Cluster).filter(Cluster.id == deployment.cluster_id).first()
+            deployment.error_message = None
+            _mark_removed(deployment, policy, cluster, db)
+            logger.info(f"Deployment {deployment_id} removed after its request timed out")
+    except Exception as e:
+        logger.warning(f"Failed to record late policy removal: {e}")
+    finally:
+        db.close()
+    invalidate_cluster_responses(cluster_id)
+
+
+def _record_late_removal(cluster_id: int, deployment_id: int, outcome: Any):
+    """_record_late_removals for a single deployment"""
+    _record_late_removals(cluster_id, [deployment_id], [outcome])
 
 
 @router.delete("/deployments/{deployment_id}")
@@ -647,45 +814,26 @@ async def remove_deployment(deployment_id: int, db: Session = Depends(get_db)):
             kubeconfig_content = None
 
         if kubeconfig_content:
-            connector = get_k8s_connector()
-            try:
+            policy_name = policy.name
+            namespace = deployment.namespace
+            scope = _deployment_scope(deployment)
+            
+            def _sync_delete():
+                connector = K8sConnector()
                 connector.load_cluster_from_content(kubeconfig_content=kubeconfig_content)
-                connector.delete_policy(policy.name, namespace=deployment.namespace)
+                return connector.delete_policy(policy_name, namespace=namespace, scope=scope)
+            
+            try:
+                await _run_k8s_delete(
+                    _sync_delete,
+                    functools.partial(_record_late_removal, cluster.id, deployment.id),
+                )
+                invalidate_cluster_responses(cluster.id)
             except Exception as e:
                 # K8s delete failed — mark as removal_failed so user knows
-                logger.warning(f"Failed to delete policy from cluster: {e}")
-                deployment.status = "removal_failed"
-                deployment.error_message = f"Failed to remove from cluster: {str(e)}"
-                deployment.updated_at = datetime.utcnow()
-                db.commit()
-                
-                return {
-                    "success": False,
-                    "message": f"Failed to remove policy from cluster: {str(e)}. "
-                               "The policy may still be active in the cluster."
-                }
-    
-    # Update deployment status to removed
-    deployment.status = "removed"
-    deployment.updated_at = datetime.utcnow()
-    db.commit()
-    
-    # Add audit log
-    audit = AuditLog(
-        action="policy_undeploy",
-        resource_type="policy_deployment",
-        resource_id=deployment.id,
-        details={
-            "policy_name": policy.name if policy else None,
-            "cluster_id": cluster.id if cluster else None,
-            "namespace": deployment.namespace
-        },
-        status="success"
-    )
-    db.add(audit)
-    db.commit()
+                return _mark_removal_failed(deployment, e, db)
     
-    return {"success": True, "message": "Policy undeployed successfully"}
+    return _mark_removed(deployment, policy, cluster, db)
 
 
 @router.get("/deployment-status/{policy_id}/cluster/{cluster_id}")
@@ -971,13 +1119,46 @@ async def quick_undeploy_policy(
             detail="No active deployment found for this policy in this cluster"
         )
     
-    # Undeploy each instance
+    policy = db.query(Policy).filter(Policy.id == policy_id).first()
+    cluster = db.query(Cluster).filter(Cluster.id == cluster_id).first()
+    
+    # Delete every instance from the cluster in one go (deletes run
+    # concurrently), then record each outcome as remove_deployment would
+    outcomes: List[Any] = [None] * len(deployments)
+    kubeconfig_content = None
+    if policy and cluster:
+        try:
+            kubeconfig_content = resolve_cluster_kubeconfig(cluster, db)
+        except HTTPException:
+            kubeconfig_content = None
+    
+    if kubeconfig_content:
+        targets = [(policy.name, d.namespace, _deployment_scope(d)) for d in deployments]
+        
+        def _sync_delete_all():
+            connector = K8sConnector()
+            connector.load_cluster_from_content(kubeconfig_content=kubeconfig_content)
+            return connector.delete_policies(targets)
+        
+        try:
+            outcomes = await _run_k8s_delete(
+                _sync_delete_all,
+                functools.partial(
+                    _record_late_removals, cluster.id, [d.id for d in deployments]
+                ),
+            )
+        except Exception as e:
+            outcomes = [e] * len(deployments)
+        invalidate_cluster_responses(cluster.id)
+    
     results = []
     any_failed = False
-    for deployment in deployments:
-        result = await remove_deployment(deployment.id, db)
-        if not result.get("success", False):
+    for deployment, outcome in zip(deployments, outcomes):
+        if isinstance(outcome, Exception):
+            result = _mark_removal_failed(deployment, outcome, db)
             any_failed = True
+        else:
+            result = _mark_removed(deployment, policy, cluster, db)
         results.append({"namespace": deployment.namespace, **result})
     
     if any_failed:
@@ -995,24 +1176,33 @@ async def quick_undeploy_policy(
 
 
 @router.get("/cluster/{cluster_id}/kyverno-policies")
-async def list_kyverno_policies(cluster_id: int, db: Session = Depends(get_db)):
+async def list_kyverno_policies(
+    cluster_id: int,
+    request: Request,
+    db: Session = Depends(get_db)
+):
     """
     List all Kyverno policies currently deployed in a specific cluster.
-    """
-    cluster = db.query(Cluster).filter(Cluster.id == cluster_id).first()
-    if not cluster:
-        raise HTTPException(status_code=404, detail="Cluster not found")
     
-    # Resolve kubeconfig
-    kubeconfig_content = resolve_cluster_kubeconfig(cluster, db)
+    Responses are cached briefly per cluster and carry an ETag, so repeat
+    dashboard polls can be answered from memory (or with a 304).
+    """
+    cluster = get_cached_cluster(cluster_id, db)
     
-    connector = get_k8s_connector()
+    def _fetch_policies():
+        # Resolve kubeconfig
+        kubeconfig_content = resolve_cluster_kubeconfig(cluster, db)
+        
+        connector = K8sConnector()
+        connector.load_cluster_from_content(kubeconfig_content=kubeconfig_content)
+        return connector.list_kyverno_policies()
     
     try:
-        connector.load_cluster_from_content(kubeconfig_content=kubeconfig_content)
-        
-        policies = connector.list_kyverno_policies()
-        return policies
+        return await cached_cluster_json_response(
+            request, cluster_id, "kyverno-policies", _fetch_policies
+        )
+    except HTTPException:
+        raise
     except RuntimeError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1035,9 +1225,7 @@ async def get_cluster_stats(cluster_id: int, db: Session = Depends(get_db)):
     from datetime import datetime, timedelta
     
     # Verify cluster exists
-    cluster = db.query(Cluster).filter(Cluster.id == cluster_id).first()
-    if not cluster:
-        raise HTTPException(status_code=404, detail="Cluster not found")
+    cluster = get_cached_cluster(cluster_id, db)
     
     # Time windows for calculations
     twenty_four_hours_ago = datetime.utcnow() - timedelta(days=1)
@@ -1449,21 +1637,17 @@ async def get_cluster_policy_reports(cluster_id: int, db: Session = Depends(get_
     
     This shows actual policy violations and pass/fail results from Kyverno.
     """
-    cluster = db.query(Cluster).filter(Cluster.id == cluster_id).first()
-    if not cluster:
-        raise HTTPException(status_code=404, detail="Cluster not found")
+    cluster = get_cached_cluster(cluster_id, db)
     
     # Resolve kubeconfig
     kubeconfig_content = resolve_cluster_kubeconfig(cluster, db)
     
-    connector = get_k8s_connector()
-    
-    try:
+    def _collect_reports():
+        connector = K8sConnector()
         connector.load_cluster_from_content(kubeconfig_content=kubeconfig_content)
         
         # Get policy reports from Kubernetes
-        from kubernetes import client
-        custom_api = client.CustomObjectsApi(connector.get_api_client())
+        custom_api = connector.get_custom_objects_api()
         
         reports = []
         
@@ -1480,25 +1664,27 @@ async def get_cluster_policy_reports(cluster_id: int, db: Session = Depends(get_
         
         # Get PolicyReports from all namespaces
         try:
-            v1 = client.CoreV1Api(connector.get_api_client())
-            namespaces = v1.list_namespace()
-            
-            for ns in namespaces.items:
+            for ns in connector.list_namespaces():
                 try:
                     ns_reports = custom_api.list_namespaced_custom_object(
                         group="wgpolicyk8s.io",
                         version="v1alpha2",
-                        namespace=ns.metadata.name,
+                        namespace=ns,
                         plural="policyreports"
                     )
                     for report in ns_reports.get("items", []):
-                        report["namespace"] = ns.metadata.name
+                        report["namespace"] = ns
                         reports.append(report)
                 except Exception:
                     pass
         except Exception as e:
             logger.warning(f"Failed to get PolicyReports: {e}")
         
+        return reports
+    
+    try:
+        reports = await _run_k8s_in_thread(_collect_reports, timeout=_K8S_REPORTS_TIMEOUT)
+        
         # Parse and summarize reports
         summary = {
             "total_reports": len(reports),
@@ -1530,6 +1716,8 @@ async def get_cluster_policy_reports(cluster_id: int, db: Session = Depends(get_
         
         return summary
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
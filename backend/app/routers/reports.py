@@ -4,15 +4,25 @@ Reports Router
 API endpoints for generating compliance and policy reports.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from app.db import get_db
 from app.models import Cluster, Policy, PolicyDeployment
 from app.services.auth import get_current_user
+from app.services.cluster_utils import (
+    CachedCluster,
+    get_cluster,
+    get_cached_cluster,
+    resolve_cluster_kubeconfig,
+    cached_cluster_json_response,
+)
 from app.schemas import ComplianceReportRequest, ComplianceReportResponse
-from app.services.k8s_connector import get_k8s_connector
+from app.services.k8s_connector import K8sConnector
 from app.services.report_generator import get_report_generator
 
 router = APIRouter(
@@ -22,6 +32,43 @@ router = APIRouter(
 )
 
 
+def _report_response(report: dict) -> Response:
+    """
+    Serialize a generated report with pydantic-core's JSON encoder.
+    
+    Reports are plain dicts of JSON types, so FastAPI's jsonable_encoder
+    pass (a recursive copy of the whole report) is skipped.
+    """
+    return Response(content=to_json(report), media_type="application/json")
+
+
+def _deployed_policies(cluster_id: int, db: Session) -> Tuple[List[dict], dict]:
+    """
+    Policies deployed to a cluster (only the columns the compliance report
+    uses) and their per-category counts.
+    """
+    deployed = (
+        PolicyDeployment.cluster_id == cluster_id,
+        PolicyDeployment.status == "deployed",
+    )
+    policies = [
+        {"name": name, "category": category, "deployment_id": deployment_id}
+        for name, category, deployment_id in db.query(
+            Policy.name, Policy.category, PolicyDeployment.id
+        ).join(PolicyDeployment, PolicyDeployment.policy_id == Policy.id).filter(*deployed)
+    ]
+    
+    # Per-category rollup is counted by the database
+    category_counts = dict(
+        db.query(Policy.category, func.count(PolicyDeployment.id))
+        .join(PolicyDeployment, PolicyDeployment.policy_id == Policy.id)
+        .filter(*deployed)
+        .group_by(Policy.category)
+        .all()
+    )
+    return policies, category_counts
+
+
 @router.post("/compliance")
 async def generate_compliance_report(
     request: ComplianceReportRequest,
@@ -30,26 +77,8 @@ async def generate_compliance_report(
     """
     Generate a compliance report for a cluster.
     """
-    cluster = db.query(Cluster).filter(Cluster.id == request.cluster_id).first()
-    if not cluster:
-        raise HTTPException(status_code=404, detail="Cluster not found")
-    
-    # Get deployments for this cluster
-    deployments = db.query(PolicyDeployment).filter(
-        PolicyDeployment.cluster_id == request.cluster_id,
-        PolicyDeployment.status == "deployed"
-    ).all()
-    
-    # Get policies
-    policies = []
-    for deployment in deployments:
-        policy = db.query(Policy).filter(Policy.id == deployment.policy_id).first()
-        if policy:
-            policies.append({
-                "name": policy.name,
-                "category": policy.category,
-                "deployment_id": deployment.id,
-            })
+    cluster = get_cached_cluster(request.cluster_id, db)
+    policies, category_counts = _deployed_policies(request.cluster_id, db)
     
     # TODO: Get actual violations from cluster
     # For now, return empty violations
@@ -62,29 +91,34 @@ async def generate_compliance_report(
         violations=violations,
         include_passed=request.include_passed,
         include_failed=request.include_failed,
+        category_counts=category_counts,
     )
     
-    return report
+    return _report_response(report)
 
 
 @router.get("/cluster-summary/{cluster_id}")
-async def get_cluster_summary_report(cluster_id: int, db: Session = Depends(get_db)):
+async def get_cluster_summary_report(
+    request: Request,
+    cluster: CachedCluster = Depends(get_cluster),
+    db: Session = Depends(get_db)
+):
     """
     Generate a summary report for a cluster.
-    """
-    cluster = db.query(Cluster).filter(Cluster.id == cluster_id).first()
-    if not cluster:
-        raise HTTPException(status_code=404, detail="Cluster not found")
     
-    connector = get_k8s_connector()
-    generator = get_report_generator()
-    
-    try:
+    The report is cached briefly per cluster and served with an ETag.
+    """
+    def _build_summary():
+        # Resolve kubeconfig (SA token first, then stored kubeconfig)
+        kubeconfig_content = resolve_cluster_kubeconfig(cluster, db)
+        
+        # Private connector: the shared one may be re-pointed at another
+        # cluster by a concurrent job
+        connector = K8sConnector()
+        generator = get_report_generator()
+        
         # Connect to cluster
-        connector.load_cluster(
-            kubeconfig_path=cluster.kubeconfig_path,
-            context=cluster.context
-        )
+        connector.load_cluster_from_content(kubeconfig_content=kubeconfig_content)
         
         # Get cluster info
         cluster_info = connector.get_cluster_info()
@@ -103,14 +137,18 @@ async def get_cluster_summary_report(cluster_id: int, db: Session = Depends(get_
             k8s_policies.get("namespaced_policies", [])
         )
         
-        report = generator.generate_cluster_summary(
+        return generator.generate_cluster_summary(
             cluster_info=cluster_info,
             policies=all_policies,
             kyverno_status=kyverno_status,
         )
-        
-        return report
-        
+    
+    try:
+        return await cached_cluster_json_response(
+            request, cluster.id, "cluster-summary", _build_summary
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -127,22 +165,37 @@ async def get_policy_report(policy_id: int, db: Session = Depends(get_db)):
     if not policy:
         raise HTTPException(status_code=404, detail="Policy not found")
     
-    # Get all deployments for this policy
-    deployments = db.query(PolicyDeployment).filter(
+    # Per-status counts are aggregated by the database
+    status_counts = dict(
+        db.query(PolicyDeployment.status, func.count(PolicyDeployment.id))
+        .filter(PolicyDeployment.policy_id == policy_id)
+        .group_by(PolicyDeployment.status)
+        .all()
+    )
+    
+    # Deployment rows with their cluster name, without hydrating ORM objects
+    rows = db.query(
+        PolicyDeployment.cluster_id,
+        Cluster.name,
+        PolicyDeployment.namespace,
+        PolicyDeployment.status,
+        PolicyDeployment.deployed_at,
+        PolicyDeployment.error_message,
+    ).outerjoin(Cluster, Cluster.id == PolicyDeployment.cluster_id).filter(
         PolicyDeployment.policy_id == policy_id
-    ).all()
-    
-    deployment_data = []
-    for d in deployments:
-        cluster = db.query(Cluster).filter(Cluster.id == d.cluster_id).first()
-        deployment_data.append({
-            "cluster_id": d.cluster_id,
-            "cluster_name": cluster.name if cluster else "Unknown",
-            "namespace": d.namespace,
-            "status": d.status,
-            "deployed_at": d.deployed_at.isoformat() if d.deployed_at else None,
-            "error_message": d.error_message,
-        })
+    )
+    
+    deployment_data = [
+        {
+            "cluster_id": cluster_id,
+            "cluster_name": cluster_name or "Unknown",
+            "namespace": namespace,
+            "status": status,
+            "deployed_at": deployed_at.isoformat() if deployed_at else None,
+            "error_message": error_message,
+        }
+        for cluster_id, cluster_name, namespace, status, deployed_at, error_message in rows
+    ]
     
     generator = get_report_generator()
     report = generator.generate_policy_report(
@@ -152,9 +205,10 @@ async def get_policy_report(policy_id: int, db: Session = Depends(get_db)):
             "description": policy.description,
         },
         deployments=deployment_data,
+        status_counts=status_counts,
     )
     
-    return report
+    return _report_response(report)
 
 
 @router.get("/compliance/{cluster_id}/markdown")
@@ -162,26 +216,24 @@ async def get_compliance_report_markdown(
     cluster_id: int,
     include_passed: bool = True,
     include_failed: bool = True,
+    cluster: CachedCluster = Depends(get_cluster),
     db: Session = Depends(get_db)
 ):
     """
     Generate a compliance report in Markdown format.
-    """
-    cluster = db.query(Cluster).filter(Cluster.id == cluster_id).first()
-    if not cluster:
-        raise HTTPException(status_code=404, detail="Cluster not found")
-    
-    # Get deployments
-    deployments = db.query(PolicyDeployment).filter(
-        PolicyDeployment.cluster_id == cluster_id,
-        PolicyDeployment.status == "deployed"
-    ).all()
     
-    policies = []
-    for deployment in deployments:
-        policy = db.query(Policy).filter(Policy.id == deployment.policy_id).first()
-        if policy:
-            policies.append({"name": policy.name})
+    The document is streamed as text/markdown, one policy section at a time.
+    """
+    # Get deployed policy names
+    policies = [
+        {"name": name}
+        for (name,) in db.query(Policy.name).join(
+            PolicyDeployment, PolicyDeployment.policy_id == Policy.id
+        ).filter(
+            PolicyDeployment.cluster_id == cluster_id,
+            PolicyDeployment.status == "deployed"
+        )
+    ]
     
     generator = get_report_generator()
     report = generator.generate_compliance_report(
@@ -192,6 +244,38 @@ async def get_compliance_report_markdown(
         include_failed=include_failed,
     )
     
-    markdown = generator.format_report_as_markdown(report)
+    return StreamingResponse(
+        generator.iter_markdown(report),
+        media_type="text/markdown; charset=utf-8"
+    )
+
+
+@router.get("/compliance/{cluster_id}/ndjson")
+async def get_compliance_report_ndjson(
+    cluster_id: int,
+    include_passed: bool = True,
+    include_failed: bool = True,
+    cluster: CachedCluster = Depends(get_cluster),
+    db: Session = Depends(get_db)
+):
+    """
+    Generate a compliance report as newline-delimited JSON.
+    
+    The first line holds the cluster name, timestamp and summary; each
+    following line is one policy's detail entry. Lines are streamed as they
+    are produced, so large reports are never held as one document.
+    """
+    policies, category_counts = _deployed_policies(cluster_id, db)
     
-    return {"markdown": markdown}
+    generator = get_report_generator()
+    return StreamingResponse(
+        generator.iter_compliance_ndjson(
+            cluster_name=cluster.name,
+            policies=policies,
+            violations=[],
+            include_passed=include_passed,
+            include_failed=include_failed,
+            category_counts=category_counts,
+        ),
+        media_type="application/x-ndjson"
+    )
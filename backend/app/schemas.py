@@ -1,8 +1,31 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
+class FastORMModel(BaseModel):
+    """Immutable response model that can be built from trusted ORM rows without validation"""
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        extra="ignore",
+        populate_by_name=True,
+        ser_json_timedelta="iso8601",
+        ser_json_bytes="base64",
+    )
+    
+    @classmethod
+    def from_orm_fast(cls, orm_obj: Any):
+        """
+        Build the model from an ORM object (or result row) via model_construct.
+        
+        Only use for data read back from our own database; request bodies
+        and other untrusted input must still go through model_validate.
+        """
+        return cls.model_construct(**{f: getattr(orm_obj, f) for f in cls.model_fields})
+
+
 # ============ Authentication Schemas ============
 
 class UserBase(BaseModel):
@@ -30,8 +53,7 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserUpdateProfile(BaseModel):
@@ -87,14 +109,13 @@ class ClusterUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class ClusterResponse(ClusterBase):
+class ClusterResponse(ClusterBase, FastORMModel):
     id: int
     is_active: bool
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ClusterConnectRequest(BaseModel):
@@ -146,13 +167,12 @@ class PolicyUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class PolicyResponse(PolicyBase):
+class PolicyResponse(PolicyBase, FastORMModel):
     id: int
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PolicyDeployRequest(BaseModel):
@@ -245,7 +265,7 @@ class PolicyTestResponse(BaseModel):
 
 # ============ Policy Deployment Schemas ============
 
-class PolicyDeploymentResponse(BaseModel):
+class PolicyDeploymentResponse(FastORMModel):
     id: int
     cluster_id: int
     policy_id: int
@@ -257,13 +277,12 @@ class PolicyDeploymentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============ Audit Log Schemas ============
 
-class AuditLogResponse(BaseModel):
+class AuditLogResponse(FastORMModel):
     id: int
     user_id: Optional[int] = None
     username: Optional[str] = None
@@ -275,8 +294,7 @@ class AuditLogResponse(BaseModel):
     error_message: Optional[str] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AuditLogStatsResponse(BaseModel):
@@ -435,8 +453,7 @@ class HelmChartResponse(HelmChartBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class HelmReleaseBase(BaseModel):
@@ -467,8 +484,7 @@ class HelmReleaseResponse(HelmReleaseBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class HelmDeployRequest(BaseModel):
@@ -520,8 +536,7 @@ class HelmValidateResponse(BaseModel):
     errors: List[str] = []
     warnings: List[str] = []
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
     output: Optional[str] = None
 
 
@@ -603,7 +618,7 @@ class ServiceAccountCreate(BaseModel):
     duration: Optional[str] = Field(default="87600h", description="Token duration (e.g., 87600h = 10 years, 24h = 1 day)")
 
 
-class ServiceAccountResponse(BaseModel):
+class ServiceAccountResponse(FastORMModel):
     """Response after creating service account"""
     id: int
     cluster_id: int
@@ -617,8 +632,7 @@ class ServiceAccountResponse(BaseModel):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenConnectRequest(BaseModel):
@@ -2,11 +2,174 @@
 Shared cluster utility functions used across routers.
 """
 
-from fastapi import HTTPException
+from collections import namedtuple
+from fastapi import Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import threading
+import time
 import yaml
 
-from app.models import ServiceAccountToken
+from app.db import get_db
+from app.models import Cluster, ServiceAccountToken
+from app.services.k8s_connector import k8s_executor
+
+# How long a cluster lookup is served from memory before re-querying
+CLUSTER_CACHE_TTL_SECONDS = 30
+CLUSTER_CACHE_MAX_SIZE = 1024
+
+# Detached snapshot of the Cluster columns read-only endpoints need
+CachedCluster = namedtuple("CachedCluster", [
+    "id",
+    "name",
+    "host",
+    "kubeconfig_content",
+    "context",
+    "server_url",
+    "verify_ssl",
+    "ca_cert_data",
+])
+
+_cluster_cache: Dict[int, Tuple[float, CachedCluster]] = {}
+_cluster_cache_lock = threading.Lock()
+
+# How long serialized cluster API responses (policy lists, summaries) are reused
+CLUSTER_RESPONSE_TTL_SECONDS = 15
+
+# (cluster_id, endpoint key) -> (expires_at, body, etag)
+_cluster_responses: Dict[Tuple[int, str], Tuple[float, bytes, str]] = {}
+# (cluster_id, endpoint key) -> task building its (body, etag), shared by
+# concurrent misses; guarded by _cluster_responses_lock
+_cluster_builds: Dict[Tuple[int, str], "asyncio.Task"] = {}
+_cluster_responses_lock = threading.Lock()
+
+
+def get_cached_cluster(cluster_id: int, db: Session) -> CachedCluster:
+    """
+    Look up a cluster by id, serving repeat lookups from a short TTL cache.
+    Raises HTTPException 404 if the cluster does not exist.
+    """
+    now = time.monotonic()
+    with _cluster_cache_lock:
+        entry = _cluster_cache.get(cluster_id)
+        if entry and entry[0] > now:
+            return entry[1]
+
+    cluster = db.query(Cluster).filter(Cluster.id == cluster_id).first()
+    if not cluster:
+        raise HTTPException(status_code=404, detail="Cluster not found")
+
+    snapshot = CachedCluster(*(getattr(cluster, field) for field in CachedCluster._fields))
+    with _cluster_cache_lock:
+        if len(_cluster_cache) >= CLUSTER_CACHE_MAX_SIZE:
+            # Drop expired entries first, then the oldest if still full
+            for key in [k for k, (expires, _) in _cluster_cache.items() if expires <= now]:
+                del _cluster_cache[key]
+            if len(_cluster_cache) >= CLUSTER_CACHE_MAX_SIZE:
+                del _cluster_cache[next(iter(_cluster_cache))]
+        _cluster_cache[cluster_id] = (now + CLUSTER_CACHE_TTL_SECONDS, snapshot)
+    return snapshot
+
+
+def get_cluster(cluster_id: int, db: Session = Depends(get_db)) -> CachedCluster:
+    """FastAPI dependency: the path's cluster_id as a CachedCluster, or 404."""
+    return get_cached_cluster(cluster_id, db)
+
+
+def invalidate_cluster_cache(cluster_id: Optional[int] = None):
+    """Forget a cached cluster (or all of them) after it is modified."""
+    with _cluster_cache_lock:
+        if cluster_id is None:
+            _cluster_cache.clear()
+        else:
+            _cluster_cache.pop(cluster_id, None)
+    invalidate_cluster_responses(cluster_id)
+
+
+async def _build_cluster_response(
+    cache_key: Tuple[int, str], build: Callable[[], Any]
+) -> Tuple[bytes, str]:
+    """Run build() on the K8s executor and cache its JSON body and ETag."""
+    try:
+        payload = await asyncio.get_running_loop().run_in_executor(k8s_executor, build)
+        body = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    except BaseException:
+        with _cluster_responses_lock:
+            if _cluster_builds.get(cache_key) is asyncio.current_task():
+                del _cluster_builds[cache_key]
+        raise
+    with _cluster_responses_lock:
+        if _cluster_builds.get(cache_key) is asyncio.current_task():
+            del _cluster_builds[cache_key]
+            # Expiry counts from when the payload was built
+            _cluster_responses[cache_key] = (
+                time.monotonic() + CLUSTER_RESPONSE_TTL_SECONDS, body, etag
+            )
+    return body, etag
+
+
+async def cached_cluster_json_response(
+    request: Request,
+    cluster_id: int,
+    key: str,
+    build: Callable[[], Any],
+) -> Response:
+    """
+    Serve a cluster's JSON payload from a short TTL cache, with an ETag.
+
+    build() is only called (hitting the Kubernetes API) when there is no
+    fresh cached body, and then runs on the shared K8s executor so the
+    event loop isn't blocked. A matching If-None-Match gets an empty 304.
+    Exceptions from build() propagate and nothing is cached.
+
+    Concurrent misses for the same payload share one build, run as its own
+    task so a cancelled request doesn't cancel it for the others. A build
+    that was in flight when the cluster's responses were invalidated is
+    still returned to its callers but not cached.
+    """
+    cache_key = (cluster_id, key)
+    with _cluster_responses_lock:
+        entry = _cluster_responses.get(cache_key)
+        if entry and entry[0] > time.monotonic():
+            pending = None
+        else:
+            entry = None
+            pending = _cluster_builds.get(cache_key)
+            if pending is None:
+                pending = _cluster_builds[cache_key] = asyncio.create_task(
+                    _build_cluster_response(cache_key, build)
+                )
+                # Mark a failure retrieved so a build every caller gave up
+                # on isn't logged as unhandled
+                pending.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    if entry is not None:
+        _, body, etag = entry
+    else:
+        body, etag = await asyncio.shield(pending)
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def invalidate_cluster_responses(cluster_id: Optional[int] = None):
+    """Drop cached JSON responses for a cluster (or all clusters)."""
+    with _cluster_responses_lock:
+        if cluster_id is None:
+            _cluster_responses.clear()
+            _cluster_builds.clear()
+        else:
+            for cache_key in [k for k in _cluster_responses if k[0] == cluster_id]:
+                del _cluster_responses[cache_key]
+            # Builds in flight may predate the change; let the next miss rebuild
+            for cache_key in [k for k in _cluster_builds if k[0] == cluster_id]:
+                del _cluster_builds[cache_key]
 
 
 def resolve_cluster_kubeconfig(cluster, db: Session) -> str:
@@ -22,6 +185,15 @@ def resolve_cluster_kubeconfig(cluster, db: Session) -> str:
         ServiceAccountToken.is_active == True
     ).first()
 
+    return build_cluster_kubeconfig(cluster, sa_token)
+
+
+def build_cluster_kubeconfig(cluster, sa_token: Optional[ServiceAccountToken]) -> str:
+    """
+    Build kubeconfig content for a cluster from an already-loaded active
+    service account token (or None), without touching the database.
+    Same precedence and errors as resolve_cluster_kubeconfig.
+    """
     if sa_token and cluster.server_url:
         cluster_cfg = {
             "server": cluster.server_url,
@@ -6,10 +6,13 @@ lives in one place. Resolves the helm binary once at import time and
 exposes helpers for callers.
 """
 
+import json
 import logging
 import os
 import shutil
 import subprocess
+import threading
+import time
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
@@ -64,8 +67,22 @@ def get_helm_bin() -> str:
     return helm
 
 
+# Set once `helm version` succeeds; a missing helm is re-checked each call
+_helm_ok = False
+
+# How often ensure_helm_repo re-runs `helm repo update` for the same repo
+HELM_REPO_REFRESH_SECONDS = 3600
+
+# repo name -> (url, monotonic time of last successful add/update)
+_helm_repos: Dict[str, Any] = {}
+_helm_repos_lock = threading.Lock()
+
+
 def helm_installed() -> bool:
     """Return True if helm is reachable and responds to 'helm version'."""
+    global _helm_ok
+    if _helm_ok:
+        return True
     helm = HELM_BIN or find_helm()
     if not helm:
         return False
@@ -76,11 +93,58 @@ def helm_installed() -> bool:
             text=True,
             timeout=10,
         )
-        return result.returncode == 0
+        _helm_ok = result.returncode == 0
+        return _helm_ok
     except (FileNotFoundError, subprocess.TimeoutExpired, PermissionError):
         return False
 
 
+def ensure_helm_repo(helm: str, name: str, url: str) -> None:
+    """
+    Make sure chart repo *name* points at *url* and has a fresh index.
+
+    `helm repo add` only runs if the repo isn't configured yet, and
+    `helm repo update` at most once per HELM_REPO_REFRESH_SECONDS.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If a helm command fails.
+    """
+    with _helm_repos_lock:
+        known = _helm_repos.get(name)
+        if known and known[0] == url and time.monotonic() - known[1] < HELM_REPO_REFRESH_SECONDS:
+            return
+
+        listed = subprocess.run(
+            [helm, "repo", "list", "--output", "json"],
+            capture_output=True,
+            text=True,
+        )
+        try:
+            configured = {
+                repo.get("name"): repo.get("url", "").rstrip("/")
+                for repo in json.loads(listed.stdout or "[]")
+            }
+        except ValueError:
+            configured = {}
+
+        if configured.get(name) != url.rstrip("/"):
+            subprocess.run(
+                [helm, "repo", "add", name, url, "--force-update"],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        subprocess.run(
+            [helm, "repo", "update"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        _helm_repos[name] = (url, time.monotonic())
+
+
 def get_stable_kyverno_values() -> Dict[str, Any]:
     """
     Return recommended stable Helm values for Kyverno installation.
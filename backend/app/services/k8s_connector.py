@@ -6,13 +6,28 @@ Handles all interactions with Kubernetes clusters using the kubernetes-python-cl
 
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
-from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, Callable, Dict, Any, Iterable, Iterator, List, Tuple
+import base64
+import contextlib
+import functools
+import gzip
+import hashlib
+import heapq
+import itertools
 import os
 import logging
+import re
+import threading
+import time
 import subprocess
 import json
 import tempfile
 import urllib3
+import uuid
+import yaml
 from . import helm_utils
 
 # Disable SSL warnings when verify_ssl=False
@@ -20,6 +35,331 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if unavailable
+YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlSafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+if YamlSafeLoader is yaml.SafeLoader:
+    logger.warning("PyYAML was built without libyaml; YAML parsing will use the slower pure-Python loader")
+
+# Max number of token-authenticated ApiClients kept alive for reuse
+TOKEN_API_CLIENT_CACHE_SIZE = 64
+
+# urllib3 connections kept per ApiClient; at least the K8s executor and
+# apply_yaml fan-out widths so concurrent calls on one cluster don't hit
+# "connection pool is full"
+API_CLIENT_CONNECTIONS = 32
+
+# Timeout for the background request that pre-opens a new client's
+# first connection
+API_CLIENT_WARMUP_TIMEOUT_SECONDS = 2
+
+
+def _configure_http(configuration: client.Configuration):
+    """Apply the shared timeout, pool size and retry policy to a client config"""
+    # Tuple = (connect_timeout, read_timeout) for urllib3
+    configuration.timeout = (5.0, 15.0)  # 5s connect, 15s read
+    configuration.connection_pool_maxsize = API_CLIENT_CONNECTIONS
+    # urllib3's default allows 3 retries of any kind, so an unreachable API
+    # server costs four connect timeouts. Retry a failed connect once; keep
+    # retrying dropped keep-alive connections (idempotent methods only),
+    # with a short backoff.
+    configuration.retries = urllib3.Retry(total=3, connect=1, backoff_factor=0.1)
+
+
+@functools.lru_cache(maxsize=TOKEN_API_CLIENT_CACHE_SIZE)
+def get_token_api_client(
+    server_url: str,
+    token: str,
+    ca_cert_data: Optional[str] = None,
+    verify_ssl: bool = False,
+) -> client.ApiClient:
+    """
+    Get a cached ApiClient authenticated with a service account token.
+    
+    Clients are keyed by their credentials, so repeated calls for the same
+    cluster reuse the same urllib3 connection pool (and its TLS sessions)
+    instead of paying a fresh handshake on every request.
+    
+    Args:
+        server_url: Kubernetes API server URL
+        token: Service account bearer token
+        ca_cert_data: Base64 CA certificate (used only when verify_ssl is set)
+        verify_ssl: Whether to verify the API server certificate
+        
+    Returns:
+        kubernetes.client.ApiClient instance (shared, do not close)
+    """
+    cluster_cfg = {
+        "server": server_url,
+        "insecure-skip-tls-verify": not verify_ssl,
+    }
+    if verify_ssl and ca_cert_data:
+        cluster_cfg["certificate-authority-data"] = ca_cert_data
+    
+    configuration = client.Configuration()
+    config.load_kube_config_from_dict(
+        {
+            "apiVersion": "v1",
+            "kind": "Config",
+            "clusters": [{"name": "cluster", "cluster": cluster_cfg}],
+            "users": [{"name": "user", "user": {"token": token}}],
+            "contexts": [{"name": "context", "context": {"cluster": "cluster", "user": "user"}}],
+            "current-context": "context",
+        },
+        client_configuration=configuration,
+    )
+    _configure_http(configuration)
+    
+    api_client = client.ApiClient(configuration)
+    _k8s_io_pool.submit(_warm_api_client, api_client)
+    return api_client
+
+
+def clear_token_api_clients():
+    """Drop cached token ApiClients (call when cluster credentials change)."""
+    get_token_api_client.cache_clear()
+
+
+# Max number of kubeconfig-derived ApiClients kept for reuse across requests
+API_CLIENT_POOL_SIZE = 32
+# Pooled clients unused for this long are closed (their sockets released)
+API_CLIENT_IDLE_SECONDS = 300
+
+# (sha256 of kubeconfig, context) -> [ApiClient, last used], least recently used first
+_api_client_pool: "OrderedDict[Tuple[str, Optional[str]], list]" = OrderedDict()
+_api_client_pool_lock = threading.Lock()
+
+
+def _pooled_api_client(
+    key: Tuple[str, Optional[str]],
+    load_config: Callable[[client.Configuration], None],
+) -> client.ApiClient:
+    """
+    Get the pooled ApiClient for a kubeconfig/context, building it on a miss.
+    
+    load_config(configuration) is only called on a miss. Configs are
+    loaded into a private Configuration, so the kubernetes
+    module's global default is never touched. Clients evicted for size are
+    only dereferenced (a request may still be using them); clients idle for
+    API_CLIENT_IDLE_SECONDS are closed.
+    """
+    now = time.monotonic()
+    with _api_client_pool_lock:
+        entry = _api_client_pool.get(key)
+        if entry is not None:
+            entry[1] = now
+            _api_client_pool.move_to_end(key)
+            idle = _pop_idle_api_clients(now)
+        else:
+            idle = []
+    _close_api_clients(idle)
+    if entry is not None:
+        return entry[0]
+    
+    configuration = client.Configuration()
+    load_config(configuration)
+    _configure_http(configuration)
+    api_client = client.ApiClient(configuration)
+    
+    with _api_client_pool_lock:
+        # Another thread may have built the same client meanwhile
+        entry = _api_client_pool.setdefault(key, [api_client, now])
+        entry[1] = now
+        _api_client_pool.move_to_end(key)
+        while len(_api_client_pool) > API_CLIENT_POOL_SIZE:
+            _api_client_pool.popitem(last=False)
+        idle = _pop_idle_api_clients(now)
+    _close_api_clients(idle)
+    if entry[0] is api_client:
+        _k8s_io_pool.submit(_warm_api_client, api_client)
+    return entry[0]
+
+
+def _warm_api_client(api_client: client.ApiClient):
+    """
+    Open (and TLS-handshake) a first pooled connection to the API server so
+    the caller's first real request doesn't pay for it.
+    """
+    try:
+        _discard_response(api_client.call_api(
+            "/healthz", "GET",
+            auth_settings=["BearerToken"],
+            _preload_content=False,
+            _return_http_data_only=True,
+            _request_timeout=API_CLIENT_WARMUP_TIMEOUT_SECONDS,
+        ))
+    except Exception as e:
+        logger.debug("API server warm-up request failed: %s", e)
+
+
+def _pop_idle_api_clients(now: float) -> List[client.ApiClient]:
+    """Remove pooled clients idle too long (caller holds the pool lock)"""
+    idle = []
+    # Least recently used entries are first, so stop at the first fresh one
+    while _api_client_pool:
+        key, (api_client, last_used) = next(iter(_api_client_pool.items()))
+        if now - last_used < API_CLIENT_IDLE_SECONDS:
+            break
+        del _api_client_pool[key]
+        idle.append(api_client)
+    return idle
+
+
+def _close_api_clients(api_clients: List[client.ApiClient]):
+    """Release clients' sockets and worker threads; later use just reconnects"""
+    for api_client in api_clients:
+        try:
+            api_client.rest_client.pool_manager.clear()
+            api_client.close()
+        except Exception as e:
+            logger.debug(f"Failed to close idle ApiClient: {e}")
+
+
+def _evict_api_client(key: Tuple[str, Optional[str]]):
+    """Drop a pooled ApiClient so the next load rebuilds it"""
+    with _api_client_pool_lock:
+        _api_client_pool.pop(key, None)
+
+
+# Executor the async routers use to run blocking connector calls off the
+# event loop, instead of sharing the default executor with everything else.
+# Each in-flight call holds at most one connection from its client's
+# urllib3 pool (API_CLIENT_CONNECTIONS per pooled ApiClient).
+K8S_EXECUTOR_MAX_WORKERS = API_CLIENT_CONNECTIONS
+k8s_executor = ThreadPoolExecutor(max_workers=K8S_EXECUTOR_MAX_WORKERS, thread_name_prefix="k8s-call")
+
+# Shared pool for overlapping independent API server reads within one call
+K8S_IO_MAX_WORKERS = 8
+_k8s_io_pool = ThreadPoolExecutor(max_workers=K8S_IO_MAX_WORKERS, thread_name_prefix="k8s-io")
+
+
+# apply_yaml: max concurrent creates, and kinds applied first, in order
+APPLY_MAX_WORKERS = 16
+APPLY_FIRST_KINDS = frozenset({"Namespace", "CustomResourceDefinition"})
+
+# Parsed apply_yaml bundles, keyed by content digest (LRU)
+PARSED_MANIFEST_CACHE_SIZE = 64
+_parsed_manifests: "OrderedDict[bytes, Tuple[Any, ...]]" = OrderedDict()
+_parsed_manifests_lock = threading.Lock()
+
+# Label carried by every Deployment of the Kyverno chart / install.yaml
+KYVERNO_DEPLOYMENT_SELECTOR = "app.kubernetes.io/part-of=kyverno"
+
+# Release states `helm list` shows without --all
+HELM_LISTED_RELEASE_STATUSES = frozenset({"deployed", "failed"})
+
+# HELM_DRIVER values that keep releases in Secrets (helm's default)
+HELM_SECRET_DRIVERS = frozenset({"", "secret", "secrets"})
+
+# Short-lived kubeconfig files for helm go to tmpfs when there is one
+HELM_TEMP_DIR: Optional[str] = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
+
+
+def _decode_helm_release(encoded: str) -> Dict[str, Any]:
+    """
+    Decode a Helm 3 release from its storage Secret's `release` field.
+    
+    Helm stores gzipped release JSON, base64 encoded, as the Secret value,
+    so the API's base64 wraps it a second time. The result has the same
+    shape as `helm status --output json`.
+    """
+    payload = base64.b64decode(base64.b64decode(encoded))
+    if payload[:2] == b"\x1f\x8b":
+        payload = gzip.decompress(payload)
+    return json.loads(payload)
+
+
+# Accept header asking the API server for metadata-only list items
+PARTIAL_METADATA_LIST_ACCEPT = (
+    "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+)
+
+KYVERNO_NAME_RE = re.compile("kyverno", re.IGNORECASE)
+
+# Listed in this order when looking for Kyverno's webhooks
+WEBHOOK_CONFIGURATION_PATHS = {
+    "validating": "/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations",
+    "mutating": "/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations",
+}
+
+# Page size for Kyverno policy LIST calls
+KYVERNO_LIST_PAGE_SIZE = 500
+
+# Shared read-only stand-in for a missing spec
+EMPTY_SPEC = MappingProxyType({})
+
+# TTLs for read-mostly cluster lookups (seconds)
+NAMESPACES_CACHE_TTL_SECONDS = 5
+CLUSTER_VERSION_CACHE_TTL_SECONDS = 300
+CLUSTER_NODES_CACHE_TTL_SECONDS = 10
+POLICY_SCOPES_CACHE_TTL_SECONDS = 60
+KYVERNO_STATUS_CACHE_TTL_SECONDS = 30
+WEBHOOKS_CACHE_TTL_SECONDS = 60
+KYVERNO_STATUS_READS = ("kyverno_installed", "kyverno_status", "kyverno_webhooks", "namespaces")
+CLUSTER_READ_CACHE_MAX_SIZE = 64
+
+# (cluster key, lookup name) -> (expires_at, value)
+_cluster_reads: Dict[Tuple[Any, str], Tuple[float, Any]] = {}
+_cluster_reads_lock = threading.Lock()
+
+
+def _peek_cluster_read(cluster_key: Any, name: str) -> Any:
+    """Return a fresh cached lookup for a cluster, or None"""
+    if cluster_key is None:
+        return None
+    with _cluster_reads_lock:
+        entry = _cluster_reads.get((cluster_key, name))
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _store_cluster_read(cluster_key: Any, name: str, ttl: float, value: Any):
+    """Cache a lookup for a cluster for `ttl` seconds"""
+    if cluster_key is None:
+        return
+    now = time.monotonic()
+    with _cluster_reads_lock:
+        if len(_cluster_reads) >= CLUSTER_READ_CACHE_MAX_SIZE:
+            for stale in [k for k, (expires, _) in _cluster_reads.items() if expires <= now]:
+                del _cluster_reads[stale]
+            if len(_cluster_reads) >= CLUSTER_READ_CACHE_MAX_SIZE:
+                del _cluster_reads[next(iter(_cluster_reads))]
+        _cluster_reads[(cluster_key, name)] = (now + ttl, value)
+
+
+def _cached_cluster_read(cluster_key: Any, name: str, ttl: float, fetch):
+    """
+    Return fetch() for a cluster, reusing the value for `ttl` seconds.
+    
+    Without a cluster key (nothing identifies the connection) fetch() is
+    always called.
+    """
+    if cluster_key is None:
+        return fetch()
+    
+    value = _peek_cluster_read(cluster_key, name)
+    if value is None:
+        value = fetch()
+        _store_cluster_read(cluster_key, name, ttl, value)
+    return value
+
+
+def _forget_cluster_reads(cluster_key: Any, *names: str):
+    """Drop cached lookups for a cluster key (all of them without `names`)"""
+    with _cluster_reads_lock:
+        for key in [k for k in _cluster_reads if k[0] == cluster_key]:
+            if not names or key[1] in names:
+                del _cluster_reads[key]
+
+
+def _discard_response(response: urllib3.HTTPResponse):
+    """Read and drop an unparsed response so its connection returns to the pool"""
+    response.drain_conn()
+    response.release_conn()
+
 
 class K8sConnector:
     """
@@ -28,9 +368,17 @@ class K8sConnector:
     
     def __init__(self):
         self._api_client: Optional[client.ApiClient] = None
+        # API handles bound to _api_client (see _set_api_client)
+        self._core_v1: Optional[client.CoreV1Api] = None
+        self._apps_v1: Optional[client.AppsV1Api] = None
+        self._custom: Optional[client.CustomObjectsApi] = None
+        self._version: Optional[client.VersionApi] = None
         self._current_kubeconfig: Optional[str] = None
         self._current_context: Optional[str] = None
-        self._temp_kubeconfig: Optional[str] = None
+        # Kubeconfig given as content; only written to disk for helm
+        self._kubeconfig_content: Optional[str] = None
+        # Identifies the cluster/credentials for the short-lived read caches
+        self._cache_key: Optional[Tuple[str, Optional[str]]] = None
     
     def load_cluster_from_content(
         self, 
@@ -54,42 +402,32 @@ class K8sConnector:
         if not kubeconfig_content or not kubeconfig_content.strip():
             raise ValueError("Kubeconfig content cannot be empty")
         
-        # Clean up previous temp file if exists
-        if self._temp_kubeconfig and os.path.exists(self._temp_kubeconfig):
-            try:
-                os.remove(self._temp_kubeconfig)
-            except Exception as e:
-                logger.warning(f"Failed to remove temp kubeconfig: {e}")
+        cache_key = (
+            hashlib.sha256(kubeconfig_content.encode("utf-8")).hexdigest(),
+            context,
+        )
+        
+        def _load_config(configuration: client.Configuration):
+            # Parsed in memory; nothing is written to disk
+            config.load_kube_config_from_dict(
+                yaml.load(kubeconfig_content, Loader=YamlSafeLoader),
+                context=context,
+                client_configuration=configuration,
+            )
         
-        # Create a temporary file to store kubeconfig content
-        temp_fd, temp_path = tempfile.mkstemp(suffix=".yaml", prefix="kubeconfig_")
         try:
-            # Write content to temp file
-            with os.fdopen(temp_fd, 'w') as f:
-                f.write(kubeconfig_content)
-            
-            # Load the kubeconfig from temp file
-            config.load_kube_config(config_file=temp_path, context=context)
-            
-            # Set API timeout for faster responses
-            # Tuple = (connect_timeout, read_timeout) for urllib3
-            configuration = client.Configuration.get_default_copy()
-            configuration.timeout = (5.0, 15.0)  # 5s connect, 15s read
-            
-            self._api_client = client.ApiClient(configuration)
-            self._current_kubeconfig = temp_path
-            self._temp_kubeconfig = temp_path
-            self._current_context = context
-            
-            return self._api_client
-            
+            # Reuse the pooled client for this kubeconfig/context
+            api_client = _pooled_api_client(cache_key, _load_config)
         except Exception as e:
-            # Clean up temp file on error
-            try:
-                os.remove(temp_path)
-            except:
-                pass
             raise ValueError(f"Failed to load kubeconfig: {str(e)}")
+        
+        self._set_api_client(api_client)
+        self._current_kubeconfig = None
+        self._kubeconfig_content = kubeconfig_content
+        self._current_context = context
+        self._cache_key = cache_key
+        
+        return self._api_client
     
     def load_cluster(
         self, 
@@ -108,42 +446,101 @@ class K8sConnector:
             kubernetes.client.ApiClient instance
             
         Raises:
-            FileNotFoundError: If kubeconfig file doesn't exist
+            FileNotFoundError: If kubeconfig file doesn't exist or is unreadable
             kubernetes.config.ConfigException: If config is invalid
         """
-        # Validate kubeconfig path
-        if not os.path.exists(kubeconfig_path):
-            raise FileNotFoundError(f"Kubeconfig file not found: {kubeconfig_path}")
-        
-        # Load the kubeconfig
-        config.load_kube_config(config_file=kubeconfig_path, context=context)
+        # Key the pooled client on the file's content, not its path
+        try:
+            with open(kubeconfig_path, "rb") as f:
+                cache_key = (hashlib.sha256(f.read()).hexdigest(), context)
+        except OSError as e:
+            raise FileNotFoundError(
+                f"Kubeconfig file not found or unreadable: {kubeconfig_path}"
+            ) from e
+        
+        def _load_config(configuration: client.Configuration):
+            config.load_kube_config(
+                config_file=kubeconfig_path,
+                context=context,
+                client_configuration=configuration,
+            )
         
-        self._api_client = client.ApiClient()
+        self._set_api_client(_pooled_api_client(cache_key, _load_config))
         self._current_kubeconfig = kubeconfig_path
+        self._kubeconfig_content = None
         self._current_context = context
+        self._cache_key = cache_key
         
         return self._api_client
     
-    def cleanup(self):
-        """Clean up temporary files"""
-        if self._temp_kubeconfig and os.path.exists(self._temp_kubeconfig):
-            try:
-                os.remove(self._temp_kubeconfig)
-                self._temp_kubeconfig = None
-            except Exception as e:
-                logger.warning(f"Failed to clean up temp kubeconfig: {e}")
+    def _set_api_client(self, api_client: Optional[client.ApiClient]):
+        """Bind the connector (and its reusable API handles) to an ApiClient"""
+        self._api_client = api_client
+        if api_client is None:
+            self._core_v1 = self._apps_v1 = self._custom = self._version = None
+        else:
+            self._core_v1 = client.CoreV1Api(api_client)
+            self._apps_v1 = client.AppsV1Api(api_client)
+            self._custom = client.CustomObjectsApi(api_client)
+            self._version = client.VersionApi(api_client)
+    
+    def use_api_client(self, api_client: client.ApiClient) -> client.ApiClient:
+        """
+        Attach an already configured ApiClient (e.g. from get_token_api_client).
+        
+        Helm operations are unavailable in this mode since there is no
+        kubeconfig file on disk.
+        """
+        self._set_api_client(api_client)
+        self._current_kubeconfig = None
+        self._kubeconfig_content = None
+        self._current_context = None
+        # Keyed on an id stamped on the client, not id(): once a client is
+        # dropped (token client LRU, clear_token_api_clients) a client for
+        # another cluster can get the same id() and its cached reads
+        read_cache_id = getattr(api_client, "_read_cache_id", None)
+        if read_cache_id is None:
+            read_cache_id = api_client._read_cache_id = uuid.uuid4().hex
+        self._cache_key = (f"api-client:{read_cache_id}", None)
+        return self._api_client
     
-    def __del__(self):
-        """Destructor to clean up temp files"""
-        self.cleanup()
+    @contextlib.contextmanager
+    def _helm_kubeconfig(self) -> Iterator[Optional[str]]:
+        """
+        Path to pass to helm's --kubeconfig for the duration of one command,
+        or None without a kubeconfig.
+        
+        Content-loaded kubeconfigs are written to a temp file (on tmpfs where
+        available) that is removed as soon as the block exits.
+        """
+        if self._current_kubeconfig or self._kubeconfig_content is None:
+            yield self._current_kubeconfig
+            return
+        
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".yaml", prefix="kubeconfig_", dir=HELM_TEMP_DIR, delete=True
+        ) as f:
+            f.write(self._kubeconfig_content)
+            f.flush()
+            yield f.name
     
     def get_api_client(self) -> Optional[client.ApiClient]:
         """Get the current API client"""
         return self._api_client
     
-    def list_namespaces(self) -> List[str]:
+    def get_custom_objects_api(self) -> Optional[client.CustomObjectsApi]:
+        """Get the CustomObjectsApi bound to the current API client"""
+        return self._custom
+    
+    def list_namespaces(self, use_cache: bool = True) -> List[str]:
         """
-        List all namespaces in the connected cluster.
+        List the active namespaces in the connected cluster.
+        
+        Namespaces being deleted (phase Terminating) are left out. Results
+        are reused for NAMESPACES_CACHE_TTL_SECONDS per cluster.
+        
+        Args:
+            use_cache: Set False to always query the API server (e.g. probes)
         
         Returns:
             List of namespace names
@@ -155,78 +552,125 @@ class K8sConnector:
         if not self._api_client:
             raise RuntimeError("Not connected to any cluster. Call load_cluster first.")
         
-        v1 = client.CoreV1Api(self._api_client)
-        namespaces = v1.list_namespace()
+        def _fetch():
+            return self._list_names("/api/v1/namespaces", field_selector="status.phase=Active")
         
-        return [ns.metadata.name for ns in namespaces.items]
+        return list(_cached_cluster_read(
+            self._cache_key if use_cache else None,
+            "namespaces",
+            NAMESPACES_CACHE_TTL_SECONDS,
+            _fetch,
+        ))
+    
+    def _list_names(self, path: str, field_selector: Optional[str] = None) -> List[str]:
+        """
+        Names of the objects listed at an API path.
+        
+        Only metadata is requested, and the list is served from the API
+        server's watch cache (resourceVersion=0) rather than read from etcd.
+        """
+        query_params = [("resourceVersion", "0")]
+        if field_selector:
+            query_params.append(("fieldSelector", field_selector))
+        response = self._api_client.call_api(
+            path, "GET",
+            query_params=query_params,
+            header_params={"Accept": PARTIAL_METADATA_LIST_ACCEPT},
+            auth_settings=["BearerToken"],
+            _preload_content=False,
+            _return_http_data_only=True,
+        )
+        items = json.loads(response.data).get("items") or []
+        return [item["metadata"]["name"] for item in items]
     
     def get_cluster_info(self) -> Dict[str, Any]:
         """
         Get information about the connected cluster.
         
+        The version (rarely changes) and node list are cached separately,
+        for CLUSTER_VERSION_CACHE_TTL_SECONDS and CLUSTER_NODES_CACHE_TTL_SECONDS.
+        
         Returns:
             Dictionary containing cluster information
         """
         if not self._api_client:
             raise RuntimeError("Not connected to any cluster. Call load_cluster first.")
         
-        v1 = client.CoreV1Api(self._api_client)
-        version_api = client.VersionApi(self._api_client)
+        def _fetch_version():
+            version_info = self._version.get_code()
+            return version_info.git_version, version_info.platform
         
-        # Get cluster version
-        version_info = version_api.get_code()
-        
-        # Get node count
-        nodes = v1.list_node()
-        
-        return {
-            "kubernetes_version": version_info.git_version,
-            "platform": version_info.platform,
-            "node_count": len(nodes.items),
-            "nodes": [
+        def _fetch_nodes():
+            # Conditions aren't in metadata-only lists, so fetch full nodes
+            # from the watch cache but skip the client's model deserializer
+            response = self._core_v1.list_node(resource_version="0", _preload_content=False)
+            nodes = json.loads(response.data)
+            return [
                 {
-                    "name": node.metadata.name,
+                    "name": node["metadata"]["name"],
                     "status": self._get_node_status(node),
                 }
-                for node in nodes.items
-            ],
+                for node in nodes.get("items") or []
+            ]
+        
+        # Get cluster version in the background while listing nodes here
+        version_future = _k8s_io_pool.submit(
+            _cached_cluster_read,
+            self._cache_key, "version", CLUSTER_VERSION_CACHE_TTL_SECONDS, _fetch_version
+        )
+        nodes = _cached_cluster_read(
+            self._cache_key, "nodes", CLUSTER_NODES_CACHE_TTL_SECONDS, _fetch_nodes
+        )
+        git_version, platform = version_future.result()
+        
+        return {
+            "kubernetes_version": git_version,
+            "platform": platform,
+            "node_count": len(nodes),
+            "nodes": [dict(node) for node in nodes],
             "kubeconfig": self._current_kubeconfig,
             "context": self._current_context,
         }
     
-    def _get_node_status(self, node) -> str:
-        """Extract node status from conditions"""
-        for condition in node.status.conditions:
-            if condition.type == "Ready":
-                return "Ready" if condition.status == "True" else "NotReady"
+    def _get_node_status(self, node: Dict[str, Any]) -> str:
+        """Extract node status from conditions (raw Node JSON)"""
+        for condition in (node.get("status") or {}).get("conditions") or []:
+            if condition.get("type") == "Ready":
+                return "Ready" if condition.get("status") == "True" else "NotReady"
         return "Unknown"
     
     def check_kyverno_installed(self) -> Tuple[bool, Optional[str]]:
         """
         Check if Kyverno is installed in the cluster.
         
+        The answer is reused for KYVERNO_STATUS_CACHE_TTL_SECONDS per cluster.
+        
         Returns:
             Tuple of (is_installed, version)
         """
         if not self._api_client:
             raise RuntimeError("Not connected to any cluster. Call load_cluster first.")
         
-        apps_v1 = client.AppsV1Api(self._api_client)
-        
+        return _cached_cluster_read(
+            self._cache_key,
+            "kyverno_installed",
+            KYVERNO_STATUS_CACHE_TTL_SECONDS,
+            self._probe_kyverno_installed,
+        )
+    
+    def _probe_kyverno_installed(self) -> Tuple[bool, Optional[str]]:
+        """Look for Kyverno's deployments (uncached check_kyverno_installed)"""
         try:
-            # Check for Kyverno deployment in kyverno namespace
-            deployments = apps_v1.list_namespaced_deployment(namespace="kyverno")
-            
-            for dep in deployments.items:
-                if "kyverno" in dep.metadata.name:
-                    # Try to extract version from image tag
-                    containers = dep.spec.template.spec.containers
-                    for container in containers:
-                        if "kyverno" in container.image:
-                            image_parts = container.image.split(":")
-                            version = image_parts[1] if len(image_parts) > 1 else "unknown"
-                            return True, version
-                    return True, "unknown"
+            # Check for Kyverno deployments in kyverno namespace
+            for dep in self._list_kyverno_deployments("kyverno"):
+                # Try to extract version from image tag
+                for container in dep["spec"]["template"]["spec"].get("containers") or []:
+                    image = container.get("image") or ""
+                    if "kyverno" in image:
+                        image_parts = image.split(":")
+                        version = image_parts[1] if len(image_parts) > 1 else "unknown"
+                        return True, version
+                return True, "unknown"
             
             return False, None
             
@@ -235,154 +679,258 @@ class K8sConnector:
                 return False, None
             raise
     
-    def apply_yaml(self, yaml_content: str, namespace: str = "default") -> Dict[str, Any]:
+    def _list_kyverno_deployments(self, namespace: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Apply a YAML manifest to the cluster.
+        List Kyverno's Deployments in a namespace as raw JSON.
         
-        Args:
-            yaml_content: YAML content as string
-            namespace: Target namespace
-            
-        Returns:
-            Dictionary with result information
+        The API server filters by label, and the response is decoded with
+        json rather than into client models (only a few fields are read).
         """
-        import yaml
-        
-        if not self._api_client:
-            raise RuntimeError("Not connected to any cluster. Call load_cluster first.")
-        
-        # Parse YAML
-        manifests = list(yaml.safe_load_all(yaml_content))
-        results = []
+        kwargs: Dict[str, Any] = {"limit": limit} if limit else {}
+        response = self._apps_v1.list_namespaced_deployment(
+            namespace=namespace,
+            label_selector=KYVERNO_DEPLOYMENT_SELECTOR,
+            _preload_content=False,
+            **kwargs,
+        )
+        return json.loads(response.data).get("items") or []
+    
+    @staticmethod
+    def _parse_manifests(content: str) -> Tuple[Any, ...]:
+        """
+        Parse a (possibly multi-document) manifest string.
         
-        for manifest in manifests:
-            if manifest is None:
-                continue
-            
+        A single JSON object is decoded with json; anything else (or JSON
+        that fails to decode) goes through the C YAML loader when available.
+        Results are cached by content digest and shared, so callers must
+        not mutate the returned documents.
+        """
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        with _parsed_manifests_lock:
+            documents = _parsed_manifests.get(digest)
+            if documents is not None:
+                _parsed_manifests.move_to_end(digest)
+                return documents
+        
+        documents = None
+        if content.lstrip().startswith("{"):
             try:
-                kind = manifest.get("kind", "")
-                api_version = manifest.get("apiVersion", "")
-                metadata = manifest.get("metadata", {})
-                name = metadata.get("name")
+                documents = (json.loads(content),)
+            except ValueError:
+                pass
+        if documents is None:
+            documents = tuple(yaml.load_all(content, Loader=YamlSafeLoader))
+        
+        with _parsed_manifests_lock:
+            _parsed_manifests[digest] = documents
+            if len(_parsed_manifests) > PARSED_MANIFEST_CACHE_SIZE:
+                _parsed_manifests.popitem(last=False)
+        return documents
+    
+    def _apply_manifest(self, manifest: Dict[str, Any], namespace: str) -> Dict[str, Any]:
+        """Create (or, for Kyverno policies, replace) one manifest; never raises"""
+        try:
+            kind = manifest.get("kind", "")
+            api_version = manifest.get("apiVersion", "")
+            metadata = manifest.get("metadata", {})
+            name = metadata.get("name")
+            
+            # Check if this is a Kyverno policy (custom resource)
+            if "kyverno.io" in api_version and kind in ["ClusterPolicy", "Policy"]:
+                custom_api = self._custom
                 
-                # Check if this is a Kyverno policy (custom resource)
-                if "kyverno.io" in api_version and kind in ["ClusterPolicy", "Policy"]:
-                    custom_api = client.CustomObjectsApi(self._api_client)
-                    
-                    # Extract group and version from apiVersion
-                    if "/" in api_version:
-                        group, version = api_version.split("/")
-                    else:
-                        group = api_version
-                        version = "v1"
-                    
-                    if kind == "ClusterPolicy":
-                        # Create ClusterPolicy (cluster-scoped)
-                        custom_api.create_cluster_custom_object(
-                            group=group,
-                            version=version,
-                            plural="clusterpolicies",
-                            body=manifest
-                        )
-                    else:
-                        # Create Policy (namespace-scoped)
-                        custom_api.create_namespaced_custom_object(
-                            group=group,
-                            version=version,
-                            namespace=namespace,
-                            plural="policies",
-                            body=manifest
-                        )
-                    
-                    results.append({
-                        "kind": kind,
-                        "name": name,
-                        "status": "created",
-                    })
+                # Extract group and version from apiVersion
+                if "/" in api_version:
+                    group, version = api_version.split("/")
                 else:
-                    # Use standard kubernetes utils for native resources
-                    from kubernetes import utils
-                    result = utils.create_from_dict(self._api_client, manifest, namespace=namespace)
-                    results.append({
-                        "kind": kind,
-                        "name": name,
-                        "status": "created",
-                    })
-                    
-            except ApiException as e:
-                # If resource already exists, try to update it
-                if e.status == 409:  # Conflict - resource already exists
-                    try:
-                        if "kyverno.io" in api_version and kind in ["ClusterPolicy", "Policy"]:
-                            custom_api = client.CustomObjectsApi(self._api_client)
-                            
-                            if "/" in api_version:
-                                group, version = api_version.split("/")
-                            else:
-                                group = api_version
-                                version = "v1"
-                            
-                            if kind == "ClusterPolicy":
-                                custom_api.replace_cluster_custom_object(
-                                    group=group,
-                                    version=version,
-                                    plural="clusterpolicies",
-                                    name=name,
-                                    body=manifest
-                                )
-                            else:
-                                custom_api.replace_namespaced_custom_object(
-                                    group=group,
-                                    version=version,
-                                    namespace=namespace,
-                                    plural="policies",
-                                    name=name,
-                                    body=manifest
-                                )
-                            
-                            results.append({
-                                "kind": kind,
-                                "name": name,
-                                "status": "updated",
-                            })
+                    group = api_version
+                    version = "v1"
+                
+                if kind == "ClusterPolicy":
+                    # Create ClusterPolicy (cluster-scoped)
+                    _discard_response(custom_api.create_cluster_custom_object(
+                        group=group,
+                        version=version,
+                        plural="clusterpolicies",
+                        body=manifest,
+                        _preload_content=False,
+                    ))
+                else:
+                    # Create Policy (namespace-scoped)
+                    _discard_response(custom_api.create_namespaced_custom_object(
+                        group=group,
+                        version=version,
+                        namespace=namespace,
+                        plural="policies",
+                        body=manifest,
+                        _preload_content=False,
+                    ))
+                
+                return {
+                    "kind": kind,
+                    "name": name,
+                    "status": "created",
+                }
+            else:
+                # Use standard kubernetes utils for native resources
+                from kubernetes import utils
+                result = utils.create_from_dict(self._api_client, manifest, namespace=namespace)
+                return {
+                    "kind": kind,
+                    "name": name,
+                    "status": "created",
+                }
+                
+        except ApiException as e:
+            # If resource already exists, try to update it
+            if e.status == 409:  # Conflict - resource already exists
+                try:
+                    if "kyverno.io" in api_version and kind in ["ClusterPolicy", "Policy"]:
+                        custom_api = self._custom
+                        
+                        if "/" in api_version:
+                            group, version = api_version.split("/")
+                        else:
+                            group = api_version
+                            version = "v1"
+                        
+                        if kind == "ClusterPolicy":
+                            _discard_response(custom_api.replace_cluster_custom_object(
+                                group=group,
+                                version=version,
+                                plural="clusterpolicies",
+                                name=name,
+                                body=manifest,
+                                _preload_content=False,
+                            ))
                         else:
-                            results.append({
-                                "kind": kind,
-                                "name": name,
-                                "status": "failed",
-                                "error": "Resource already exists",
-                            })
-                    except Exception as update_error:
-                        results.append({
+                            _discard_response(custom_api.replace_namespaced_custom_object(
+                                group=group,
+                                version=version,
+                                namespace=namespace,
+                                plural="policies",
+                                name=name,
+                                body=manifest,
+                                _preload_content=False,
+                            ))
+                        
+                        return {
+                            "kind": kind,
+                            "name": name,
+                            "status": "updated",
+                        }
+                    else:
+                        return {
                             "kind": kind,
                             "name": name,
                             "status": "failed",
-                            "error": f"Update failed: {str(update_error)}",
-                        })
-                else:
-                    results.append({
+                            "error": "Resource already exists",
+                        }
+                except Exception as update_error:
+                    return {
                         "kind": kind,
                         "name": name,
                         "status": "failed",
-                        "error": str(e),
-                    })
-            except Exception as e:
-                results.append({
-                    "kind": manifest.get("kind"),
-                    "name": manifest.get("metadata", {}).get("name"),
+                        "error": f"Update failed: {str(update_error)}",
+                    }
+            else:
+                return {
+                    "kind": kind,
+                    "name": name,
                     "status": "failed",
                     "error": str(e),
-                })
+                }
+        except Exception as e:
+            return {
+                "kind": manifest.get("kind"),
+                "name": manifest.get("metadata", {}).get("name"),
+                "status": "failed",
+                "error": str(e),
+            }
+    
+    def apply_yaml(self, yaml_content: str, namespace: str = "default") -> Dict[str, Any]:
+        """
+        Apply a YAML manifest to the cluster.
+        
+        Args:
+            yaml_content: YAML content as string
+            namespace: Target namespace
+            
+        Returns:
+            Dictionary with result information
+        """
+        if not self._api_client:
+            raise RuntimeError("Not connected to any cluster. Call load_cluster first.")
+        
+        return self.apply_manifests(self._parse_manifests(yaml_content), namespace=namespace)
+    
+    def apply_manifests(
+        self,
+        manifests: Iterable[Optional[Dict[str, Any]]],
+        namespace: str = "default",
+    ) -> Dict[str, Any]:
+        """
+        Apply already parsed manifests to the cluster (no YAML involved).
+        
+        Args:
+            manifests: Manifest dicts; None entries (empty documents) are skipped
+            namespace: Target namespace
+            
+        Returns:
+            Dictionary with result information
+        """
+        if not self._api_client:
+            raise RuntimeError("Not connected to any cluster. Call load_cluster first.")
+        
+        manifests = [m for m in manifests if m is not None]
         
-        return {"results": results}
+        try:
+            return {"results": self._apply_all(manifests, namespace)}
+        finally:
+            # Namespaces or Kyverno itself may have been created
+            self._forget_kyverno_status()
     
-    def delete_policy(self, name: str, namespace: str = "default") -> bool:
+    def _apply_all(self, manifests: List[Dict[str, Any]], namespace: str) -> List[Optional[Dict[str, Any]]]:
+        """Apply non-empty manifests, returning one result per manifest"""
+        if len(manifests) <= 1:
+            return [self._apply_manifest(m, namespace) for m in manifests]
+        
+        # Namespaces/CRDs first (later objects may depend on them), then the
+        # rest concurrently; results keep the manifest order.
+        results: List[Optional[Dict[str, Any]]] = [None] * len(manifests)
+        parallel = []
+        for index, manifest in enumerate(manifests):
+            if isinstance(manifest, dict) and manifest.get("kind") in APPLY_FIRST_KINDS:
+                results[index] = self._apply_manifest(manifest, namespace)
+            else:
+                parallel.append(index)
+        
+        workers = min(APPLY_MAX_WORKERS, len(parallel)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="k8s-apply") as executor:
+            applied = executor.map(
+                lambda index: self._apply_manifest(manifests[index], namespace),
+                parallel,
+            )
+            for index, result in zip(parallel, applied):
+                results[index] = result
+        
+        return results
+    
+    def delete_policy(
+        self,
+        name: str,
+        namespace: str = "default",
+        scope: Optional[str] = None,
+    ) -> bool:
         """
         Delete a Kyverno policy from the cluster.
         
         Args:
             name: Policy name
             namespace: Policy namespace (for namespaced policies)
+            scope: "cluster" or "namespaced" if known. Otherwise the scope
+                   seen by the last list_kyverno_policies() is used, then
+                   ClusterPolicy is assumed.
             
         Returns:
             True if deleted successfully
@@ -390,89 +938,154 @@ class K8sConnector:
         if not self._api_client:
             raise RuntimeError("Not connected to any cluster. Call load_cluster first.")
         
-        custom_api = client.CustomObjectsApi(self._api_client)
+        if scope is None:
+            scopes = _peek_cluster_read(self._cache_key, "policy_scopes") or {}
+            scope = scopes.get((namespace, name)) or scopes.get((None, name)) or "cluster"
+        fallback = "namespaced" if scope == "cluster" else "cluster"
         
         try:
-            # Try ClusterPolicy first
-            custom_api.delete_cluster_custom_object(
-                group="kyverno.io",
-                version="v1",
-                plural="clusterpolicies",
-                name=name,
-            )
+            self._delete_kyverno_policy(scope, name, namespace)
             return True
         except ApiException as e:
-            if e.status == 404:
-                # Try namespaced Policy
-                try:
-                    custom_api.delete_namespaced_custom_object(
-                        group="kyverno.io",
-                        version="v1",
-                        plural="policies",
-                        namespace=namespace,
-                        name=name,
-                    )
-                    return True
-                except ApiException:
-                    return False
-            raise
+            if e.status != 404:
+                raise
+        
+        logger.warning(
+            "Kyverno policy %s not found as %s policy; retrying as %s", name, scope, fallback
+        )
+        try:
+            self._delete_kyverno_policy(fallback, name, namespace)
+            return True
+        except ApiException:
+            return False
     
-    def list_kyverno_policies(self) -> Dict[str, List[Dict[str, Any]]]:
+    def delete_policies(self, policies: Iterable[Tuple[str, str, Optional[str]]]) -> List[Any]:
         """
-        List all Kyverno policies in the cluster.
+        Delete several Kyverno policies concurrently.
         
+        Args:
+            policies: (name, namespace, scope) tuples, as for delete_policy()
+            
         Returns:
-            Dictionary with cluster_policies and namespaced_policies
+            One entry per policy, in order: delete_policy()'s result, or the
+            exception it raised
         """
         if not self._api_client:
             raise RuntimeError("Not connected to any cluster. Call load_cluster first.")
         
-        custom_api = client.CustomObjectsApi(self._api_client)
-        result = {
-            "cluster_policies": [],
-            "namespaced_policies": [],
-        }
-        
-        try:
-            # Get ClusterPolicies
-            cluster_policies = custom_api.list_cluster_custom_object(
+        futures = [
+            _k8s_io_pool.submit(self.delete_policy, name, namespace, scope)
+            for name, namespace, scope in policies
+        ]
+        outcomes: List[Any] = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+    
+    def _delete_kyverno_policy(self, scope: str, name: str, namespace: str):
+        """Delete a ClusterPolicy (scope "cluster") or a namespaced Policy"""
+        if scope == "cluster":
+            self._custom.delete_cluster_custom_object(
                 group="kyverno.io",
                 version="v1",
                 plural="clusterpolicies",
+                name=name,
             )
-            result["cluster_policies"] = [
-                {
-                    "name": p["metadata"]["name"],
-                    "background": p.get("spec", {}).get("background", True),
-                    "validation_failure_action": p.get("spec", {}).get("validationFailureAction", "Audit"),
-                }
-                for p in cluster_policies.get("items", [])
-            ]
-        except ApiException as e:
-            if e.status != 404:
-                logger.warning(f"Failed to list ClusterPolicies: {e}")
-        
-        try:
-            # Get namespaced Policies from all namespaces
-            policies = custom_api.list_cluster_custom_object(
+        else:
+            self._custom.delete_namespaced_custom_object(
                 group="kyverno.io",
                 version="v1",
                 plural="policies",
+                namespace=namespace,
+                name=name,
             )
-            result["namespaced_policies"] = [
-                {
-                    "name": p["metadata"]["name"],
-                    "namespace": p["metadata"]["namespace"],
-                    "background": p.get("spec", {}).get("background", True),
-                    "validation_failure_action": p.get("spec", {}).get("validationFailureAction", "Audit"),
-                }
-                for p in policies.get("items", [])
-            ]
-        except ApiException as e:
-            if e.status != 404:
-                logger.warning(f"Failed to list Policies: {e}")
+    
+    def list_kyverno_policies(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List all Kyverno policies in the cluster.
         
-        return result
+        ClusterPolicies and namespaced Policies are listed concurrently.
+        
+        Returns:
+            Dictionary with cluster_policies and namespaced_policies
+        """
+        if not self._api_client:
+            raise RuntimeError("Not connected to any cluster. Call load_cluster first.")
+        
+        custom_api = self._custom
+        
+        def _cluster_policy_row(p: Dict[str, Any]) -> Dict[str, Any]:
+            spec = p.get("spec") or EMPTY_SPEC
+            return {
+                "name": p["metadata"]["name"],
+                "background": spec.get("background", True),
+                "validation_failure_action": spec.get("validationFailureAction", "Audit"),
+            }
+        
+        def _policy_row(p: Dict[str, Any]) -> Dict[str, Any]:
+            spec = p.get("spec") or EMPTY_SPEC
+            metadata = p["metadata"]
+            return {
+                "name": metadata["name"],
+                "namespace": metadata["namespace"],
+                "background": spec.get("background", True),
+                "validation_failure_action": spec.get("validationFailureAction", "Audit"),
+            }
+        
+        def _iter_items(plural: str) -> Iterator[Dict[str, Any]]:
+            # resource_version="0" lets the API server answer from its watch
+            # cache; raw JSON is decoded directly instead of via the client's
+            # model deserializer. Follow continue tokens if the server pages.
+            kwargs: Dict[str, Any] = {"resource_version": "0"}
+            while True:
+                response = custom_api.list_cluster_custom_object(
+                    group="kyverno.io",
+                    version="v1",
+                    plural=plural,
+                    limit=KYVERNO_LIST_PAGE_SIZE,
+                    _preload_content=False,
+                    _request_timeout=10,
+                    **kwargs,
+                )
+                page = json.loads(response.data)
+                yield from page.get("items") or ()
+                token = (page.get("metadata") or {}).get("continue")
+                if not token:
+                    return
+                kwargs = {"_continue": token}
+        
+        def _list(plural: str, label: str, row) -> List[Dict[str, Any]]:
+            # Project each item as it is read so only one raw page is held
+            try:
+                return [row(p) for p in _iter_items(plural)]
+            except ApiException as e:
+                if e.status != 404:
+                    logger.warning("Failed to list %s: %s", label, e)
+                return []
+        
+        # Get ClusterPolicies in the background, namespaced Policies here
+        cluster_future = _k8s_io_pool.submit(
+            _list, "clusterpolicies", "ClusterPolicies", _cluster_policy_row
+        )
+        namespaced_policies = _list("policies", "Policies", _policy_row)
+        cluster_policies = cluster_future.result()
+        
+        # Remember where each policy lives so delete_policy needs no probing
+        scopes = {(None, p["name"]): "cluster" for p in cluster_policies}
+        scopes.update(
+            ((p["namespace"], p["name"]), "namespaced") for p in namespaced_policies
+        )
+        _store_cluster_read(
+            self._cache_key, "policy_scopes", POLICY_SCOPES_CACHE_TTL_SECONDS, scopes
+        )
+        
+        return {
+            "cluster_policies": cluster_policies,
+            "namespaced_policies": namespaced_policies,
+        }
     
     def check_helm_installed(self) -> bool:
         """
@@ -517,6 +1130,8 @@ class K8sConnector:
             raise RuntimeError("Helm is not installed on this system. Please install Helm 3.x")
         
         helm = self._helm_bin()
+        if not self._current_kubeconfig and self._kubeconfig_content is None:
+            raise RuntimeError("Helm operations need a kubeconfig; connect with load_cluster_from_content")
 
         # Check if already installed
         if self.check_helm_release_exists(release_name, namespace):
@@ -524,28 +1139,14 @@ class K8sConnector:
                 f"Kyverno is already installed as release '{release_name}' in namespace '{namespace}'"
             )
         
-        # Add Kyverno Helm repository
-        logger.info("Adding Kyverno Helm repository...")
-        subprocess.run(
-            [helm, "repo", "add", "kyverno", "https://kyverno.github.io/kyverno/"],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        
-        # Update Helm repos
-        subprocess.run(
-            [helm, "repo", "update"],
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        # Add/refresh the Kyverno Helm repository (skipped if recently done)
+        logger.info("Ensuring Kyverno Helm repository...")
+        helm_utils.ensure_helm_repo(helm, "kyverno", "https://kyverno.github.io/kyverno/")
         
         # Prepare install command
         install_cmd = [
             helm, "install", release_name, "kyverno/kyverno",
             "--namespace", namespace,
-            "--kubeconfig", self._current_kubeconfig
         ]
         
         if self._current_context:
@@ -558,19 +1159,21 @@ class K8sConnector:
         if values:
             import tempfile
             with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                import yaml
-                yaml.dump(values, f)
+                yaml.dump(values, f, Dumper=YamlSafeDumper)
                 values_file = f.name
             install_cmd.extend(["-f", values_file])
         
         # Install Kyverno
         logger.info(f"Installing Kyverno in namespace '{namespace}'...")
-        result = subprocess.run(
-            install_cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minutes timeout
-        )
+        with self._helm_kubeconfig() as kubeconfig:
+            install_cmd.extend(["--kubeconfig", kubeconfig])
+            result = subprocess.run(
+                install_cmd,
+                capture_output=True,
+                text=True,
+                timeout=300  # 5 minutes timeout
+            )
+        self._forget_kyverno_status()
         
         # Clean up temp values file
         if values:
@@ -595,6 +1198,31 @@ class K8sConnector:
             "output": result.stdout
         }
     
+    def _helm_release_records(self, release_name: str, namespace: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read a release's Helm 3 storage Secrets (one per revision) as raw JSON.
+        
+        Returns None if they can't be read (not connected, no RBAC for
+        Secrets, API unreachable) or helm stores releases elsewhere
+        (HELM_DRIVER=configmap/sql/memory), in which case callers fall back
+        to the helm CLI.
+        """
+        if not self._api_client:
+            return None
+        if os.environ.get("HELM_DRIVER", "").lower() not in HELM_SECRET_DRIVERS:
+            return None
+        try:
+            response = self._core_v1.list_namespaced_secret(
+                namespace,
+                label_selector=f"owner=helm,name={release_name}",
+                _preload_content=False,
+                _request_timeout=10,
+            )
+        except (ApiException, urllib3.exceptions.HTTPError, OSError) as e:
+            logger.debug(f"Cannot read Helm release secrets in {namespace}: {e}")
+            return None
+        return json.loads(response.data).get("items") or []
+    
     def check_helm_release_exists(self, release_name: str, namespace: str) -> bool:
         """
         Check if a Helm release exists.
@@ -606,35 +1234,48 @@ class K8sConnector:
         Returns:
             True if release exists
         """
-        if not self._current_kubeconfig:
-            return False
+        records = self._helm_release_records(release_name, namespace)
+        if records is not None:
+            # Same releases `helm list` shows by default
+            return any(
+                (r["metadata"].get("labels") or {}).get("status") in HELM_LISTED_RELEASE_STATUSES
+                for r in records
+            )
         
-        try:
-            helm = helm_utils.HELM_BIN or helm_utils.find_helm() or "helm"
-            cmd = [
-                helm, "list",
-                "--namespace", namespace,
-                "--filter", release_name,
-                "--kubeconfig", self._current_kubeconfig,
-                "--output", "json"
-            ]
+        with self._helm_kubeconfig() as kubeconfig:
+            if not kubeconfig:
+                return False
             
-            if self._current_context:
-                cmd.extend(["--kube-context", self._current_context])
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            try:
+                helm = helm_utils.HELM_BIN or helm_utils.find_helm() or "helm"
+                cmd = [
+                    helm, "list",
+                    "--namespace", namespace,
+                    "--filter", release_name,
+                    "--kubeconfig", kubeconfig,
+                    "--output", "json"
+                ]
+                
+                if self._current_context:
+                    cmd.extend(["--kube-context", self._current_context])
+                
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                return False
+        
+        try:
             
             if result.returncode == 0 and result.stdout:
                 releases = json.loads(result.stdout)
                 return len(releases) > 0
             
             return False
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+        except json.JSONDecodeError:
             return False
     
     def get_helm_release_status(self, release_name: str, namespace: str) -> Optional[Dict[str, Any]]:
@@ -648,33 +1289,51 @@ class K8sConnector:
         Returns:
             Dictionary with release status or None if not found
         """
-        if not self._current_kubeconfig:
-            raise RuntimeError("Not connected to any cluster")
-        
-        try:
-            helm = helm_utils.HELM_BIN or helm_utils.find_helm() or "helm"
-            cmd = [
-                helm, "status", release_name,
-                "--namespace", namespace,
-                "--kubeconfig", self._current_kubeconfig,
-                "--output", "json"
-            ]
-            
-            if self._current_context:
-                cmd.extend(["--kube-context", self._current_context])
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
+        records = self._helm_release_records(release_name, namespace)
+        if records is not None:
+            if not records:
+                return None
+            latest = max(
+                records,
+                key=lambda r: int((r["metadata"].get("labels") or {}).get("version") or 0),
             )
+            try:
+                return _decode_helm_release((latest.get("data") or {})["release"])
+            except (KeyError, ValueError, OSError) as e:
+                logger.warning(f"Failed to decode Helm release {release_name}: {e}")
+                return None
+        
+        with self._helm_kubeconfig() as kubeconfig:
+            if not kubeconfig:
+                raise RuntimeError("Not connected to any cluster")
             
+            try:
+                helm = helm_utils.HELM_BIN or helm_utils.find_helm() or "helm"
+                cmd = [
+                    helm, "status", release_name,
+                    "--namespace", namespace,
+                    "--kubeconfig", kubeconfig,
+                    "--output", "json"
+                ]
+                
+                if self._current_context:
+                    cmd.extend(["--kube-context", self._current_context])
+                
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
+                return None
+        
+        try:
             if result.returncode == 0:
                 return json.loads(result.stdout)
             
             return None
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, subprocess.CalledProcessError, FileNotFoundError):
+        except json.JSONDecodeError:
             return None
     
     def uninstall_kyverno_helm(self, release_name: str = "kyverno", namespace: str = "kyverno") -> Dict[str, Any]:
@@ -688,7 +1347,7 @@ class K8sConnector:
         Returns:
             Dictionary with uninstall result
         """
-        if not self._current_kubeconfig:
+        if not self._current_kubeconfig and self._kubeconfig_content is None:
             raise RuntimeError("Not connected to any cluster")
         
         if not self.check_helm_release_exists(release_name, namespace):
@@ -701,18 +1360,20 @@ class K8sConnector:
         cmd = [
             helm, "uninstall", release_name,
             "--namespace", namespace,
-            "--kubeconfig", self._current_kubeconfig
         ]
         
         if self._current_context:
             cmd.extend(["--kube-context", self._current_context])
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        with self._helm_kubeconfig() as kubeconfig:
+            cmd.extend(["--kubeconfig", kubeconfig])
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=120
+            )
+        self._forget_kyverno_status()
         
         if result.returncode != 0:
             raise subprocess.CalledProcessError(
@@ -732,12 +1393,29 @@ class K8sConnector:
         """
         Comprehensive check for Kyverno installation with multiple methods.
         
+        The result is reused for KYVERNO_STATUS_CACHE_TTL_SECONDS per cluster.
+        
         Returns:
             Dictionary with detailed Kyverno status
         """
         if not self._api_client:
             raise RuntimeError("Not connected to any cluster")
         
+        result = _cached_cluster_read(
+            self._cache_key,
+            "kyverno_status",
+            KYVERNO_STATUS_CACHE_TTL_SECONDS,
+            self._probe_kyverno_comprehensive,
+        )
+        return dict(result)
+    
+    def _forget_kyverno_status(self):
+        """Drop cached Kyverno probes after an install, uninstall or apply"""
+        if self._cache_key:
+            _forget_cluster_reads(self._cache_key, *KYVERNO_STATUS_READS)
+    
+    def _probe_kyverno_comprehensive(self) -> Dict[str, Any]:
+        """Run every Kyverno check (uncached check_kyverno_comprehensive)"""
         result = {
             "installed": False,
             "version": None,
@@ -748,8 +1426,44 @@ class K8sConnector:
             "webhooks_configured": False,
         }
         
+        custom_api = self._custom
+        
+        def _list_deployments(ns: str):
+            try:
+                return self._list_kyverno_deployments(ns, limit=10)
+            except ApiException as e:
+                if e.status != 404:
+                    logger.warning(f"Error checking namespace {ns}: {e}")
+                return []
+        
+        def _crds_available() -> bool:
+            try:
+                # Listing ClusterPolicies works if the CRDs are installed
+                custom_api.list_cluster_custom_object(
+                    group="kyverno.io",
+                    version="v1",
+                    plural="clusterpolicies",
+                    limit=1,
+                    resource_version="0",
+                )
+                return True
+            except ApiException as e:
+                if e.status != 404:
+                    logger.warning(f"Error checking Kyverno CRDs: {e}")
+                return False
+        
+        # The probes are independent, so issue them together; the
+        # kyverno-system and webhook lookups are speculative and only used
+        # if the earlier checks call for them
+        helm_future = _k8s_io_pool.submit(self.get_helm_release_status, "kyverno", "kyverno")
+        deployment_futures = {
+            ns: _k8s_io_pool.submit(_list_deployments, ns) for ns in ("kyverno", "kyverno-system")
+        }
+        crds_future = _k8s_io_pool.submit(_crds_available)
+        webhooks_future = _k8s_io_pool.submit(self._kyverno_webhooks_configured)
+        
         # Method 1: Check via Helm
-        helm_status = self.get_helm_release_status("kyverno", "kyverno")
+        helm_status = helm_future.result()
         if helm_status:
             result["helm_release"] = {
                 "name": helm_status.get("name"),
@@ -760,101 +1474,154 @@ class K8sConnector:
             result["installed"] = True
             result["namespace"] = "kyverno"
         
-        # Method 2: Check deployments (check only kyverno namespace first)
-        apps_v1 = client.AppsV1Api(self._api_client)
-        v1 = client.CoreV1Api(self._api_client)
-        
-        # Start with most common namespace
+        # Method 2: Check deployments (kyverno namespace first)
         namespaces_to_check = ["kyverno"] if not result["installed"] else [result["namespace"]]
         if not result["installed"]:
             namespaces_to_check.append("kyverno-system")
         
         for ns in namespaces_to_check:
-            try:
-                deployments = apps_v1.list_namespaced_deployment(namespace=ns, limit=10)
-                for dep in deployments.items:
-                    if "kyverno" in dep.metadata.name:
-                        result["installed"] = True
-                        result["namespace"] = ns
-                        
-                        # Extract version from image
-                        for container in dep.spec.template.spec.containers:
-                            if "kyverno" in container.image:
-                                image_parts = container.image.split(":")
-                                if len(image_parts) > 1:
-                                    result["version"] = image_parts[1]
-                        
-                        # Get deployment status
-                        result["deployment_status"][dep.metadata.name] = {
-                            "ready_replicas": dep.status.ready_replicas or 0,
-                            "replicas": dep.status.replicas or 0,
-                            "available": dep.status.available_replicas or 0,
-                        }
-                        break  # Found Kyverno, no need to check more deployments
-                if result["installed"]:
-                    break  # Found in this namespace, skip other namespaces
-            except ApiException as e:
-                if e.status != 404:
-                    logger.warning(f"Error checking namespace {ns}: {e}")
+            for dep in deployment_futures[ns].result():
+                result["installed"] = True
+                result["namespace"] = ns
+                
+                # Extract version from image
+                for container in dep["spec"]["template"]["spec"].get("containers") or []:
+                    image = container.get("image") or ""
+                    if "kyverno" in image:
+                        image_parts = image.split(":")
+                        if len(image_parts) > 1:
+                            result["version"] = image_parts[1]
+                
+                # Get deployment status
+                status = dep.get("status") or {}
+                result["deployment_status"][dep["metadata"]["name"]] = {
+                    "ready_replicas": status.get("readyReplicas") or 0,
+                    "replicas": status.get("replicas") or 0,
+                    "available": status.get("availableReplicas") or 0,
+                }
+                break  # Found Kyverno, no need to check more deployments
+            if result["installed"]:
+                break  # Found in this namespace, skip other namespaces
         
         # Method 3: Check for Kyverno API resources (CRDs)
-        try:
-            custom_api = client.CustomObjectsApi(self._api_client)
-            # Try to list ClusterPolicies (this will work if CRDs are installed)
-            custom_api.list_cluster_custom_object(
-                group="kyverno.io",
-                version="v1",
-                plural="clusterpolicies",
-                limit=1
-            )
-            result["api_resources_available"] = True
-        except ApiException as e:
-            if e.status != 404:
-                logger.warning(f"Error checking Kyverno CRDs: {e}")
+        result["api_resources_available"] = crds_future.result()
         
         # Method 4: Check for webhooks (only if Kyverno is installed)
         if result["installed"]:
             try:
-                admissionreg_v1 = client.AdmissionregistrationV1Api(self._api_client)
-                
-                # Check validating webhooks (limit results)
-                validating_webhooks = admissionreg_v1.list_validating_webhook_configuration(limit=20)
-                for webhook in validating_webhooks.items:
-                    if "kyverno" in webhook.metadata.name.lower():
-                        result["webhooks_configured"] = True
-                        break
-                
-                # Check mutating webhooks if not found yet
-                if not result["webhooks_configured"]:
-                    mutating_webhooks = admissionreg_v1.list_mutating_webhook_configuration(limit=20)
-                    for webhook in mutating_webhooks.items:
-                        if "kyverno" in webhook.metadata.name.lower():
-                            result["webhooks_configured"] = True
-                            break
+                result["webhooks_configured"] = webhooks_future.result()
             except ApiException as e:
                 logger.warning(f"Error checking webhooks: {e}")
         
         return result
     
+    def _kyverno_webhooks_configured(self) -> bool:
+        """
+        Whether any admission webhook configuration belongs to Kyverno.
+        
+        Webhook configurations only change when Kyverno is (un)installed, so
+        the answer is shared per cluster for WEBHOOKS_CACHE_TTL_SECONDS.
+        """
+        def _fetch() -> bool:
+            # Validating webhooks first; the mutating ones are only listed
+            # if none of those matched
+            names = itertools.chain.from_iterable(
+                self._list_names(path) for path in WEBHOOK_CONFIGURATION_PATHS.values()
+            )
+            return any(KYVERNO_NAME_RE.search(name) for name in names)
+        
+        return _cached_cluster_read(
+            self._cache_key, "kyverno_webhooks", WEBHOOKS_CACHE_TTL_SECONDS, _fetch
+        )
+    
+    def invalidate_cache(self):
+        """
+        Drop cached namespace/cluster-info lookups and the pooled ApiClient
+        for the current cluster.
+        """
+        if self._cache_key:
+            _forget_cluster_reads(self._cache_key)
+            _evict_api_client(self._cache_key)
+    
     def disconnect(self):
-        """Disconnect from the current cluster"""
-        if self._api_client:
-            self._api_client.close()
-        self._api_client = None
+        """
+        Disconnect from the current cluster.
+        
+        The ApiClient and cached lookups are shared with other connectors for
+        the same cluster, so this only releases this connector's references;
+        call invalidate_cache() first to drop them as well.
+        """
+        self._set_api_client(None)
         self._current_kubeconfig = None
+        self._kubeconfig_content = None
         self._current_context = None
+        self._cache_key = None
 
 
 # Session-based K8s connection management
-import uuid
-from datetime import datetime, timedelta
-from typing import Tuple
+from datetime import datetime
 
-# Store K8s connectors by session ID with timestamp
-_k8s_sessions: Dict[str, Tuple[K8sConnector, datetime]] = {}
+# Store K8s connectors by session ID with last access (time.monotonic(),
+# for expiry) and creation time (wall clock, for display)
+_k8s_sessions: Dict[str, Tuple[K8sConnector, float, datetime]] = {}
 
 # Session timeout in minutes
 K8S_SESSION_TIMEOUT_MINUTES = 60
+K8S_SESSION_TIMEOUT_SECONDS = K8S_SESSION_TIMEOUT_MINUTES * 60
+
+# Min-heap of (expires_at, session_id, access generation). Every access
+# pushes a new entry instead of updating the old one; entries whose
+# generation no longer matches _session_access_gen are skipped when popped.
+_session_expiry_heap: List[Tuple[float, str, int]] = []
+_session_access_gen: Dict[str, int] = {}
+
+# Guards _k8s_sessions and the expiry index; every operation (lookups too,
+# since they refresh the access time) mutates them
+_k8s_sessions_lock = threading.Lock()
+
+# Session IDs that recently failed a lookup -> when (time.monotonic()), oldest
+# first. A client stuck on a stale ID is turned away here without the lock.
+_rejected_sessions: "OrderedDict[str, float]" = OrderedDict()
+REJECTED_SESSION_TTL_SECONDS = 5
+MAX_REJECTED_SESSIONS = 1024
+
+
+def _reject_session(session_id: str):
+    """Remember a failed session lookup (caller holds the lock)"""
+    _rejected_sessions[session_id] = time.monotonic()
+    _rejected_sessions.move_to_end(session_id)
+    while len(_rejected_sessions) > MAX_REJECTED_SESSIONS:
+        _rejected_sessions.popitem(last=False)
+
+
+def _touch_session(session_id: str, connector: K8sConnector, created_at: datetime):
+    """Record an access to a session and (re)schedule its expiry (caller holds the lock)"""
+    now = time.monotonic()
+    gen = _session_access_gen.get(session_id, 0) + 1
+    _session_access_gen[session_id] = gen
+    _k8s_sessions[session_id] = (connector, now, created_at)
+    heapq.heappush(_session_expiry_heap, (now + K8S_SESSION_TIMEOUT_SECONDS, session_id, gen))
+    
+    # Superseded entries otherwise linger until they expire; rebuild the
+    # heap from the live sessions once they dominate it
+    if len(_session_expiry_heap) > 2 * len(_k8s_sessions) + 64:
+        _session_expiry_heap[:] = [
+            (last_access + K8S_SESSION_TIMEOUT_SECONDS, sid, _session_access_gen[sid])
+            for sid, (_, last_access, _) in _k8s_sessions.items()
+        ]
+        heapq.heapify(_session_expiry_heap)
+
+
+def _pop_session(session_id: str) -> Optional[K8sConnector]:
+    """
+    Remove a session from the table and expiry index (caller holds the lock).
+    
+    Returns its connector, or None if there was no such session; the caller
+    disconnects it once the lock is released.
+    """
+    entry = _k8s_sessions.pop(session_id, None)
+    _session_access_gen.pop(session_id, None)
+    return entry[0] if entry else None
 
 
 def create_k8s_session() -> Tuple[str, K8sConnector]:
@@ -866,7 +1633,8 @@ def create_k8s_session() -> Tuple[str, K8sConnector]:
     """
     session_id = str(uuid.uuid4())
     connector = K8sConnector()
-    _k8s_sessions[session_id] = (connector, datetime.now())
+    with _k8s_sessions_lock:
+        _touch_session(session_id, connector, datetime.now())
     logger.info(f"Created K8s session: {session_id}")
     return session_id, connector
 
@@ -884,21 +1652,32 @@ def get_k8s_session(session_id: str) -> K8sConnector:
     Raises:
         ValueError: If session not found or expired
     """
-    if session_id not in _k8s_sessions:
+    rejected_at = _rejected_sessions.get(session_id)
+    if rejected_at is not None and time.monotonic() - rejected_at < REJECTED_SESSION_TTL_SECONDS:
         raise ValueError(f"K8s session not found: {session_id}")
     
-    connector, created_at = _k8s_sessions[session_id]
+    with _k8s_sessions_lock:
+        entry = _k8s_sessions.get(session_id)
+        if entry is None:
+            _reject_session(session_id)
+            raise ValueError(f"K8s session not found: {session_id}")
+        
+        connector, last_access, created_at = entry
+        
+        # Check if session has expired
+        expired = time.monotonic() - last_access > K8S_SESSION_TIMEOUT_SECONDS
+        if expired:
+            _pop_session(session_id)
+            _reject_session(session_id)
+        else:
+            # Update last access time
+            _touch_session(session_id, connector, created_at)
     
-    # Check if session has expired
-    if datetime.now() - created_at > timedelta(minutes=K8S_SESSION_TIMEOUT_MINUTES):
+    if expired:
         # Clean up expired session
         connector.disconnect()
-        del _k8s_sessions[session_id]
         raise ValueError(f"K8s session expired: {session_id}")
     
-    # Update last access time
-    _k8s_sessions[session_id] = (connector, datetime.now())
-    
     return connector
 
 
@@ -912,28 +1691,34 @@ def close_k8s_session(session_id: str) -> bool:
     Returns:
         True if session was closed, False if not found
     """
-    if session_id not in _k8s_sessions:
+    with _k8s_sessions_lock:
+        connector = _pop_session(session_id)
+    if connector is None:
         return False
     
-    connector, _ = _k8s_sessions[session_id]
     connector.disconnect()
-    del _k8s_sessions[session_id]
     logger.info(f"Closed K8s session: {session_id}")
     return True
 
 
 def cleanup_expired_k8s_sessions():
-    """Remove all expired K8s sessions."""
+    """
+    Remove all expired K8s sessions.
+    
+    Only heap entries that are due are visited, so the cost is proportional
+    to the number of expirations rather than the number of sessions.
+    """
+    now = time.monotonic()
     expired_sessions = []
     
-    for session_id, (connector, created_at) in _k8s_sessions.items():
-        if datetime.now() - created_at > timedelta(minutes=K8S_SESSION_TIMEOUT_MINUTES):
-            expired_sessions.append(session_id)
+    with _k8s_sessions_lock:
+        while _session_expiry_heap and _session_expiry_heap[0][0] < now:
+            _, session_id, gen = heapq.heappop(_session_expiry_heap)
+            if _session_access_gen.get(session_id) == gen:
+                expired_sessions.append((session_id, _pop_session(session_id)))
     
-    for session_id in expired_sessions:
-        connector, _ = _k8s_sessions[session_id]
+    for session_id, connector in expired_sessions:
         connector.disconnect()
-        del _k8s_sessions[session_id]
         logger.info(f"Cleaned up expired K8s session: {session_id}")
     
     return len(expired_sessions)
@@ -946,14 +1731,18 @@ def list_active_k8s_sessions() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping session_id to session info
     """
+    with _k8s_sessions_lock:
+        sessions = list(_k8s_sessions.items())
+    
+    now = datetime.now()
     return {
         session_id: {
             "context": connector._current_context,
             "has_client": connector._api_client is not None,
             "created_at": created_at.isoformat(),
-            "age_minutes": (datetime.now() - created_at).total_seconds() / 60
+            "age_minutes": (now - created_at).total_seconds() / 60
         }
-        for session_id, (connector, created_at) in _k8s_sessions.items()
+        for session_id, (connector, _, created_at) in sessions
     }
 
 
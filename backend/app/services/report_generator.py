@@ -4,12 +4,23 @@ Report Generator Service
 Generates compliance reports from policy violations and audit data.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from collections import Counter, defaultdict
+from typing import Dict, Any, Iterator, List, Optional
+from datetime import datetime, timezone
+import io
 import logging
 
+from pydantic_core import to_json
+
 logger = logging.getLogger(__name__)
 
+# Deployment status -> policy report summary counter
+DEPLOYMENT_STATUS_SUMMARY_KEYS = {
+    "deployed": "active",
+    "pending": "pending",
+    "failed": "failed",
+}
+
 
 class ReportGenerator:
     """
@@ -19,6 +30,11 @@ class ReportGenerator:
     def __init__(self):
         pass
     
+    @staticmethod
+    def _now_iso() -> str:
+        """Timezone-aware UTC timestamp for a report's generated_at"""
+        return datetime.now(timezone.utc).isoformat()
+    
     def generate_compliance_report(
         self,
         cluster_name: str,
@@ -26,6 +42,7 @@ class ReportGenerator:
         violations: List[Dict[str, Any]],
         include_passed: bool = True,
         include_failed: bool = True,
+        category_counts: Optional[Dict[Optional[str], int]] = None,
     ) -> Dict[str, Any]:
         """
         Generate a compliance report for a cluster.
@@ -36,59 +53,120 @@ class ReportGenerator:
             violations: List of policy violations
             include_passed: Include passed policies in report
             include_failed: Include failed policies in report
+            category_counts: Pre-aggregated policy count per category
+                (e.g. from a SQL GROUP BY); added to the summary if given
             
         Returns:
             Compliance report dictionary
         """
+        violation_lookup = self._group_violations(violations)
+        report = self._compliance_header(cluster_name, policies, violation_lookup, category_counts)
+        report["details"] = list(self._iter_compliance_details(
+            policies, violation_lookup, include_passed, include_failed
+        ))
+        return report
+    
+    def iter_compliance_ndjson(
+        self,
+        cluster_name: str,
+        policies: List[Dict[str, Any]],
+        violations: List[Dict[str, Any]],
+        include_passed: bool = True,
+        include_failed: bool = True,
+        category_counts: Optional[Dict[Optional[str], int]] = None,
+    ) -> Iterator[bytes]:
+        """
+        Yield a compliance report as newline-delimited JSON, so large reports
+        can be streamed without building the details list.
+        
+        The first line is the report without "details" (cluster name,
+        timestamp, summary); each following line is one policy's detail
+        entry, as in generate_compliance_report.
+        
+        Args:
+            Same as generate_compliance_report
+            
+        Yields:
+            One JSON document per line, newline included
+        """
+        violation_lookup = self._group_violations(violations)
+        header = self._compliance_header(cluster_name, policies, violation_lookup, category_counts)
+        yield to_json(header) + b"\n"
+        
+        for entry in self._iter_compliance_details(
+            policies, violation_lookup, include_passed, include_failed
+        ):
+            yield to_json(entry) + b"\n"
+    
+    @staticmethod
+    def _group_violations(violations: List[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+        """Group violations by policy name"""
+        violation_lookup = defaultdict(list)
+        for v in violations:
+            violation_lookup[v.get("policy_name")].append(v)
+        return violation_lookup
+    
+    def _compliance_header(
+        self,
+        cluster_name: str,
+        policies: List[Dict[str, Any]],
+        violation_lookup: Dict[Any, List[Dict[str, Any]]],
+        category_counts: Optional[Dict[Optional[str], int]],
+    ) -> Dict[str, Any]:
+        """Compliance report fields other than details (summary included)"""
+        passed = sum(1 for policy in policies if not violation_lookup.get(policy.get("name")))
         report = {
             "cluster_name": cluster_name,
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": self._now_iso(),
             "summary": {
                 "total_policies": len(policies),
-                "passed": 0,
-                "failed": 0,
+                "passed": passed,
+                "failed": len(policies) - passed,
                 "warnings": 0,
             },
-            "details": [],
         }
         
-        # Create violation lookup by policy name
-        violation_lookup = {}
-        for v in violations:
-            policy_name = v.get("policy_name")
-            if policy_name not in violation_lookup:
-                violation_lookup[policy_name] = []
-            violation_lookup[policy_name].append(v)
+        if category_counts is not None:
+            report["summary"]["by_category"] = {
+                (category or "uncategorized"): count
+                for category, count in category_counts.items()
+            }
         
-        # Process each policy
+        return report
+    
+    @staticmethod
+    def _iter_compliance_details(
+        policies: List[Dict[str, Any]],
+        violation_lookup: Dict[Any, List[Dict[str, Any]]],
+        include_passed: bool,
+        include_failed: bool,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the requested per-policy detail entries"""
         for policy in policies:
             policy_name = policy.get("name")
-            policy_violations = violation_lookup.get(policy_name, [])
-            
-            status = "passed" if not policy_violations else "failed"
+            policy_violations = violation_lookup.get(policy_name)
             
-            # Update summary
-            if status == "passed":
-                report["summary"]["passed"] += 1
-            else:
-                report["summary"]["failed"] += 1
-            
-            # Add to details if requested
-            if (status == "passed" and include_passed) or \
-               (status == "failed" and include_failed):
-                report["details"].append({
+            if not policy_violations:
+                if include_passed:
+                    yield {
+                        "policy_name": policy_name,
+                        "status": "passed",
+                        "violation_count": 0,
+                        "violations": [],
+                    }
+            elif include_failed:
+                yield {
                     "policy_name": policy_name,
-                    "status": status,
+                    "status": "failed",
                     "violation_count": len(policy_violations),
-                    "violations": policy_violations if status == "failed" else [],
-                })
-        
-        return report
+                    "violations": policy_violations,
+                }
     
     def generate_policy_report(
         self,
         policy: Dict[str, Any],
         deployments: List[Dict[str, Any]],
+        status_counts: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
         """
         Generate a report for a single policy across all deployments.
@@ -96,6 +174,8 @@ class ReportGenerator:
         Args:
             policy: Policy information
             deployments: List of deployments for this policy
+            status_counts: Pre-aggregated deployment count per status
+                (e.g. from a SQL GROUP BY); counted from deployments if omitted
             
         Returns:
             Policy report dictionary
@@ -103,7 +183,7 @@ class ReportGenerator:
         report = {
             "policy_name": policy.get("name"),
             "policy_category": policy.get("category"),
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": self._now_iso(),
             "summary": {
                 "total_deployments": len(deployments),
                 "active": 0,
@@ -113,15 +193,22 @@ class ReportGenerator:
             "deployments": [],
         }
         
+        if status_counts is not None:
+            report["summary"].update(
+                total_deployments=sum(status_counts.values()),
+                active=status_counts.get("deployed", 0),
+                pending=status_counts.get("pending", 0),
+                failed=status_counts.get("failed", 0),
+            )
+        
+        summary = report["summary"]
         for deployment in deployments:
             status = deployment.get("status", "unknown")
             
-            if status == "deployed":
-                report["summary"]["active"] += 1
-            elif status == "pending":
-                report["summary"]["pending"] += 1
-            elif status == "failed":
-                report["summary"]["failed"] += 1
+            if status_counts is None:
+                key = DEPLOYMENT_STATUS_SUMMARY_KEYS.get(status)
+                if key:
+                    summary[key] += 1
             
             report["deployments"].append({
                 "cluster_id": deployment.get("cluster_id"),
@@ -150,8 +237,10 @@ class ReportGenerator:
         Returns:
             Cluster summary dictionary
         """
+        kinds = Counter(p.get("kind") for p in policies)
+        
         return {
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": self._now_iso(),
             "cluster": {
                 "kubernetes_version": cluster_info.get("kubernetes_version"),
                 "node_count": cluster_info.get("node_count"),
@@ -163,14 +252,8 @@ class ReportGenerator:
             },
             "policies": {
                 "total": len(policies),
-                "cluster_policies": len([
-                    p for p in policies 
-                    if p.get("kind") == "ClusterPolicy"
-                ]),
-                "namespaced_policies": len([
-                    p for p in policies 
-                    if p.get("kind") == "Policy"
-                ]),
+                "cluster_policies": kinds["ClusterPolicy"],
+                "namespaced_policies": kinds["Policy"],
             },
         }
     
@@ -184,42 +267,63 @@ class ReportGenerator:
         Returns:
             Markdown formatted string
         """
-        lines = []
+        return "".join(self.iter_markdown(report))
+    
+    def iter_markdown(self, report: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield a report's Markdown in chunks (header/summary, then one chunk
+        per policy) so large reports can be streamed without building the
+        whole document first.
+        
+        Args:
+            report: Report dictionary
+            
+        Yields:
+            Markdown text chunks; joined they equal format_report_as_markdown
+        """
+        buf = io.StringIO()
+        w = buf.write
         
         # Title
         if "cluster_name" in report:
-            lines.append(f"# Compliance Report: {report['cluster_name']}")
+            w(f"# Compliance Report: {report['cluster_name']}")
         elif "policy_name" in report:
-            lines.append(f"# Policy Report: {report['policy_name']}")
+            w(f"# Policy Report: {report['policy_name']}")
         else:
-            lines.append("# Report")
+            w("# Report")
         
-        lines.append(f"\nGenerated: {report.get('generated_at', 'N/A')}\n")
+        w(f"\n\nGenerated: {report.get('generated_at', 'N/A')}\n")
         
         # Summary
         if "summary" in report:
-            lines.append("## Summary\n")
+            w("\n## Summary\n")
             summary = report["summary"]
             for key, value in summary.items():
-                lines.append(f"- **{key.replace('_', ' ').title()}**: {value}")
-            lines.append("")
+                w(f"\n- **{key.replace('_', ' ').title()}**: {value}")
+            w("\n")
         
         # Details
         if "details" in report:
-            lines.append("## Details\n")
-            for item in report["details"]:
-                status_emoji = "✅" if item.get("status") == "passed" else "❌"
-                lines.append(f"### {status_emoji} {item.get('policy_name', 'Unknown')}")
-                lines.append(f"Status: {item.get('status', 'Unknown')}")
-                
-                if item.get("violations"):
-                    lines.append("\n**Violations:**")
-                    for v in item["violations"]:
-                        lines.append(f"- {v.get('message', 'No message')}")
-                lines.append("")
-        
-        return "\n".join(lines)
-
+            w("\n## Details\n")
+        
+        yield buf.getvalue()
+        
+        # One buffer, emptied after each chunk
+        for item in report.get("details", ()):
+            buf.seek(0)
+            buf.truncate()
+            
+            status_emoji = "✅" if item.get("status") == "passed" else "❌"
+            w(f"\n### {status_emoji} {item.get('policy_name', 'Unknown')}")
+            w(f"\nStatus: {item.get('status', 'Unknown')}")
+            
+            if item.get("violations"):
+                w("\n\n**Violations:**")
+                for v in item["violations"]:
+                    w(f"\n- {v.get('message', 'No message')}")
+            w("\n")
+            
+            yield buf.getvalue()
 
 # Singleton instance
 _report_generator: Optional[ReportGenerator] = None
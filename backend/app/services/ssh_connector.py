@@ -5,13 +5,120 @@ Handles SSH connections to remote servers for executing commands.
 """
 
 import paramiko
+import hashlib
 import io
+import json
 import logging
-from typing import Optional, Dict, Any, Tuple
+import re
+import select
+import socket
+import threading
+import time
+import uuid
+import weakref
+import yaml
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Executor the async routers use to run blocking SSH calls off the event
+# loop. paramiko multiplexes each call on its own channel, so calls on one
+# session overlap as well as calls across sessions.
+SSH_EXECUTOR_MAX_WORKERS = 16
+ssh_executor = ThreadPoolExecutor(max_workers=SSH_EXECUTOR_MAX_WORKERS, thread_name_prefix="ssh-call")
+
+# Max bytes taken from a channel stream per recv
+CHANNEL_READ_SIZE = 65536
+
+# Remote `helm repo add/update` gets this long before an install is abandoned
+HELM_REPO_TIMEOUT_SECONDS = 30
+
+# Print the API server URL / CA data of the current kubeconfig context
+KUBECONFIG_SERVER_COMMAND = (
+    "kubectl config view --raw --minify --flatten "
+    "-o jsonpath='{.clusters[0].cluster.server}'"
+)
+KUBECONFIG_CA_COMMAND = (
+    "kubectl config view --raw --minify --flatten "
+    "-o jsonpath='{.clusters[0].cluster.certificate-authority-data}'"
+)
+
+# Parsed private keys by sha256 of their PEM, least recently used first
+PRIVATE_KEY_CACHE_SIZE = 64
+_private_keys: "OrderedDict[str, paramiko.PKey]" = OrderedDict()
+_private_keys_lock = threading.Lock()
+
+
+def _load_private_key(pem_key_content: str) -> paramiko.PKey:
+    """Parse a PEM private key (RSA, Ed25519 or ECDSA), reusing earlier parses"""
+    digest = hashlib.sha256(pem_key_content.encode()).hexdigest()
+    with _private_keys_lock:
+        pkey = _private_keys.get(digest)
+        if pkey is not None:
+            _private_keys.move_to_end(digest)
+            return pkey
+    
+    # Load private key from string
+    key_file = io.StringIO(pem_key_content)
+    try:
+        pkey = paramiko.RSAKey.from_private_key(key_file)
+    except paramiko.ssh_exception.SSHException:
+        # Try other key types
+        key_file.seek(0)
+        try:
+            pkey = paramiko.Ed25519Key.from_private_key(key_file)
+        except paramiko.ssh_exception.SSHException:
+            key_file.seek(0)
+            pkey = paramiko.ECDSAKey.from_private_key(key_file)
+    
+    with _private_keys_lock:
+        _private_keys[digest] = pkey
+        while len(_private_keys) > PRIVATE_KEY_CACHE_SIZE:
+            _private_keys.popitem(last=False)
+    return pkey
+
+
+# Remote kubeconfig / API server lookups change rarely, so they are reused
+# for a while instead of re-running kubectl over SSH on every request
+REMOTE_READ_CACHE_TTL_SECONDS = 300
+REMOTE_READ_CACHE_MAX_SIZE = 256
+
+# ((host, username, port, credential hash), lookup name) -> (expires_at, value)
+_remote_reads: Dict[Tuple[Tuple[str, str, int, str], str], Tuple[float, Any]] = {}
+_remote_reads_lock = threading.Lock()
+
+
+def _cached_remote_read(connection_key: Optional[Tuple[str, str, int, str]], name: str, fetch):
+    """Return fetch() for a connection, reusing the value for REMOTE_READ_CACHE_TTL_SECONDS"""
+    if connection_key is None:
+        return fetch()
+    
+    now = time.monotonic()
+    with _remote_reads_lock:
+        entry = _remote_reads.get((connection_key, name))
+    if entry and entry[0] > now:
+        return entry[1]
+    
+    value = fetch()
+    with _remote_reads_lock:
+        if len(_remote_reads) >= REMOTE_READ_CACHE_MAX_SIZE:
+            for stale in [k for k, (expires, _) in _remote_reads.items() if expires <= now]:
+                del _remote_reads[stale]
+            if len(_remote_reads) >= REMOTE_READ_CACHE_MAX_SIZE:
+                del _remote_reads[next(iter(_remote_reads))]
+        _remote_reads[(connection_key, name)] = (now + REMOTE_READ_CACHE_TTL_SECONDS, value)
+    return value
+
+
+def invalidate_kubeconfig_cache(host: str):
+    """Drop cached kubeconfig and cluster lookups for a host (call after changing its cluster)"""
+    with _remote_reads_lock:
+        for key in [k for k in _remote_reads if k[0][0] == host]:
+            del _remote_reads[key]
+
 
 class SSHConnector:
     """
@@ -21,6 +128,12 @@ class SSHConnector:
     def __init__(self):
         self._client: Optional[paramiko.SSHClient] = None
         self._connected_host: Optional[str] = None
+        self._pool_key: Optional[Tuple[str, str, int, str]] = None
+        # Releases the pooled client if the connector is dropped unclosed
+        self._release: Optional[weakref.finalize] = None
+        # SFTP channel for file reads, opened on first use
+        self._sftp: Optional[paramiko.SFTPClient] = None
+        self._sftp_lock = threading.Lock()
     
     def connect(
         self,
@@ -55,36 +168,51 @@ class SSHConnector:
         # Close existing connection if any
         self.disconnect()
         
+        credential = hashlib.sha256((pem_key_content or password).encode()).hexdigest()
+        key = (host, username, port, credential)
+        
         try:
-            self._client = paramiko.SSHClient()
-            self._client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            self._client = _acquire_ssh_client(
+                key,
+                lambda: self._open_client(host, username, pem_key_content, password, port, timeout)
+            )
+            self._pool_key = key
+            self._release = weakref.finalize(self, _release_ssh_client, key, self._client)
+            self._connected_host = host
+            logger.info(f"Successfully connected to {username}@{host}:{port}")
+            return True
             
+        except Exception as e:
+            logger.error(f"Failed to connect to {host}: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _open_client(
+        host: str,
+        username: str,
+        pem_key_content: Optional[str],
+        password: Optional[str],
+        port: int,
+        timeout: int
+    ) -> paramiko.SSHClient:
+        """Open and authenticate a new SSH client"""
+        ssh_client = paramiko.SSHClient()
+        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        
+        try:
             # Connect with key or password
             if pem_key_content:
-                # Load private key from string
-                key_file = io.StringIO(pem_key_content)
-                try:
-                    pkey = paramiko.RSAKey.from_private_key(key_file)
-                except paramiko.ssh_exception.SSHException:
-                    # Try other key types
-                    key_file.seek(0)
-                    try:
-                        pkey = paramiko.Ed25519Key.from_private_key(key_file)
-                    except paramiko.ssh_exception.SSHException:
-                        key_file.seek(0)
-                        pkey = paramiko.ECDSAKey.from_private_key(key_file)
-                
-                self._client.connect(
+                ssh_client.connect(
                     hostname=host,
                     port=port,
                     username=username,
-                    pkey=pkey,
+                    pkey=_load_private_key(pem_key_content),
                     timeout=timeout,
                     look_for_keys=False,
                     allow_agent=False
                 )
             else:
-                self._client.connect(
+                ssh_client.connect(
                     hostname=host,
                     port=port,
                     username=username,
@@ -93,14 +221,13 @@ class SSHConnector:
                     look_for_keys=False,
                     allow_agent=False
                 )
-            
-            self._connected_host = host
-            logger.info(f"Successfully connected to {username}@{host}:{port}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to connect to {host}: {str(e)}")
+        except Exception:
+            ssh_client.close()
             raise
+        
+        # Keep idle pooled connections from being dropped by NAT/firewalls
+        ssh_client.get_transport().set_keepalive(SSH_KEEPALIVE_SECONDS)
+        return ssh_client
     
     def execute_command(
         self,
@@ -125,27 +252,85 @@ class SSHConnector:
         if not self._client:
             raise RuntimeError("Not connected to any server. Call connect() first.")
         
-        try:
-            logger.info(f"Executing command: {command[:100]}...")
-            
-            stdin, stdout, stderr = self._client.exec_command(
-                command,
-                timeout=timeout,
-                get_pty=get_pty
-            )
-            
-            # Read output
-            stdout_output = stdout.read().decode('utf-8')
-            stderr_output = stderr.read().decode('utf-8')
-            exit_code = stdout.channel.recv_exit_status()
-            
-            logger.info(f"Command exit code: {exit_code}")
+        # Stay within the server's per-connection channel limit; the
+        # client may be shared with other sessions
+        with _channel_slots(self._client):
+            try:
+                logger.info(f"Executing command: {command[:100]}...")
+                
+                stdin, stdout, stderr = self._client.exec_command(
+                    command,
+                    timeout=timeout,
+                    get_pty=get_pty
+                )
+                
+                # Read stdout and stderr as they arrive; draining one to EOF
+                # first lets the other back up and stall the remote command
+                channel = stdout.channel
+                stdout_buf, stderr_buf = io.BytesIO(), io.BytesIO()
+                while True:
+                    if channel.recv_ready():
+                        stdout_buf.write(channel.recv(CHANNEL_READ_SIZE))
+                    if channel.recv_stderr_ready():
+                        stderr_buf.write(channel.recv_stderr(CHANNEL_READ_SIZE))
+                    if channel.eof_received and not channel.recv_ready() and not channel.recv_stderr_ready():
+                        break
+                    # Wakes on data for either stream, EOF or close
+                    if not select.select([channel], [], [], timeout)[0]:
+                        raise socket.timeout(f"No output from command for {timeout} seconds")
+                
+                stdout_output = stdout_buf.getvalue().decode('utf-8')
+                stderr_output = stderr_buf.getvalue().decode('utf-8')
+                exit_code = channel.recv_exit_status()
+                
+                logger.info(f"Command exit code: {exit_code}")
+                
+                return stdout_output, stderr_output, exit_code
+                
+            except Exception as e:
+                logger.error(f"Failed to execute command: {str(e)}")
+                raise
+    
+    def execute_batch(
+        self,
+        commands: List[str],
+        timeout: Optional[int] = 60
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Execute several commands on the remote server in one exec call.
+        
+        Every command runs (a failure doesn't stop the rest), separated by
+        per-call delimiter lines so each gets its own output and exit code.
+        
+        Args:
+            commands: Shell commands, run in order
+            timeout: Timeout in seconds for the whole batch
             
-            return stdout_output, stderr_output, exit_code
+        Returns:
+            List of (stdout, stderr, exit_code), one per command
             
-        except Exception as e:
-            logger.error(f"Failed to execute command: {str(e)}")
-            raise
+        Raises:
+            RuntimeError: If the batch stopped before every command finished
+        """
+        sep = uuid.uuid4().hex
+        marker = f"printf '\\n__RC__%s__{sep}__\\n' \"$?\"; printf '\\n__{sep}__\\n' >&2"
+        script = "".join(f"{command}\n{marker}\n" for command in commands)
+        
+        stdout, stderr, _ = self.execute_command(script, timeout=timeout)
+        
+        # [out1, rc1, out2, rc2, ..., trailing]; the "\n" before each
+        # delimiter was added by the marker, not the command
+        stdout_parts = re.split(rf"\n__RC__(\d+)__{sep}__\n", stdout)
+        stderr_parts = stderr.split(f"\n__{sep}__\n")
+        if len(stdout_parts) < 2 * len(commands) + 1 or len(stderr_parts) < len(commands) + 1:
+            raise RuntimeError(
+                f"Command batch ended early. stdout: {stdout} stderr: {stderr}"
+            )
+        
+        return [
+            (stdout_parts[2 * i], stderr_parts[i], int(stdout_parts[2 * i + 1]))
+            for i in range(len(commands))
+        ]
     
     def execute_kubectl_command(
         self,
@@ -174,12 +359,21 @@ class SSHConnector:
         """
         Read kubeconfig file from remote server.
         
+        The file is read over SFTP on the existing connection; servers
+        without the SFTP subsystem (or paths needing shell expansion) fall
+        back to running cat.
+        
         Args:
             kubeconfig_path: Path to kubeconfig on remote server
             
         Returns:
             Kubeconfig content as string
         """
+        try:
+            return self._read_file_sftp(kubeconfig_path)
+        except Exception as e:
+            logger.debug(f"SFTP read of {kubeconfig_path} failed, falling back to cat: {e}")
+        
         stdout, stderr, exit_code = self.execute_command(f"cat {kubeconfig_path}")
         
         if exit_code != 0:
@@ -187,6 +381,37 @@ class SSHConnector:
         
         return stdout
     
+    def _read_file_sftp(self, path: str) -> str:
+        """Read a remote text file over this connection's SFTP channel"""
+        if not self._client:
+            raise RuntimeError("Not connected to any server. Call connect() first.")
+        
+        # Relative SFTP paths resolve against the home directory
+        if path.startswith("~/"):
+            path = path[2:]
+        
+        with self._sftp_lock:
+            if self._sftp is None:
+                self._sftp = self._client.open_sftp()
+            sftp = self._sftp
+        
+        try:
+            with sftp.open(path, "r") as remote_file:
+                return remote_file.read().decode('utf-8')
+        except (EOFError, paramiko.SSHException):
+            # The channel is gone; open a new one next time
+            self._close_sftp()
+            raise
+    
+    def _close_sftp(self):
+        with self._sftp_lock:
+            sftp, self._sftp = self._sftp, None
+        if sftp is not None:
+            try:
+                sftp.close()
+            except Exception as e:
+                logger.debug(f"Error closing SFTP channel: {e}")
+    
     def get_portable_kubeconfig(
         self,
         context: Optional[str] = None
@@ -203,12 +428,15 @@ class SSHConnector:
         context_arg = f"--context={context}" if context else ""
         command = f"kubectl config view --raw --flatten --minify {context_arg}"
         
-        stdout, stderr, exit_code = self.execute_command(command)
-        
-        if exit_code != 0:
-            raise RuntimeError(f"Failed to get portable kubeconfig: {stderr}")
+        def _fetch() -> str:
+            stdout, stderr, exit_code = self.execute_command(command)
+            
+            if exit_code != 0:
+                raise RuntimeError(f"Failed to get portable kubeconfig: {stderr}")
+            
+            return stdout
         
-        return stdout
+        return _cached_remote_read(self._pool_key, f"portable_kubeconfig:{context or ''}", _fetch)
     
     def check_minikube_status(self) -> Dict[str, Any]:
         """
@@ -225,7 +453,6 @@ class SSHConnector:
                 "error": stderr or "Minikube not running or not installed"
             }
         
-        import json
         try:
             status = json.loads(stdout)
             return {
@@ -243,24 +470,28 @@ class SSHConnector:
         namespace: str = "kyverno",
         release_name: str = "kyverno",
         create_namespace: bool = True,
-        values: Optional[Dict[str, Any]] = None
+        values: Optional[Dict[str, Any]] = None,
+        atomic: bool = False
     ) -> Tuple[str, str, int]:
         """
         Install Kyverno via Helm on remote server.
 
+        The chart repository is prepared first, with a short timeout, so a
+        broken repo fails fast instead of using up the install's budget.
+
         Args:
             namespace: Kubernetes namespace
             release_name: Helm release name
             create_namespace: Create namespace if it doesn't exist
             values: Custom Helm values dictionary
+            atomic: Roll back a failed install
 
         Returns:
-            Tuple of (stdout, stderr, exit_code)
+            Tuple of (stdout, stderr, exit_code) of the failing step or the install
         """
-        commands = [
-            "helm repo add kyverno https://kyverno.github.io/kyverno/",
-            "helm repo update",
-        ]
+        result = self._helm_repo_prepare()
+        if result[2] != 0:
+            return result
 
         # Build Helm install command with values
         install_cmd = (
@@ -270,17 +501,24 @@ class SSHConnector:
         )
 
         if values:
-            import json
             install_cmd += " ".join([
                 f"--set-json '{k}={json.dumps(v)}'"
                 for k, v in values.items()
             ]) + " "
 
-        install_cmd += "--wait --timeout=5m"
-        commands.append(install_cmd)
+        install_cmd += f"{'--atomic' if atomic else '--wait'} --timeout=5m"
+
+        try:
+            return self.execute_command(install_cmd, timeout=360)
+        finally:
+            invalidate_kubeconfig_cache(self._connected_host)
 
-        full_command = " && ".join(commands)
-        return self.execute_command(full_command, timeout=360)
+    def _helm_repo_prepare(self) -> Tuple[str, str, int]:
+        """Add and refresh the Kyverno chart repository on the remote server"""
+        return self.execute_command(
+            "helm repo add kyverno https://kyverno.github.io/kyverno/ && helm repo update",
+            timeout=HELM_REPO_TIMEOUT_SECONDS
+        )
     
     def create_service_account_with_token(
         self,
@@ -303,49 +541,45 @@ class SSHConnector:
         Returns:
             Dictionary with token, server_url, and ca_cert
         """
-        commands = []
-        
-        # Create namespace if needed (suppress output with >/dev/null)
-        commands.append(f"kubectl create namespace {namespace} --dry-run=client -o yaml | kubectl apply -f - >/dev/null 2>&1")
-        
-        # Create service account (suppress output)
-        commands.append(f"kubectl create serviceaccount {name} -n {namespace} --dry-run=client -o yaml | kubectl apply -f - >/dev/null 2>&1")
-        
-        # Create role binding based on role_type (suppress output)
-        binding_name = f"{name}-binding"
-        if role_type == "custom" and role_name:
-            commands.append(
-                f"kubectl create clusterrolebinding {binding_name} "
-                f"--clusterrole={role_name} "
-                f"--serviceaccount={namespace}:{name} "
-                f"--dry-run=client -o yaml | kubectl apply -f - >/dev/null 2>&1"
-            )
-        elif role_type in ["view", "edit", "admin", "cluster-admin"]:
-            commands.append(
-                f"kubectl create clusterrolebinding {binding_name} "
-                f"--clusterrole={role_type} "
-                f"--serviceaccount={namespace}:{name} "
-                f"--dry-run=client -o yaml | kubectl apply -f - >/dev/null 2>&1"
-            )
-        
-        # Echo separator to clearly mark start of output we care about
-        commands.append('echo "---SA_TOKEN_START---"')
-        
-        # Create token with duration - ensure it ends with newline
-        commands.append(f"kubectl create token {name} -n {namespace} --duration={duration} && echo")
-        
-        # Get server URL - ensure it ends with newline
-        commands.append("kubectl cluster-info | grep 'Kubernetes control plane' | awk '{print $NF}' && echo")
-        
-        # Get CA certificate - ensure it ends with newline
-        commands.append("kubectl config view --raw --minify --flatten -o jsonpath='{.clusters[0].cluster.certificate-authority-data}' && echo")
+        # Namespace, ServiceAccount and ClusterRoleBinding go to the API
+        # server in a single kubectl apply
+        manifests = [
+            {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": namespace}},
+            {"apiVersion": "v1", "kind": "ServiceAccount", "metadata": {"name": name, "namespace": namespace}},
+        ]
+        cluster_role = role_name if role_type == "custom" else role_type
+        if (role_type == "custom" and role_name) or role_type in ["view", "edit", "admin", "cluster-admin"]:
+            manifests.append({
+                "apiVersion": "rbac.authorization.k8s.io/v1",
+                "kind": "ClusterRoleBinding",
+                "metadata": {"name": f"{name}-binding"},
+                "roleRef": {
+                    "apiGroup": "rbac.authorization.k8s.io",
+                    "kind": "ClusterRole",
+                    "name": cluster_role,
+                },
+                "subjects": [{"kind": "ServiceAccount", "name": name, "namespace": namespace}],
+            })
+        
+        apply_command = (
+            "cat <<'MANIFESTS_EOF' | kubectl apply -f - >/dev/null\n"
+            + yaml.safe_dump_all(manifests, sort_keys=False)
+            + "MANIFESTS_EOF"
+        )
         
-        full_command = " && ".join(commands)
+        invalidate_kubeconfig_cache(self._connected_host)
         
         try:
-            stdout, stderr, exit_code = self.execute_command(full_command, timeout=60)
+            results = self.execute_batch([
+                apply_command,
+                f"kubectl create token {name} -n {namespace} --duration={duration}",
+                KUBECONFIG_SERVER_COMMAND,
+                KUBECONFIG_CA_COMMAND,
+            ], timeout=60)
             
-            if exit_code != 0:
+            for stdout, stderr, exit_code in results:
+                if exit_code == 0:
+                    continue
                 error_msg = stderr if stderr else stdout
                 
                 # Provide more specific error messages
@@ -362,53 +596,27 @@ class SSHConnector:
                 else:
                     raise RuntimeError(f"Failed to create service account: {error_msg}")
             
-            # Parse output: find the separator and get the 3 lines after it
-            lines = stdout.strip().split('\n')
+            token = results[1][0].strip()
+            server_url = results[2][0].strip()
+            ca_cert = results[3][0].strip()
             
-            # Find the separator line
-            try:
-                separator_index = lines.index("---SA_TOKEN_START---")
-                # Get all lines after the separator and filter out empty lines
-                all_lines_after = lines[separator_index + 1:]
-                relevant_lines = [line.strip() for line in all_lines_after if line.strip()]
-                
-                if len(relevant_lines) < 3:
-                    raise RuntimeError(
-                        f"Unexpected output when creating service account. "
-                        f"Expected 3 non-empty lines after separator (token, server_url, ca_cert), got {len(relevant_lines)}. "
-                        f"Lines found: {relevant_lines}. "
-                        f"Full output: {stdout}"
-                    )
-                
-                token = relevant_lines[0].strip()
-                server_url = relevant_lines[1].strip()
-                ca_cert = relevant_lines[2].strip()
-                
-                # Validate the outputs
-                if not token or len(token) < 50:  # JWT tokens are much longer
-                    raise RuntimeError(
-                        f"Invalid token received (too short or empty). "
-                        f"Token: '{token}'. Full output: {stdout}"
-                    )
-                
-                if not server_url.startswith("https://"):
-                    raise RuntimeError(
-                        f"Invalid server URL received (should start with https://). "
-                        f"Server URL: '{server_url}'. Full output: {stdout}"
-                    )
-                
-                if not ca_cert or len(ca_cert) < 50:  # Base64 CA certs are long
-                    raise RuntimeError(
-                        f"Invalid CA certificate received (too short or empty). "
-                        f"CA cert: '{ca_cert}'. Full output: {stdout}"
-                    )
-                
-            except ValueError:
-                # Separator not found - fallback to old logic but with better error
+            # Validate the outputs
+            if not token or len(token) < 50:  # JWT tokens are much longer
+                raise RuntimeError(
+                    f"Invalid token received (too short or empty). "
+                    f"Token: '{token}'"
+                )
+            
+            if not server_url.startswith("https://"):
+                raise RuntimeError(
+                    f"Invalid server URL received (should start with https://). "
+                    f"Server URL: '{server_url}'"
+                )
+            
+            if not ca_cert or len(ca_cert) < 50:  # Base64 CA certs are long
                 raise RuntimeError(
-                    f"Could not find output separator in command output. "
-                    f"This indicates a command execution issue. "
-                    f"Full output: {stdout}"
+                    f"Invalid CA certificate received (too short or empty). "
+                    f"CA cert: '{ca_cert}'"
                 )
             
             return {
@@ -428,65 +636,156 @@ class SSHConnector:
         Returns:
             Dictionary with server_url and ca_cert_data
         """
-        commands = [
-            "kubectl cluster-info | grep 'Kubernetes control plane' | awk '{print $NF}'",
-            "kubectl config view --raw --minify --flatten -o jsonpath='{.clusters[0].cluster.certificate-authority-data}'"
-        ]
-        
-        full_command = " && ".join(commands)
-        stdout, stderr, exit_code = self.execute_command(full_command, timeout=30)
-        
-        if exit_code != 0:
-            raise RuntimeError(f"Failed to get cluster info: {stderr}")
-        
-        lines = stdout.strip().split('\n')
+        def _fetch() -> Dict[str, str]:
+            (server_url, stderr, exit_code), (ca_cert, _, _) = self.execute_batch(
+                [KUBECONFIG_SERVER_COMMAND, KUBECONFIG_CA_COMMAND],
+                timeout=30
+            )
+            
+            if exit_code != 0:
+                raise RuntimeError(f"Failed to get cluster info: {stderr}")
+            
+            return {
+                "server_url": server_url.strip(),
+                "ca_cert_data": ca_cert.strip()
+            }
         
-        return {
-            "server_url": lines[0].strip(),
-            "ca_cert_data": lines[1].strip() if len(lines) > 1 else ""
-        }
+        return dict(_cached_remote_read(self._pool_key, "cluster_info", _fetch))
     
     def disconnect(self):
-        """Close SSH connection."""
+        """Release SSH connection (the pooled client stays open for reuse)."""
         if self._client:
+            self._close_sftp()
             try:
-                self._client.close()
+                # Runs _release_ssh_client once; later calls are no-ops
+                self._release()
                 logger.info(f"Disconnected from {self._connected_host}")
             except Exception as e:
                 logger.warning(f"Error closing SSH connection: {e}")
             finally:
                 self._client = None
                 self._connected_host = None
+                self._pool_key = None
+                self._release = None
     
     def is_connected(self) -> bool:
         """Check if currently connected to a server."""
-        if not self._client:
-            return False
-        
-        try:
-            transport = self._client.get_transport()
-            return transport is not None and transport.is_active()
-        except:
-            return False
+        return self._client is not None and _is_active(self._client)
     
     def get_connected_host(self) -> Optional[str]:
         """Get the currently connected host."""
         return self._connected_host if self.is_connected() else None
-    
-    def __del__(self):
-        """Destructor to ensure connection is closed."""
-        self.disconnect()
 
 
 # Session-based SSH connection management
-import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 
-# Store SSH connectors by session ID with timestamp
-_ssh_sessions: Dict[str, Tuple[SSHConnector, datetime]] = {}
+# Store SSH connectors by session ID with last access (time.monotonic(),
+# for expiry) and creation time (wall clock, for display). Accessed
+# sessions move to the end, so the least recently used come first.
+_ssh_sessions: "OrderedDict[str, Tuple[SSHConnector, float, datetime]]" = OrderedDict()
+_ssh_sessions_lock = threading.Lock()
 
 # Session timeout in minutes
 SESSION_TIMEOUT_MINUTES = 30
+SESSION_TIMEOUT_SECONDS = SESSION_TIMEOUT_MINUTES * 60
+# Abandoned sessions are reaped this often even if no route triggers cleanup
+SESSION_REAP_INTERVAL_SECONDS = 60
+_session_reaper_started = False
+
+# Authenticated clients shared by every session connecting with the same
+# (host, username, port, sha256 of key/password): key -> [client, sessions
+# using it, time.monotonic() it was last released]. Each command runs on
+# its own channel, so one TCP connection and handshake serves them all.
+_ssh_client_pool: Dict[Tuple[str, str, int, str], list] = {}
+_ssh_client_pool_lock = threading.Lock()
+# Unused pooled clients are closed after this long
+SSH_CLIENT_IDLE_SECONDS = SESSION_TIMEOUT_MINUTES * 60
+SSH_KEEPALIVE_SECONDS = 30
+# Concurrent commands per client (OpenSSH's MaxSessions defaults to 10)
+SSH_MAX_CHANNELS_PER_CLIENT = 10
+
+_ssh_channel_slots: "weakref.WeakKeyDictionary[paramiko.SSHClient, threading.BoundedSemaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _is_active(ssh_client: paramiko.SSHClient) -> bool:
+    try:
+        transport = ssh_client.get_transport()
+        return transport is not None and transport.is_active()
+    except Exception:
+        return False
+
+
+def _channel_slots(ssh_client: paramiko.SSHClient) -> threading.BoundedSemaphore:
+    """Semaphore limiting the channels open at once on a client"""
+    with _ssh_client_pool_lock:
+        slots = _ssh_channel_slots.get(ssh_client)
+        if slots is None:
+            slots = _ssh_channel_slots[ssh_client] = threading.BoundedSemaphore(SSH_MAX_CHANNELS_PER_CLIENT)
+        return slots
+
+
+def _acquire_ssh_client(
+    key: Tuple[str, str, int, str],
+    open_client: Callable[[], paramiko.SSHClient]
+) -> paramiko.SSHClient:
+    """Get the live pooled client for key, opening one with open_client() on a miss."""
+    with _ssh_client_pool_lock:
+        entry = _ssh_client_pool.get(key)
+        if entry is not None and _is_active(entry[0]):
+            entry[1] += 1
+            return entry[0]
+    
+    ssh_client = open_client()
+    
+    with _ssh_client_pool_lock:
+        entry = _ssh_client_pool.get(key)
+        if entry is not None and _is_active(entry[0]):
+            # Another session connected meanwhile; share its client
+            entry[1] += 1
+            shared = entry[0]
+        else:
+            # Sessions still holding a dead client close it on release
+            stale = entry[0] if entry is not None and entry[1] == 0 else None
+            _ssh_client_pool[key] = [ssh_client, 1, time.monotonic()]
+            shared = None
+    
+    if shared is not None:
+        ssh_client.close()
+        return shared
+    if stale is not None:
+        stale.close()
+    return ssh_client
+
+
+def _release_ssh_client(key: Optional[Tuple[str, str, int, str]], ssh_client: paramiko.SSHClient):
+    """Drop a session's use of a pooled client; dead or replaced clients are closed."""
+    with _ssh_client_pool_lock:
+        entry = _ssh_client_pool.get(key)
+        if entry is not None and entry[0] is ssh_client:
+            entry[1] -= 1
+            entry[2] = time.monotonic()
+            if entry[1] > 0 or _is_active(ssh_client):
+                return
+            del _ssh_client_pool[key]
+    ssh_client.close()
+
+
+def cleanup_idle_ssh_clients() -> int:
+    """Close pooled clients no session has used for SSH_CLIENT_IDLE_SECONDS."""
+    now = time.monotonic()
+    with _ssh_client_pool_lock:
+        idle = [
+            key for key, (_, users, last_released) in _ssh_client_pool.items()
+            if users == 0 and now - last_released > SSH_CLIENT_IDLE_SECONDS
+        ]
+        clients = [_ssh_client_pool.pop(key)[0] for key in idle]
+    
+    for ssh_client in clients:
+        ssh_client.close()
+    return len(clients)
 
 
 def create_ssh_session() -> Tuple[str, SSHConnector]:
@@ -496,13 +795,29 @@ def create_ssh_session() -> Tuple[str, SSHConnector]:
     Returns:
         Tuple of (session_id, SSHConnector instance)
     """
+    global _session_reaper_started
     session_id = str(uuid.uuid4())
     connector = SSHConnector()
-    _ssh_sessions[session_id] = (connector, datetime.now())
+    with _ssh_sessions_lock:
+        _ssh_sessions[session_id] = (connector, time.monotonic(), datetime.now())
+        start_reaper = not _session_reaper_started
+        _session_reaper_started = True
+    if start_reaper:
+        threading.Thread(target=_reap_sessions, name="ssh-session-reaper", daemon=True).start()
     logger.info(f"Created SSH session: {session_id}")
     return session_id, connector
 
 
+def _reap_sessions():
+    """Background loop closing expired sessions and idle pooled clients"""
+    while True:
+        time.sleep(SESSION_REAP_INTERVAL_SECONDS)
+        try:
+            cleanup_expired_sessions()
+        except Exception as e:
+            logger.warning(f"SSH session cleanup failed: {e}")
+
+
 def get_ssh_session(session_id: str) -> SSHConnector:
     """
     Get SSH connector for a specific session.
@@ -516,21 +831,28 @@ def get_ssh_session(session_id: str) -> SSHConnector:
     Raises:
         ValueError: If session not found or expired
     """
-    if session_id not in _ssh_sessions:
-        raise ValueError(f"SSH session not found: {session_id}")
-    
-    connector, created_at = _ssh_sessions[session_id]
+    with _ssh_sessions_lock:
+        entry = _ssh_sessions.get(session_id)
+        if entry is None:
+            raise ValueError(f"SSH session not found: {session_id}")
+        
+        connector, last_access, created_at = entry
+        now = time.monotonic()
+        
+        # Check if session has expired
+        expired = now - last_access > SESSION_TIMEOUT_SECONDS
+        if expired:
+            del _ssh_sessions[session_id]
+        else:
+            # Update last access time
+            _ssh_sessions[session_id] = (connector, now, created_at)
+            _ssh_sessions.move_to_end(session_id)
     
-    # Check if session has expired
-    if datetime.now() - created_at > timedelta(minutes=SESSION_TIMEOUT_MINUTES):
+    if expired:
         # Clean up expired session
         connector.disconnect()
-        del _ssh_sessions[session_id]
         raise ValueError(f"SSH session expired: {session_id}")
     
-    # Update last access time
-    _ssh_sessions[session_id] = (connector, datetime.now())
-    
     return connector
 
 
@@ -544,30 +866,39 @@ def close_ssh_session(session_id: str) -> bool:
     Returns:
         True if session was closed, False if not found
     """
-    if session_id not in _ssh_sessions:
+    with _ssh_sessions_lock:
+        entry = _ssh_sessions.pop(session_id, None)
+    if entry is None:
         return False
     
-    connector, _ = _ssh_sessions[session_id]
-    connector.disconnect()
-    del _ssh_sessions[session_id]
+    entry[0].disconnect()
     logger.info(f"Closed SSH session: {session_id}")
     return True
 
 
 def cleanup_expired_sessions():
-    """Remove all expired SSH sessions."""
+    """
+    Remove all expired SSH sessions.
+    
+    Sessions are kept least recently used first, so this stops at the first
+    one still in use instead of visiting every session.
+    """
+    now = time.monotonic()
     expired_sessions = []
     
-    for session_id, (connector, created_at) in _ssh_sessions.items():
-        if datetime.now() - created_at > timedelta(minutes=SESSION_TIMEOUT_MINUTES):
-            expired_sessions.append(session_id)
+    with _ssh_sessions_lock:
+        while _ssh_sessions:
+            session_id, (connector, last_access, _) = next(iter(_ssh_sessions.items()))
+            if now - last_access <= SESSION_TIMEOUT_SECONDS:
+                break
+            _ssh_sessions.popitem(last=False)
+            expired_sessions.append((session_id, connector))
     
-    for session_id in expired_sessions:
-        connector, _ = _ssh_sessions[session_id]
+    for session_id, connector in expired_sessions:
         connector.disconnect()
-        del _ssh_sessions[session_id]
         logger.info(f"Cleaned up expired SSH session: {session_id}")
     
+    cleanup_idle_ssh_clients()
     return len(expired_sessions)
 
 
@@ -578,15 +909,56 @@ def list_active_sessions() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping session_id to session info
     """
-    return {
-        session_id: {
-            "host": connector.get_connected_host(),
-            "connected": connector.is_connected(),
+    with _ssh_sessions_lock:
+        sessions = list(_ssh_sessions.items())
+    
+    now = datetime.now()
+    result = {}
+    for session_id, (connector, _, created_at) in sessions:
+        # One liveness probe per session (get_connected_host() would repeat it)
+        connected = connector.is_connected()
+        result[session_id] = {
+            "host": connector._connected_host if connected else None,
+            "connected": connected,
             "created_at": created_at.isoformat(),
-            "age_minutes": (datetime.now() - created_at).total_seconds() / 60
+            "age_minutes": (now - created_at).total_seconds() / 60
         }
-        for session_id, (connector, created_at) in _ssh_sessions.items()
-    }
+    return result
+
+
+def execute_on_all(
+    command: str,
+    session_ids: Optional[List[str]] = None,
+    timeout: Optional[int] = 60,
+    max_workers: int = 32
+) -> Dict[str, Tuple[str, str, int]]:
+    """
+    Execute one command on several SSH sessions concurrently.
+    
+    Args:
+        command: Command to execute
+        session_ids: Sessions to run it on (all sessions if None)
+        timeout: Command timeout in seconds
+        max_workers: Max sessions running the command at once
+        
+    Returns:
+        Dictionary mapping session_id to (stdout, stderr, exit_code); a
+        session that is missing, expired or fails maps to ("", error, -1)
+    """
+    if session_ids is None:
+        with _ssh_sessions_lock:
+            session_ids = list(_ssh_sessions)
+    if not session_ids:
+        return {}
+    
+    def _run(session_id: str) -> Tuple[str, str, int]:
+        try:
+            return get_ssh_session(session_id).execute_command(command, timeout=timeout)
+        except Exception as e:
+            return "", str(e), -1
+    
+    with ThreadPoolExecutor(max_workers=min(len(session_ids), max_workers)) as pool:
+        return dict(zip(session_ids, pool.map(_run, session_ids)))
 
 
 # Legacy support - deprecated
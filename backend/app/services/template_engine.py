@@ -4,13 +4,54 @@ Template Engine Service
 Handles Kyverno policy template rendering using Jinja2.
 """
 
-from jinja2 import Environment, BaseLoader, TemplateError
-from typing import Dict, Any, Optional
+from jinja2 import Environment, BaseLoader, Template, TemplateError, meta, nodes
+from typing import Dict, Any, Optional, Tuple
+import functools
+import json
+import re
 import yaml
 import logging
 
+from app.services.k8s_connector import YamlSafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Cache sizes for compiled templates and rendered output
+COMPILED_TEMPLATE_CACHE_SIZE = 1024
+RENDERED_TEMPLATE_CACHE_SIZE = 4096
+VALIDATED_TEMPLATE_CACHE_SIZE = 1024
+
+# Anything Jinja2 would treat as markup; "\r" because Jinja2 rewrites newlines
+JINJA_MARKERS = ("{{", "{%", "{#", "\r")
+
+# Values that survive json.dumps/json.loads unchanged
+JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# {{ variable }} placeholders, and names Jinja2 defines itself
+PARAMETER_RE = re.compile(r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\}\}")
+JINJA_BUILTIN_NAMES = frozenset({"loop", "self", "super", "varargs", "kwargs"})
+
+# Characters that make yaml_quote wrap a value in double quotes
+YAML_SPECIAL_CHARS_RE = re.compile(r"""[:#{}\[\]&*!|>'"%@`]""")
+
+
+def _is_static(template: str) -> bool:
+    """True if rendering the template would just return its text"""
+    return not any(marker in template for marker in JINJA_MARKERS)
+
+
+def _json_exact(value: Any) -> bool:
+    """True if a JSON round-trip gives back the same types (no tuples, non-str keys, ...)"""
+    if type(value) in JSON_SCALAR_TYPES:
+        return True
+    if type(value) is list:
+        return all(_json_exact(item) for item in value)
+    if type(value) is dict:
+        return all(
+            type(key) is str and _json_exact(item) for key, item in value.items()
+        )
+    return False
+
 
 class TemplateEngine:
     """
@@ -29,11 +70,63 @@ class TemplateEngine:
         # Add custom filters
         self._env.filters["yaml_quote"] = self._yaml_quote
         self._env.filters["yaml_list"] = self._yaml_list
+        
+        # (compiled template, parameter names) keyed by template source,
+        # rendered output keyed by (template source, canonical parameters
+        # JSON, validate flag)
+        self._parsed = functools.lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)(
+            self._parse_uncached
+        )
+        self._render_cached = functools.lru_cache(maxsize=RENDERED_TEMPLATE_CACHE_SIZE)(
+            self._render_from_json
+        )
+        # validate_template results keyed by template source
+        self._validate_cached = functools.lru_cache(maxsize=VALIDATED_TEMPLATE_CACHE_SIZE)(
+            self._validate_uncached
+        )
+    
+    def _parse_uncached(self, template: str) -> Tuple[Template, Tuple[str, ...]]:
+        """
+        Parse a template once, then compile it and find its undeclared
+        variables (the parameters) from the same AST, in the order they
+        first appear, as the {{ variable }} fallback lists them.
+        """
+        ast = self._env.parse(template)
+        undeclared = meta.find_undeclared_variables(ast) - JINJA_BUILTIN_NAMES
+        parameters = dict.fromkeys(
+            node.name for node in ast.find_all(nodes.Name) if node.name in undeclared
+        )
+        return self._env.from_string(ast), tuple(parameters)
+    
+    def _compile(self, template: str) -> Template:
+        """Get the compiled Jinja2 Template for a template string"""
+        return self._parsed(template)[0]
+    
+    def _render_from_json(self, template: str, params_json: str, validate: bool) -> str:
+        """Render a template from canonical JSON parameters (cache backend)"""
+        return self._render(template, json.loads(params_json), validate)
+    
+    def _render(self, template: str, parameters: Dict[str, Any], validate: bool) -> str:
+        """Render a template and optionally validate the output YAML"""
+        if _is_static(template):
+            # Same output as Jinja2, which drops a single trailing newline
+            rendered = template[:-1] if template.endswith("\n") else template
+        else:
+            rendered = self._compile(template).render(**parameters)
+        if validate:
+            yaml.load(rendered, Loader=YamlSafeLoader)
+        return rendered
+    
+    def clear_cache(self):
+        """Drop all compiled templates and cached render results"""
+        self._parsed.cache_clear()
+        self._render_cached.cache_clear()
+        self._validate_cached.cache_clear()
     
     @staticmethod
     def _yaml_quote(value: str) -> str:
         """Quote a string for YAML"""
-        if any(c in value for c in ":#{}[]&*!|>'\"%@`"):
+        if YAML_SPECIAL_CHARS_RE.search(value):
             return f'"{value}"'
         return value
     
@@ -52,6 +145,9 @@ class TemplateEngine:
         """
         Render a policy template with the given parameters.
         
+        Results are cached by template content and parameter values, so
+        repeated renders of the same (template, parameters) pair are free.
+        
         Args:
             template: Jinja2 template string (YAML format)
             parameters: Dictionary of parameter values
@@ -65,17 +161,13 @@ class TemplateEngine:
             yaml.YAMLError: If output is not valid YAML
         """
         try:
-            # Create template from string
-            jinja_template = self._env.from_string(template)
-            
-            # Render with parameters
-            rendered = jinja_template.render(**parameters)
+            if not _json_exact(parameters):
+                # The cache renders from the canonical JSON, so parameters
+                # it can't reproduce exactly are rendered uncached
+                return self._render(template, parameters, validate)
             
-            # Validate YAML if requested
-            if validate:
-                yaml.safe_load(rendered)
-            
-            return rendered
+            params_json = json.dumps(parameters, sort_keys=True)
+            return self._render_cached(template, params_json, validate)
             
         except TemplateError as e:
             logger.error(f"Template rendering failed: {e}")
@@ -88,8 +180,9 @@ class TemplateEngine:
         """
         Extract parameter placeholders from a template.
         
-        This is a simple extraction that finds {{ variable }} patterns.
-        For more complex templates, consider using AST parsing.
+        Parameters are the variables the template uses without defining
+        them, wherever they appear (including {% %} blocks). Templates that
+        don't parse fall back to matching {{ variable }} patterns.
         
         Args:
             template: Jinja2 template string
@@ -97,17 +190,19 @@ class TemplateEngine:
         Returns:
             Dictionary of parameter names with None values
         """
-        import re
-        
-        # Find all {{ variable }} patterns
-        pattern = r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\}\}"
-        matches = re.findall(pattern, template)
+        if _is_static(template):
+            return {}
         
-        # Remove duplicates and Jinja2 built-ins
-        builtins = {"loop", "self", "super", "varargs", "kwargs"}
-        params = {m: None for m in matches if m not in builtins}
+        try:
+            return dict.fromkeys(self._parsed(template)[1])
+        except TemplateError:
+            pass
         
-        return params
+        # Remove duplicates (keeping first-seen order) and Jinja2 built-ins
+        return dict.fromkeys(
+            name for name in (m.group(1) for m in PARAMETER_RE.finditer(template))
+            if name not in JINJA_BUILTIN_NAMES
+        )
     
     def validate_template(self, template: str) -> Dict[str, Any]:
         """
@@ -119,6 +214,17 @@ class TemplateEngine:
         Returns:
             Dictionary with validation results
         """
+        # The cached result is shared; hand out copies of its containers
+        result = self._validate_cached(template)
+        return {
+            "valid": result["valid"],
+            "errors": list(result["errors"]),
+            "warnings": list(result["warnings"]),
+            "parameters": dict(result["parameters"]),
+        }
+    
+    def _validate_uncached(self, template: str) -> Dict[str, Any]:
+        """Validate a template (cache backend for validate_template)"""
         result = {
             "valid": True,
             "errors": [],
@@ -127,11 +233,8 @@ class TemplateEngine:
         }
         
         try:
-            # Try to parse the template
-            self._env.parse(template)
-            
-            # Extract parameters
-            result["parameters"] = self.extract_parameters(template)
+            # Parse the template and extract parameters from the same AST
+            result["parameters"] = dict.fromkeys(self._parsed(template)[1])
             
         except TemplateError as e:
             result["valid"] = False
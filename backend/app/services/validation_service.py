@@ -6,15 +6,47 @@ Validates Kyverno policies against schemas and best practices.
 
 import yaml
 import re
-from typing import Dict, Any, List, Optional
+import copy
+import functools
+import hashlib
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
 import logging
 
+from app.services.k8s_connector import YamlSafeLoader
+
 logger = logging.getLogger(__name__)
 
 # RFC 1123 subdomain: lowercase alphanumeric, hyphens, max 253 chars
 K8S_NAME_PATTERN = re.compile(r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*$')
 K8S_NAME_MAX_LENGTH = 253
 
+# Bump whenever validation rules change so memoized results are not reused
+VALIDATION_SCHEMA_VERSION = 4
+
+# Max number of validation results memoized by content hash
+VALIDATION_CACHE_SIZE = 1024
+
+# Max number of compiled parameter schemas kept
+PARAMETER_VALIDATOR_CACHE_SIZE = 256
+
+# JSON-schema type names mapped to the Python types that satisfy them
+JSON_SCHEMA_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+# A compiled property check: (type name, Python type, enum values)
+ParameterCheck = Tuple[Optional[str], Any, Optional[List[Any]]]
+
 # Pattern for Jinja2 template expressions: {{ var }}, {{ var | filter }}, {% %}, {# #}
 JINJA2_EXPR_PATTERN = re.compile(r'\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\}')
 
@@ -22,7 +54,7 @@ JINJA2_EXPR_PATTERN = re.compile(r'\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\}')
 def _substitute_jinja2_placeholders(yaml_content: str) -> str:
     """
     Replace Jinja2 template expressions with YAML-safe placeholder values
-    so that yaml.safe_load can parse the template for structural validation.
+    so that the YAML loader can parse the template for structural validation.
 
     Uses an unquoted alphanumeric placeholder so it stays valid whether the
     expression appears bare, inside quotes, or as part of a larger string.
@@ -35,6 +67,17 @@ def _has_jinja2_syntax(yaml_content: str) -> bool:
     return bool(JINJA2_EXPR_PATTERN.search(yaml_content))
 
 
+class _FirstError(Exception):
+    """Raised by _FailFastList to stop validation at the first error"""
+
+
+class _FailFastList(list):
+    """Error accumulator that aborts on the first append"""
+    
+    def append(self, item):
+        raise _FirstError(item)
+
+
 def validate_k8s_name(name: str) -> Optional[str]:
     """Validate a Kubernetes resource name (RFC 1123 subdomain)."""
     if not name:
@@ -55,19 +98,101 @@ class ValidationService:
     """
     
     # Required fields for a valid Kyverno policy
-    REQUIRED_FIELDS = ["apiVersion", "kind", "metadata", "spec"]
-    VALID_KINDS = ["ClusterPolicy", "Policy"]
-    VALID_API_VERSIONS = ["kyverno.io/v1", "kyverno.io/v2beta1"]
+    REQUIRED_FIELDS = ("apiVersion", "kind", "metadata", "spec")
+    VALID_KINDS = frozenset({"ClusterPolicy", "Policy"})
+    VALID_API_VERSIONS = frozenset({"kyverno.io/v1", "kyverno.io/v2beta1"})
+    
+    # Compared case-insensitively against the lowercased action
+    VALIDATION_FAILURE_ACTIONS = frozenset({"audit", "enforce"})
+    
+    # Ordered renderings of the sets above, so messages stay stable
+    _VALID_KINDS_STR = "['ClusterPolicy', 'Policy']"
+    _VALID_API_VERSIONS_STR = "['kyverno.io/v1', 'kyverno.io/v2beta1']"
+    _VALIDATION_FAILURE_ACTIONS_STR = "['Audit', 'Enforce', 'audit', 'enforce']"
+    
+    # A rule needs at least one of these actions; the string is for messages
+    _RULE_ACTIONS = frozenset({"validate", "mutate", "generate", "verifyImages"})
+    _RULE_ACTIONS_STR = "validate, mutate, generate, verifyImages"
     
-    VALIDATION_FAILURE_ACTIONS = ["Audit", "Enforce", "audit", "enforce"]
+    # A match block should select on at least one of these
+    _MATCH_KEYS = frozenset({"resources", "any", "all", "subjects", "roles", "clusterRoles"})
+    _MATCH_KEYS_STR = ", ".join(sorted(_MATCH_KEYS))
     
     def __init__(self):
-        pass
+        self._results: "OrderedDict[Tuple[str, int, bytes], Dict[str, Any]]" = OrderedDict()
+        self._results_lock = threading.Lock()
+        self._parameter_validators = functools.lru_cache(maxsize=PARAMETER_VALIDATOR_CACHE_SIZE)(
+            self._compile_parameter_schema
+        )
+    
+    def _memoized(
+        self,
+        kind: str,
+        content: str,
+        compute: Callable[[str], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Return compute(content), memoized by a BLAKE2b hash of the content.
+        
+        The key includes VALIDATION_SCHEMA_VERSION so rule changes invalidate
+        old entries. Callers get a copy since results are mutable dicts.
+        """
+        key = (
+            kind,
+            VALIDATION_SCHEMA_VERSION,
+            hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest(),
+        )
+        with self._results_lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                return copy.deepcopy(result)
+        
+        result = compute(content)
+        
+        with self._results_lock:
+            self._results[key] = result
+            if len(self._results) > VALIDATION_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return copy.deepcopy(result)
+    
+    def warmup(self, schemas: Iterable[Any]) -> int:
+        """
+        Compile parameter schemas ahead of the first validation request.
+        
+        Args:
+            schemas: Parameter schemas, e.g. from the policy catalog; entries
+                that are not JSON-schema objects are skipped
+            
+        Returns:
+            Number of schemas compiled
+        """
+        start = time.perf_counter()
+        count = 0
+        for schema in schemas:
+            if not isinstance(schema, dict) or "properties" not in schema:
+                continue
+            try:
+                self._parameter_validators(json.dumps(schema, sort_keys=True))
+            except (TypeError, ValueError, AttributeError) as e:
+                logger.warning(f"Skipping malformed parameter schema during warmup: {e}")
+                continue
+            count += 1
+        logger.info(
+            f"Pre-compiled {count} parameter schema(s) in "
+            f"{(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+        return count
+    
+    def clear_cache(self):
+        """Drop all memoized validation results"""
+        with self._results_lock:
+            self._results.clear()
+        self._parameter_validators.cache_clear()
     
     def validate_yaml(self, yaml_content: str) -> Dict[str, Any]:
         """
-        Validate YAML syntax.
-        Handles Jinja2 template expressions by substituting placeholders.
+        Validate YAML syntax (memoized by content hash).
         
         Args:
             yaml_content: YAML string to validate
@@ -75,6 +200,29 @@ class ValidationService:
         Returns:
             Validation result dictionary
         """
+        return self._memoized("yaml", yaml_content, self._validate_yaml_uncached)
+    
+    def _validate_yaml_uncached(self, yaml_content: str) -> Dict[str, Any]:
+        """Validate YAML syntax, discarding the parsed documents"""
+        return self._parse_yaml(yaml_content)[1]
+    
+    def _parse_yaml(
+        self,
+        yaml_content: str,
+        max_docs: Optional[int] = None,
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Parse YAML content and validate its syntax.
+        Handles Jinja2 template expressions by substituting placeholders.
+        
+        Args:
+            yaml_content: YAML string to parse
+            max_docs: Stop after this many documents; the rest of the
+                stream is neither parsed nor syntax-checked
+            
+        Returns:
+            Tuple of (parsed documents, validation result dictionary)
+        """
         result = {
             "valid": True,
             "errors": [],
@@ -91,8 +239,11 @@ class ValidationService:
                 "Structure validated with placeholder values."
             )
         
+        docs: List[Any] = []
         try:
-            docs = list(yaml.safe_load_all(parse_content))
+            docs = list(itertools.islice(
+                yaml.load_all(parse_content, Loader=YamlSafeLoader), max_docs
+            ))
             if not docs or all(d is None for d in docs):
                 result["valid"] = False
                 result["errors"].append("Empty YAML document")
@@ -100,9 +251,21 @@ class ValidationService:
             result["valid"] = False
             result["errors"].append(f"Invalid YAML syntax: {e}")
         
-        return result
+        return docs, result
     
     def validate_policy(self, policy_yaml: str) -> Dict[str, Any]:
+        """
+        Validate a Kyverno policy (memoized by content hash).
+        
+        Args:
+            policy_yaml: Policy YAML string
+            
+        Returns:
+            Validation result dictionary
+        """
+        return self._memoized("policy", policy_yaml, self._validate_policy_uncached)
+    
+    def _validate_policy_uncached(self, policy_yaml: str) -> Dict[str, Any]:
         """
         Validate a Kyverno policy.
         
@@ -119,162 +282,185 @@ class ValidationService:
             "info": {},
         }
         
-        # First validate YAML syntax
-        yaml_result = self.validate_yaml(policy_yaml)
+        # Parse once; the documents feed the structural checks below. Two
+        # are enough to tell a single policy from a bundle.
+        docs, yaml_result = self._parse_yaml(policy_yaml, max_docs=2)
         if not yaml_result["valid"]:
             return yaml_result
         
         # Carry over warnings from YAML validation
-        result["warnings"].extend(yaml_result.get("warnings", []))
+        result["warnings"].extend(yaml_result["warnings"])
         
-        # Substitute Jinja2 placeholders for structural validation
-        parse_content = policy_yaml
-        if _has_jinja2_syntax(policy_yaml):
-            parse_content = _substitute_jinja2_placeholders(policy_yaml)
+        if len(docs) > 1:
+            result["valid"] = False
+            result["errors"].append(
+                "Failed to parse YAML: expected a single document in the stream"
+            )
+            return result
+        policy = docs[0]
         
-        try:
-            policy = yaml.safe_load(parse_content)
-        except yaml.YAMLError as e:
+        checked = self._check_policy(policy, result["errors"], result["warnings"])
+        if result["errors"]:
             result["valid"] = False
-            result["errors"].append(f"Failed to parse YAML: {e}")
+        if not checked:
             return result
         
+        # Extract info
+        metadata = policy.get("metadata", {})
+        spec = policy.get("spec", {})
+        result["info"] = {
+            "name": metadata.get("name"),
+            "kind": policy.get("kind", ""),
+            "rules_count": len(spec.get("rules", [])),
+        }
+        
+        return result
+    
+    def is_valid(self, policy_yaml: str) -> bool:
+        """
+        Check a Kyverno policy, stopping at the first error.
+        
+        For callers that only need a yes/no answer; validate_policy reports
+        every error and warning.
+        """
+        docs, yaml_result = self._parse_yaml(policy_yaml, max_docs=2)
+        if not yaml_result["valid"] or len(docs) > 1:
+            return False
+        try:
+            self._check_policy(docs[0], _FailFastList(), [])
+        except _FirstError:
+            return False
+        return True
+    
+    def _check_policy(
+        self,
+        policy: Any,
+        errors: List[str],
+        warnings: List[str],
+    ) -> bool:
+        """
+        Run the structural policy checks, appending to errors/warnings.
+        
+        Returns False if the policy is not a mapping with the required
+        fields, in which case the field-level checks were skipped.
+        """
+        if not isinstance(policy, dict):
+            errors.append("Policy YAML must be a mapping")
+            return False
+        
         # Check required fields
-        for field in self.REQUIRED_FIELDS:
-            if field not in policy:
-                result["valid"] = False
-                result["errors"].append(f"Missing required field: {field}")
+        missing = [field for field in self.REQUIRED_FIELDS if field not in policy]
+        for field in missing:
+            errors.append(f"Missing required field: {field}")
         
-        if not result["valid"]:
-            return result
+        if missing:
+            return False
         
         # Validate apiVersion
         api_version = policy.get("apiVersion", "")
-        if api_version not in self.VALID_API_VERSIONS:
-            result["warnings"].append(
+        if not isinstance(api_version, str) or api_version not in self.VALID_API_VERSIONS:
+            warnings.append(
                 f"Unexpected apiVersion '{api_version}'. "
-                f"Expected one of: {self.VALID_API_VERSIONS}"
+                f"Expected one of: {self._VALID_API_VERSIONS_STR}"
             )
         
         # Validate kind
         kind = policy.get("kind", "")
-        if kind not in self.VALID_KINDS:
-            result["valid"] = False
-            result["errors"].append(
-                f"Invalid kind '{kind}'. Must be one of: {self.VALID_KINDS}"
+        if not isinstance(kind, str) or kind not in self.VALID_KINDS:
+            errors.append(
+                f"Invalid kind '{kind}'. Must be one of: {self._VALID_KINDS_STR}"
             )
         
         # Validate metadata
         metadata = policy.get("metadata", {})
         if not metadata.get("name"):
-            result["valid"] = False
-            result["errors"].append("Policy must have a name in metadata")
+            errors.append("Policy must have a name in metadata")
         else:
             name_error = validate_k8s_name(metadata["name"])
             if name_error:
-                result["valid"] = False
-                result["errors"].append(f"metadata.name: {name_error}")
+                errors.append(f"metadata.name: {name_error}")
         
         # Warn if ClusterPolicy has namespace set (it's cluster-scoped)
         if kind == "ClusterPolicy" and metadata.get("namespace"):
-            result["warnings"].append(
+            warnings.append(
                 "ClusterPolicy is cluster-scoped and should not have a namespace in metadata"
             )
         
         # Validate spec
-        spec = policy.get("spec", {})
-        result.update(self._validate_spec(spec))
-        
-        # Extract info
-        result["info"] = {
-            "name": metadata.get("name"),
-            "kind": kind,
-            "rules_count": len(spec.get("rules", [])),
-        }
-        
-        return result
+        self._validate_spec(policy.get("spec", {}), errors, warnings)
+        return True
     
-    def _validate_spec(self, spec: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate the spec section of a policy"""
-        result = {
-            "errors": [],
-            "warnings": [],
-        }
-        
+    def _validate_spec(
+        self,
+        spec: Dict[str, Any],
+        errors: List[str],
+        warnings: List[str],
+    ) -> None:
+        """Validate the spec section of a policy, appending to errors/warnings"""
         # Check rules
         rules = spec.get("rules", [])
         if not rules:
-            result["errors"].append("Policy must have at least one rule in spec.rules")
+            errors.append("Policy must have at least one rule in spec.rules")
         
         for i, rule in enumerate(rules):
-            rule_errors = self._validate_rule(rule, i)
-            result["errors"].extend(rule_errors["errors"])
-            result["warnings"].extend(rule_errors["warnings"])
+            self._validate_rule(rule, i, errors, warnings)
         
         # Check validationFailureAction
         action = spec.get("validationFailureAction")
-        if action and action not in self.VALIDATION_FAILURE_ACTIONS:
-            result["warnings"].append(
+        if action and (not isinstance(action, str) or action.lower() not in self.VALIDATION_FAILURE_ACTIONS):
+            warnings.append(
                 f"Invalid validationFailureAction '{action}'. "
-                f"Expected one of: {self.VALIDATION_FAILURE_ACTIONS}"
+                f"Expected one of: {self._VALIDATION_FAILURE_ACTIONS_STR}"
             )
         
         # Check for deprecated fields
         if "validationFailureActionOverrides" in spec:
-            result["warnings"].append(
+            warnings.append(
                 "validationFailureActionOverrides is deprecated in v1"
             )
-        
-        return result
     
-    def _validate_rule(self, rule: Dict[str, Any], index: int) -> Dict[str, Any]:
-        """Validate a single rule"""
-        result = {
-            "errors": [],
-            "warnings": [],
-        }
-        
+    def _validate_rule(
+        self,
+        rule: Dict[str, Any],
+        index: int,
+        errors: List[str],
+        warnings: List[str],
+    ) -> None:
+        """Validate a single rule, appending to errors/warnings"""
         rule_prefix = f"Rule[{index}]"
         
         # Check name
         if not rule.get("name"):
-            result["errors"].append(f"{rule_prefix}: Rule must have a name")
+            errors.append(f"{rule_prefix}: Rule must have a name")
         else:
             rule_prefix = f"Rule '{rule['name']}'"
         
         # Check match
         if "match" not in rule:
-            result["errors"].append(f"{rule_prefix}: Rule must have a 'match' block")
+            errors.append(f"{rule_prefix}: Rule must have a 'match' block")
         else:
             match_block = rule["match"]
             if isinstance(match_block, dict):
                 # Validate match block has at least one selector
-                valid_match_keys = {"resources", "any", "all", "subjects", "roles", "clusterRoles"}
-                if not any(k in match_block for k in valid_match_keys):
-                    result["warnings"].append(
+                if self._MATCH_KEYS.isdisjoint(match_block):
+                    warnings.append(
                         f"{rule_prefix}: 'match' block should contain at least one of: "
-                        f"{', '.join(sorted(valid_match_keys))}"
+                        f"{self._MATCH_KEYS_STR}"
                     )
                 # Validate resources block if present
                 resources = match_block.get("resources")
                 if isinstance(resources, dict):
-                    valid_resource_keys = {"kinds", "names", "namespaces", "selector", "annotations", "operations"}
                     if "kinds" not in resources:
-                        result["warnings"].append(
+                        warnings.append(
                             f"{rule_prefix}: match.resources should specify 'kinds' to target"
                         )
         
         # Check for at least one action
-        actions = ["validate", "mutate", "generate", "verifyImages"]
-        has_action = any(action in rule for action in actions)
-        
-        if not has_action:
-            result["errors"].append(
+        if self._RULE_ACTIONS.isdisjoint(rule):
+            errors.append(
                 f"{rule_prefix}: Rule must have at least one action "
-                f"({', '.join(actions)})"
+                f"({self._RULE_ACTIONS_STR})"
             )
-        
-        return result
     
     def validate_policy_parameters(
         self, 
@@ -297,57 +483,80 @@ class ValidationService:
             "warnings": [],
         }
         
+        # Compiled once per distinct schema; see _compile_parameter_schema
+        try:
+            schema_key = json.dumps(schema, sort_keys=True)
+        except (TypeError, ValueError):
+            # Not JSON-serializable, so not cacheable; compile it for this call
+            required, checks = self._parameter_checks(schema)
+        else:
+            required, checks = self._parameter_validators(schema_key)
+        
         # Check required parameters
-        required = schema.get("required", [])
         for param in required:
             if param not in parameters:
                 result["valid"] = False
                 result["errors"].append(f"Missing required parameter: {param}")
         
         # Validate types
-        properties = schema.get("properties", {})
         for param, value in parameters.items():
-            if param not in properties:
+            check = checks.get(param)
+            if check is None:
                 result["warnings"].append(f"Unknown parameter: {param}")
                 continue
             
-            prop_schema = properties[param]
-            type_errors = self._validate_type(param, value, prop_schema)
+            type_errors = self._validate_type(param, value, check)
             result["errors"].extend(type_errors)
             if type_errors:
                 result["valid"] = False
         
         return result
     
+    @staticmethod
+    def _compile_parameter_schema(
+        schema_key: str,
+    ) -> Tuple[Tuple[str, ...], Dict[str, ParameterCheck]]:
+        """
+        Reduce a canonical JSON parameter schema to the checks we apply.
+        
+        Returns the required parameter names and, per known property, its
+        type name, matching Python type (None if not checked) and enum.
+        """
+        return ValidationService._parameter_checks(json.loads(schema_key))
+    
+    @staticmethod
+    def _parameter_checks(
+        schema: Dict[str, Any],
+    ) -> Tuple[Tuple[str, ...], Dict[str, ParameterCheck]]:
+        """_compile_parameter_schema for an already decoded schema"""
+        required = tuple(schema.get("required", []))
+        checks: Dict[str, ParameterCheck] = {}
+        for param, prop_schema in schema.get("properties", {}).items():
+            expected_type = prop_schema.get("type")
+            python_type = (
+                JSON_SCHEMA_TYPES.get(expected_type)
+                if isinstance(expected_type, str) else None
+            )
+            checks[param] = (expected_type, python_type, prop_schema.get("enum") or None)
+        return required, checks
+    
     def _validate_type(
         self, 
         name: str, 
         value: Any, 
-        schema: Dict[str, Any]
+        check: ParameterCheck
     ) -> List[str]:
-        """Validate a value against its type schema"""
+        """Validate a value against its compiled type check"""
         errors = []
-        expected_type = schema.get("type")
-        
-        type_map = {
-            "string": str,
-            "integer": int,
-            "number": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
+        expected_type, python_type, enum_values = check
         
-        if expected_type and expected_type in type_map:
-            python_type = type_map[expected_type]
-            if not isinstance(value, python_type):
-                errors.append(
-                    f"Parameter '{name}' must be {expected_type}, "
-                    f"got {type(value).__name__}"
-                )
+        if python_type is not None and not isinstance(value, python_type):
+            errors.append(
+                f"Parameter '{name}' must be {expected_type}, "
+                f"got {type(value).__name__}"
+            )
         
         # Check enum
-        enum_values = schema.get("enum")
         if enum_values and value not in enum_values:
             errors.append(
                 f"Parameter '{name}' must be one of: {enum_values}"
@@ -377,7 +586,7 @@ class ValidationService:
 
         # ---------- parse policy ----------
         try:
-            policy = yaml.safe_load(policy_yaml)
+            policy = yaml.load(policy_yaml, Loader=YamlSafeLoader)
             if not isinstance(policy, dict):
                 result["policy_valid"] = False
                 result["policy_errors"].append("Policy YAML must be a mapping")
@@ -400,7 +609,7 @@ class ValidationService:
 
         # ---------- parse resource ----------
         try:
-            resource = yaml.safe_load(resource_yaml)
+            resource = yaml.load(resource_yaml, Loader=YamlSafeLoader)
             if not isinstance(resource, dict):
                 result["resource_valid"] = False
                 result["resource_errors"].append("Resource YAML must be a mapping")
@@ -739,13 +948,10 @@ class ValidationService:
         return images
 
 
-# Singleton instance
-_validation_service: Optional[ValidationService] = None
+# Shared instance, built at import so lookups need no None check
+VALIDATION_SERVICE = ValidationService()
 
 
 def get_validation_service() -> ValidationService:
-    """Get or create the validation service singleton"""
-    global _validation_service
-    if _validation_service is None:
-        _validation_service = ValidationService()
-    return _validation_service
+    """Get the validation service singleton"""
+    return VALIDATION_SERVICE